@@ -0,0 +1,85 @@
+import itertools
+from typing import Any, Dict, List
+
+from django.contrib.auth import get_user_model
+
+from games.models import Game, GameRole, UserGameProfile
+from lobbies.models import Lobby
+
+User = get_user_model()
+
+PASSWORD = "BenchPass123"
+
+_sequence = itertools.count(1)
+
+
+def make_user(**kwargs: Any) -> Any:
+    n = next(_sequence)
+    kwargs.setdefault("username", f"bench-user-{n}")
+    kwargs.setdefault("email", f"bench-user-{n}@example.com")
+    return User.objects.create_user(password=PASSWORD, **kwargs)
+
+
+def make_game(roles: int = 5, **kwargs: Any) -> Game:
+    n = next(_sequence)
+    kwargs.setdefault("title", f"Bench Game {n}")
+    kwargs.setdefault("slug", f"bench-game-{n}")
+    kwargs.setdefault("team_size", 5)
+    game = Game.objects.create(**kwargs)
+
+    GameRole.objects.bulk_create([
+        GameRole(game=game, name=f"Role {i}", icon_class="fa-solid fa-star", order=i)
+        for i in range(1, roles + 1)
+    ])
+    return game
+
+
+def make_profile(user: Any, game: Game, **kwargs: Any) -> UserGameProfile:
+    kwargs.setdefault("rank", "Gold")
+    kwargs.setdefault("main_role", game.roles.first())
+    return UserGameProfile.objects.create(user=user, game=game, **kwargs)
+
+
+def make_lobby(host: Any, game: Game, players: List[Any] = (), **kwargs: Any) -> Lobby:
+    """Creates a lobby and seats 'players' in the slots after the host."""
+    n = next(_sequence)
+    kwargs.setdefault("title", f"Bench Lobby {n}")
+    kwargs.setdefault("description", "Chill games, mic required.")
+    kwargs.setdefault("size", 10)
+    lobby = Lobby.objects.create(host=host, game=game, **kwargs)
+
+    slots = lobby.slots.exclude(order=1).order_by("order")
+    for slot, player in zip(slots, players):
+        slot.player = player
+        slot.save()
+
+    return lobby
+
+
+def seed(lobbies: int, players: int) -> Dict[str, Any]:
+    """
+    Seeds one game with 'lobbies' searching lobbies and 'players' profiles.
+
+    The first lobby is hosted by 'host' and filled with as many players as
+    fit, so detail and slot views render a fully occupied grid.
+    """
+    game = make_game()
+    host = make_user()
+    make_profile(host, game)
+
+    members = [make_user() for _ in range(players)]
+    for member in members:
+        make_profile(member, game)
+
+    lobby = make_lobby(host, game, players=members[:8], is_public=True)
+    for i in range(lobbies - 1):
+        make_lobby(members[i % len(members)], game, players=[host] if i % 2 else [])
+
+    return {
+        "game": game,
+        "host": host,
+        "member": members[0],
+        "outsider": make_user(),
+        "lobby": lobby,
+        "role": game.roles.first(),
+    }
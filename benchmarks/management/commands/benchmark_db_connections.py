@@ -0,0 +1,78 @@
+import time
+from typing import Dict, Optional
+
+from django.core.management.base import BaseCommand
+from django.core.signals import request_finished, request_started
+from django.db import connection
+from django.db.backends.signals import connection_created
+
+from lobbies.models import Slot
+
+
+class Command(BaseCommand):
+    help = 'Measures the per-request database connection overhead with and without persistent connections.'
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=200, help="Simulated requests per mode.")
+        parser.add_argument(
+            "--conn-max-age",
+            type=int,
+            default=600,
+            help="CONN_MAX_AGE of the persistent mode."
+        )
+
+    def handle(self, *args, **options):
+        original = {key: connection.settings_dict.get(key) for key in ("CONN_MAX_AGE", "CONN_HEALTH_CHECKS")}
+        self.stdout.write(f"Database: {connection.vendor} ({connection.settings_dict['NAME']})")
+
+        try:
+            closed = self.run(options["requests"], conn_max_age=0, health_checks=False)
+            persistent = self.run(options["requests"], conn_max_age=options["conn_max_age"], health_checks=True)
+        finally:
+            connection.close()
+            connection.settings_dict.update(original)
+
+        self.report("CONN_MAX_AGE=0", closed)
+        self.report(f"CONN_MAX_AGE={options['conn_max_age']} + health checks", persistent)
+
+        saved = closed["ms_per_request"] - persistent["ms_per_request"]
+        self.stdout.write(self.style.SUCCESS(f"Persistent connections save {saved:.2f} ms per request."))
+
+    def run(self, requests: int, conn_max_age: Optional[int], health_checks: bool) -> Dict[str, float]:
+        """
+        Replays the request lifecycle signals around a cheap slot lookup.
+
+        request_started/request_finished drive Django's own connection
+        handling (close_old_connections), so CONN_MAX_AGE and health checks
+        behave exactly as they do behind gunicorn.
+        """
+        connection.close()
+        connection.settings_dict["CONN_MAX_AGE"] = conn_max_age
+        connection.settings_dict["CONN_HEALTH_CHECKS"] = health_checks
+
+        connects = 0
+
+        def count_connect(**kwargs) -> None:
+            nonlocal connects
+            connects += 1
+
+        connection_created.connect(count_connect, dispatch_uid="benchmark_db_connections")
+        try:
+            started = time.perf_counter()
+            for _ in range(requests):
+                request_started.send(sender=self.__class__)
+                Slot.objects.filter(pk=0).exists()
+                request_finished.send(sender=self.__class__)
+            elapsed = time.perf_counter() - started
+        finally:
+            connection_created.disconnect(dispatch_uid="benchmark_db_connections")
+
+        return {
+            "connects": connects,
+            "ms_per_request": elapsed * 1000 / requests,
+        }
+
+    def report(self, label: str, result: Dict[str, float]) -> None:
+        self.stdout.write(
+            f"{label:<40} {result['ms_per_request']:8.3f} ms/request  {result['connects']:5d} connects"
+        )
@@ -0,0 +1,85 @@
+import random
+import time
+import uuid
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from benchmarks import factories
+from games.models import UserGameProfile
+from lobbies.models import Lobby
+from lobbies.services import create_lobby
+from matchmaking.matcher import match_waiting
+from matchmaking.services import enqueue
+
+User = get_user_model()
+
+
+class Rollback(Exception):
+    """Raised to discard the seeded benchmark data."""
+
+
+class Command(BaseCommand):
+    help = 'Measures matchmaking throughput: enqueues per second and matches per second.'
+
+    def add_arguments(self, parser):
+        parser.add_argument("--players", type=int, default=5000, help="Number of players to enqueue.")
+        parser.add_argument("--lobbies", type=int, default=1000, help="Number of open lobbies (5 slots each).")
+        parser.add_argument("--batch-size", type=int, default=500, help="Matcher batch size.")
+        parser.add_argument("--seed", type=int, default=42, help="Random seed for roles, so runs are comparable.")
+
+    def handle(self, *args, **options):
+        random.seed(options["seed"])
+
+        try:
+            with transaction.atomic():
+                profiles = self.seed(options["players"], options["lobbies"])
+                self.run(profiles, options["batch_size"])
+                raise Rollback
+        except Rollback:
+            self.stdout.write(self.style.WARNING("Seeded data rolled back."))
+
+    def seed(self, player_count: int, lobby_count: int) -> list:
+        self.stdout.write(f"Seeding {lobby_count} lobbies and {player_count} players...")
+        suffix = uuid.uuid4().hex[:8]
+
+        game = factories.make_game(title=f"Matchmaking {suffix}", slug=f"matchmaking-{suffix}")
+        roles = list(game.roles.all())
+
+        users = User.objects.bulk_create([
+            User(username=f"mm-{suffix}-{i}", email=f"mm-{suffix}-{i}@example.com")
+            for i in range(player_count + lobby_count)
+        ])
+        players, hosts = users[:player_count], users[player_count:]
+
+        profiles = UserGameProfile.objects.bulk_create([
+            UserGameProfile(user=user, game=game, rank="Gold", main_role=random.choice(roles + [None]))
+            for user in players
+        ])
+
+        for host in hosts:
+            create_lobby(
+                Lobby(title="Matchmaking", game=game, host=host, size=5),
+                needed_roles=random.sample(roles, random.randint(0, 4))
+            )
+
+        return profiles
+
+    def run(self, profiles: list, batch_size: int) -> None:
+        started = time.perf_counter()
+        for profile in profiles:
+            enqueue(profile)
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(
+            f"enqueue: {len(profiles)} players in {elapsed * 1000:.0f} ms "
+            f"({len(profiles) / elapsed:.0f}/s)"
+        ))
+
+        started = time.perf_counter()
+        matched = match_waiting(batch_size)
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(
+            f"match: {matched} of {len(profiles)} players placed in {elapsed * 1000:.0f} ms "
+            f"({matched / elapsed:.0f}/s, batch size {batch_size})"
+        ))
@@ -0,0 +1,177 @@
+import random
+import statistics
+import threading
+import time
+import uuid
+from typing import Any, Dict, List, Tuple
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import IntegrityError, OperationalError, connection, transaction
+
+from benchmarks import factories
+from lobbies.models import Lobby, Slot
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = 'Races concurrent joins against one lobby, with row locks and with conditional updates.'
+
+    strategies = ("locked", "optimistic")
+
+    def add_arguments(self, parser):
+        parser.add_argument("--players", type=int, default=50, help="Concurrent players racing for the slots.")
+        parser.add_argument(
+            "--strategy",
+            choices=self.strategies,
+            help="Only run one strategy (default: both)."
+        )
+        parser.add_argument("--seed", type=int, default=42, help="Random seed for slot picks, so runs are comparable.")
+
+    def handle(self, *args, **options):
+        self.stdout.write(f"Database: {connection.vendor}, {options['players']} concurrent joins on one lobby")
+
+        for strategy in [options["strategy"]] if options["strategy"] else self.strategies:
+            random.seed(options["seed"])
+            game, lobby, users = self.seed(options["players"])
+            try:
+                result = self.race(getattr(self, f"join_{strategy}"), lobby, users)
+            finally:
+                # Racing threads commit, so the data cannot be rolled back.
+                Lobby.objects.filter(pk=lobby.pk).delete()
+                User.objects.filter(pk__in=[user.pk for user in users]).delete()
+                game.delete()
+
+            self.report(strategy, result)
+
+    def seed(self, player_count: int) -> Tuple[Any, Lobby, List[Any]]:
+        suffix = uuid.uuid4().hex[:8]
+        game = factories.make_game(title=f"Joins {suffix}", slug=f"joins-{suffix}")
+
+        users = User.objects.bulk_create([
+            User(username=f"join-{suffix}-{i}", email=f"join-{suffix}-{i}@example.com")
+            for i in range(player_count + 1)
+        ])
+
+        # One seat per racer, so every join eventually succeeds and only contention varies.
+        lobby = Lobby.objects.create(title="Join storm", game=game, host=users[0], size=player_count + 1)
+        return game, lobby, users
+
+    def race(self, join: Any, lobby: Lobby, users: List[Any]) -> Dict[str, Any]:
+        """
+        Starts one thread per player at the same instant. Each thread tries
+        random open slots until it is seated, timing the contended statement
+        of every attempt.
+        """
+        players = users[1:]
+        slot_ids = list(lobby.slots.filter(player__isnull=True).values_list("id", flat=True))
+        barrier = threading.Barrier(len(players))
+        waits: List[float] = []
+        latencies: List[float] = []
+        conflicts = 0
+        claims = 0
+        errors = 0
+        lock = threading.Lock()
+
+        def run(player: Any) -> None:
+            nonlocal conflicts, claims, errors
+            choices = random.Random(player.pk).sample(slot_ids, len(slot_ids))
+            try:
+                barrier.wait()
+                started = time.perf_counter()
+                for slot_id in choices:
+                    joined, wait = join(slot_id, player)
+                    with lock:
+                        waits.append(wait)
+                        if joined:
+                            claims += 1
+                        else:
+                            conflicts += 1
+                    if joined:
+                        break
+                with lock:
+                    latencies.append(time.perf_counter() - started)
+            except OperationalError:
+                # Lock timeouts and deadlocks (e.g. SQLite's "database is locked").
+                with lock:
+                    errors += 1
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=run, args=(player,)) for player in players]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+
+        lobby.refresh_from_db()
+        return {
+            "elapsed": elapsed,
+            "seated": lobby.filled_slots - 1,
+            # Every claim reported as won must own a slot; an overwritten
+            # claim shows up as more claims than occupied slots.
+            "occupied": lobby.slots.filter(player__isnull=False).exclude(player=users[0]).count(),
+            "claims": claims,
+            "players": len(players),
+            "conflicts": conflicts,
+            "errors": errors,
+            "waits": waits,
+            "latencies": latencies,
+        }
+
+    def join_locked(self, slot_id: int, player: Any) -> Tuple[bool, float]:
+        """The previous join path: lock slot and lobby, check, then save."""
+        with transaction.atomic():
+            started = time.perf_counter()
+            slot = Slot.objects.select_for_update(of=("self", "lobby")).select_related("lobby").get(pk=slot_id)
+            wait = time.perf_counter() - started
+
+            can_join, _ = slot.lobby.can_join(player)
+            if not can_join or not slot.is_available:
+                return False, wait
+
+            slot.player = player
+            slot.save()
+            return True, wait
+
+    def join_optimistic(self, slot_id: int, player: Any) -> Tuple[bool, float]:
+        """The current join path: unlocked read, then one conditional UPDATE."""
+        slot = Slot.objects.select_related("lobby").get(pk=slot_id)
+        if not slot.is_available:
+            return False, 0.0
+
+        started = time.perf_counter()
+        try:
+            joined = slot.claim(player)
+        except IntegrityError:
+            joined = False
+        return joined, time.perf_counter() - started
+
+    def report(self, strategy: str, result: Dict[str, Any]) -> None:
+        waits = sorted(result["waits"]) or [0.0]
+        latencies = sorted(result["latencies"]) or [0.0]
+
+        def ms(values: List[float], quantile: float) -> float:
+            return values[min(len(values) - 1, int(len(values) * quantile))] * 1000
+
+        self.stdout.write(self.style.MIGRATE_HEADING(f"\n=== {strategy} ==="))
+        self.stdout.write(
+            f"seated {result['seated']} of {result['players']} in {result['elapsed'] * 1000:.0f} ms, "
+            f"{result['conflicts']} lost races, {result['errors']} lock errors"
+        )
+        self.stdout.write(
+            f"won claims {result['claims']}, occupied slots {result['occupied']}, "
+            f"slot counter {result['seated']}"
+        )
+        if not result["claims"] == result["occupied"] == result["seated"]:
+            self.stdout.write(self.style.ERROR("claims, occupied slots and the counter disagree"))
+        self.stdout.write(
+            f"join latency: p50 {ms(latencies, 0.5):.1f} ms, p95 {ms(latencies, 0.95):.1f} ms"
+        )
+        self.stdout.write(self.style.SUCCESS(
+            f"contended statement: total {sum(waits) * 1000:.1f} ms, "
+            f"mean {statistics.mean(waits) * 1000:.2f} ms, max {waits[-1] * 1000:.1f} ms"
+        ))
@@ -0,0 +1,78 @@
+import json
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.test.utils import override_settings
+
+from benchmarks.suite import (
+    BASELINE_PATH,
+    VOLUMES,
+    compare,
+    load_baseline,
+    make_baseline,
+    run_suite,
+    uncovered_urls,
+)
+
+
+class Rollback(Exception):
+    """Raised to discard the seeded benchmark data."""
+
+
+class Command(BaseCommand):
+    help = 'Hits every view against seeded data and checks query counts, time and size against a baseline.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--volume",
+            choices=list(VOLUMES),
+            action="append",
+            help="Data volume to run (repeatable). Defaults to all volumes."
+        )
+        parser.add_argument(
+            "--update-baseline",
+            action="store_true",
+            help=f"Write the measured numbers to {BASELINE_PATH.name} instead of checking them."
+        )
+
+    def handle(self, *args, **options):
+        missing = uncovered_urls()
+        if missing:
+            raise CommandError(f"URLs without a benchmark case: {', '.join(sorted(missing))}")
+
+        volumes = options["volume"] or list(VOLUMES)
+        results = {}
+
+        for volume in volumes:
+            try:
+                # The test client talks to the "testserver" host.
+                with override_settings(ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, "testserver"]):
+                    with transaction.atomic():
+                        results[volume] = run_suite(volume)
+                        raise Rollback
+            except Rollback:
+                pass
+
+            self.stdout.write(self.style.MIGRATE_HEADING(f"\n=== {volume} ==="))
+            for name, result in results[volume].items():
+                self.stdout.write(
+                    f"{name:<36} {result['status']:>4} {result['queries']:>4} queries "
+                    f"{result['ms']:>9.2f} ms {result['bytes']:>8} bytes"
+                )
+
+        if options["update_baseline"]:
+            baseline = load_baseline() if BASELINE_PATH.exists() else {}
+            baseline.update(make_baseline(results))
+            with open(BASELINE_PATH, "w") as baseline_file:
+                json.dump(baseline, baseline_file, indent=2, sort_keys=True)
+                baseline_file.write("\n")
+            self.stdout.write(self.style.SUCCESS(f"\nBaseline written to {BASELINE_PATH}"))
+            return
+
+        baseline = load_baseline()
+        failures = [line for volume in volumes for line in compare(volume, results[volume], baseline)]
+        if failures:
+            raise CommandError("Benchmark thresholds exceeded:\n" + "\n".join(failures))
+
+        self.stdout.write(self.style.SUCCESS("\nAll views within baseline."))
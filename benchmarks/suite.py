@@ -0,0 +1,268 @@
+import json
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from django.db import connection, transaction
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import URLPattern, URLResolver, get_resolver, reverse
+
+from benchmarks import factories
+from games.registry import game_registry
+from lobbies.caching import bump_list_version
+
+BASELINE_PATH = Path(__file__).resolve().parent / "baseline.json"
+
+VOLUMES = {
+    "small": {"lobbies": 3, "players": 9},
+    "large": {"lobbies": 30, "players": 30},
+}
+
+# Streaming endpoints never finish a response, so there is nothing to measure.
+EXCLUDED_URLS = {
+    "lobbies:lobby-events",
+}
+
+
+@dataclass(frozen=True)
+class Case:
+    """A single request issued against a seeded scenario."""
+    name: str
+    url_name: str
+    viewer: Optional[str] = None
+    method: str = "get"
+    url_kwargs: Callable[[Dict[str, Any]], Dict[str, Any]] = lambda s: {}
+    data: Callable[[Dict[str, Any]], Dict[str, Any]] = lambda s: {}
+    headers: Dict[str, str] = field(default_factory=dict)
+
+
+def _lobby(s: Dict[str, Any]) -> Dict[str, Any]:
+    return {"game_slug": s["game"].slug, "invite_link": s["lobby"].invite_link}
+
+
+def _slot(s: Dict[str, Any], slot_key: str) -> Dict[str, Any]:
+    return {**_lobby(s), "slot_id": s[slot_key].id}
+
+
+HTMX = {"HTTP_HX_REQUEST": "true"}
+
+CASES = [
+    Case("games:index", "games:index"),
+    Case("games:get-game-roles", "games:get-game-roles", data=lambda s: {"game": s["game"].id}),
+    Case("games:my-profiles", "games:my-profiles", viewer="host"),
+    Case("games:profile-create", "games:profile-create", viewer="host"),
+    Case(
+        "games:profile-create [post]", "games:profile-create", viewer="host", method="post",
+        data=lambda s: {"game": s["spare_game"].id, "rank": "Gold"}
+    ),
+    Case("games:profile-edit", "games:profile-edit", viewer="host", url_kwargs=lambda s: {"game_slug": s["game"].slug}),
+    Case(
+        "games:profile-edit [post]", "games:profile-edit", viewer="host", method="post",
+        url_kwargs=lambda s: {"game_slug": s["game"].slug},
+        data=lambda s: {"rank": "Platinum", "main_role": s["role"].id}
+    ),
+    Case(
+        "games:profile-delete", "games:profile-delete", viewer="host",
+        url_kwargs=lambda s: {"game_slug": s["game"].slug}
+    ),
+    Case(
+        "games:profile-delete [post]", "games:profile-delete", viewer="host", method="post",
+        url_kwargs=lambda s: {"game_slug": s["game"].slug}
+    ),
+    Case("users:sign-up", "users:sign-up"),
+    Case(
+        "users:sign-up [post]", "users:sign-up", method="post",
+        data=lambda s: {
+            "username": "bench-newcomer",
+            "email": "bench-newcomer@example.com",
+            "password1": factories.PASSWORD,
+            "password2": factories.PASSWORD,
+        }
+    ),
+    Case("settings-general", "settings-general", viewer="host"),
+    Case("lobbies:lobby-list", "lobbies:lobby-list", url_kwargs=lambda s: {"game_slug": s["game"].slug}),
+    Case(
+        "lobbies:lobby-list [member]", "lobbies:lobby-list", viewer="host",
+        url_kwargs=lambda s: {"game_slug": s["game"].slug}
+    ),
+    Case(
+        "lobbies:lobby-list [role]", "lobbies:lobby-list",
+        url_kwargs=lambda s: {"game_slug": s["game"].slug}, data=lambda s: {"role": s["role"].id}
+    ),
+    Case(
+        "lobbies:lobby-list [available]", "lobbies:lobby-list",
+        url_kwargs=lambda s: {"game_slug": s["game"].slug}, data=lambda s: {"available_only": "on"}
+    ),
+    Case(
+        "lobbies:lobby-list [search]", "lobbies:lobby-list",
+        url_kwargs=lambda s: {"game_slug": s["game"].slug}, data=lambda s: {"q": "bench"}
+    ),
+    Case("lobbies:api-lobby-list", "lobbies:api-lobby-list", url_kwargs=lambda s: {"game_slug": s["game"].slug}),
+    Case("lobbies:api-lobby-detail", "lobbies:api-lobby-detail", url_kwargs=_lobby),
+    Case(
+        "lobbies:lobby-create", "lobbies:lobby-create", viewer="host",
+        url_kwargs=lambda s: {"game_slug": s["game"].slug}
+    ),
+    Case(
+        "lobbies:lobby-create [post]", "lobbies:lobby-create", viewer="host", method="post",
+        url_kwargs=lambda s: {"game_slug": s["game"].slug},
+        data=lambda s: {"title": "Bench", "size": 5, "is_public": "on", "needed_roles": [s["role"].id]}
+    ),
+    Case("lobbies:lobby-detail", "lobbies:lobby-detail", url_kwargs=_lobby),
+    Case("lobbies:lobby-detail [member]", "lobbies:lobby-detail", viewer="member", url_kwargs=_lobby),
+    Case("lobbies:lobby-delete", "lobbies:lobby-delete", viewer="host", url_kwargs=_lobby),
+    Case("lobbies:lobby-delete [post]", "lobbies:lobby-delete", viewer="host", method="post", url_kwargs=_lobby),
+    Case(
+        "lobbies:lobby-join", "lobbies:lobby-join", viewer="outsider", method="post",
+        url_kwargs=lambda s: _slot(s, "open_slot")
+    ),
+    Case(
+        "lobbies:lobby-join [htmx]", "lobbies:lobby-join", viewer="outsider", method="post",
+        url_kwargs=lambda s: _slot(s, "open_slot"), headers=HTMX
+    ),
+    Case(
+        "lobbies:lobby-leave", "lobbies:lobby-leave", viewer="member", method="post",
+        url_kwargs=lambda s: _slot(s, "member_slot")
+    ),
+    Case(
+        "lobbies:lobby-kick", "lobbies:lobby-kick", viewer="host", method="post",
+        url_kwargs=lambda s: _slot(s, "member_slot")
+    ),
+    Case(
+        "lobbies:lobby-toggle-privacy", "lobbies:lobby-toggle-privacy", viewer="host", method="post",
+        url_kwargs=_lobby, headers=HTMX
+    ),
+    Case(
+        "matchmaking:queue-status", "matchmaking:queue-status", viewer="outsider",
+        url_kwargs=lambda s: {"game_slug": s["game"].slug}, headers=HTMX
+    ),
+    Case(
+        "matchmaking:queue-join", "matchmaking:queue-join", viewer="outsider", method="post",
+        url_kwargs=lambda s: {"game_slug": s["game"].slug}, headers=HTMX
+    ),
+    Case(
+        "matchmaking:queue-leave", "matchmaking:queue-leave", viewer="outsider", method="post",
+        url_kwargs=lambda s: {"game_slug": s["game"].slug}, headers=HTMX
+    ),
+]
+
+
+def build_scenario(volume: str) -> Dict[str, Any]:
+    scenario = factories.seed(**VOLUMES[volume])
+    scenario["spare_game"] = factories.make_game()
+    scenario["open_slot"] = scenario["lobby"].slots.filter(player__isnull=True).first()
+    scenario["member_slot"] = scenario["lobby"].slots.get(player=scenario["member"])
+    factories.make_profile(scenario["outsider"], scenario["game"])
+    return scenario
+
+
+def run_case(case: Case, scenario: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Issues the request of a case and measures it.
+
+    Every case runs in a rolled back transaction so mutating requests leave
+    the scenario untouched for the next case. The lobby list cache version
+    is bumped first, so every case is measured cold, while the game
+    registry is warmed as it is in a running server process.
+    """
+    # Debug toolbar only renders for INTERNAL_IPS; keep it out of the numbers.
+    client = Client(REMOTE_ADDR="10.0.0.1")
+
+    with transaction.atomic():
+        bump_list_version(scenario["game"].id)
+        game_registry.warm()
+        if case.viewer:
+            client.force_login(scenario[case.viewer])
+
+        url = reverse(case.url_name, kwargs=case.url_kwargs(scenario))
+        request = getattr(client, case.method)
+
+        with CaptureQueriesContext(connection) as queries:
+            started = time.perf_counter()
+            response = request(url, case.data(scenario), **case.headers)
+            elapsed = (time.perf_counter() - started) * 1000
+
+        transaction.set_rollback(True)
+
+    return {
+        "status": response.status_code,
+        "queries": len(queries),
+        "ms": round(elapsed, 2),
+        "bytes": len(response.content),
+    }
+
+
+def run_suite(volume: str) -> Dict[str, Dict[str, Any]]:
+    scenario = build_scenario(volume)
+    return {case.name: run_case(case, scenario) for case in CASES}
+
+
+def load_baseline(path: Path = BASELINE_PATH) -> Dict[str, Any]:
+    with open(path) as baseline_file:
+        return json.load(baseline_file)
+
+
+def make_baseline(results: Dict[str, Dict[str, Dict[str, Any]]]) -> Dict[str, Any]:
+    """
+    Turns measured results into thresholds.
+
+    Query counts and status codes must match exactly; time and size get
+    headroom so only real regressions fail.
+    """
+    return {
+        volume: {
+            name: {
+                "status": result["status"],
+                "queries": result["queries"],
+                "max_ms": max(250, round(result["ms"] * 5)),
+                "max_bytes": round(result["bytes"] * 1.25) + 512,
+            }
+            for name, result in cases.items()
+        }
+        for volume, cases in results.items()
+    }
+
+
+def compare(volume: str, results: Dict[str, Dict[str, Any]], baseline: Dict[str, Any]) -> List[str]:
+    """Returns a human readable line for every threshold that was exceeded."""
+    failures = []
+    thresholds = baseline.get(volume, {})
+
+    for name, result in results.items():
+        expected = thresholds.get(name)
+        if expected is None:
+            failures.append(f"{volume}/{name}: no baseline recorded")
+            continue
+
+        if result["status"] != expected["status"]:
+            failures.append(f"{volume}/{name}: status {result['status']} != {expected['status']}")
+        if result["queries"] != expected["queries"]:
+            failures.append(f"{volume}/{name}: {result['queries']} queries != {expected['queries']}")
+        if result["ms"] > expected["max_ms"]:
+            failures.append(f"{volume}/{name}: {result['ms']} ms > {expected['max_ms']} ms")
+        if result["bytes"] > expected["max_bytes"]:
+            failures.append(f"{volume}/{name}: {result['bytes']} bytes > {expected['max_bytes']} bytes")
+
+    return failures
+
+
+def _url_names(patterns: list, namespace: Optional[str] = None) -> Set[str]:
+    names = set()
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            if pattern.namespace in ("games", "lobbies", "matchmaking", "users"):
+                names |= _url_names(pattern.url_patterns, pattern.namespace)
+        elif isinstance(pattern, URLPattern) and pattern.name:
+            if namespace:
+                names.add(f"{namespace}:{pattern.name}")
+            elif pattern.name == "settings-general":
+                names.add(pattern.name)
+    return names
+
+
+def uncovered_urls() -> Set[str]:
+    """URL names of the project apps that no case (or exclusion) accounts for."""
+    covered = {case.url_name for case in CASES} | EXCLUDED_URLS
+    return _url_names(get_resolver().url_patterns) - covered
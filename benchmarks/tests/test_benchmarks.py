@@ -0,0 +1,77 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import transaction
+from django.test import TestCase, TransactionTestCase
+
+from benchmarks.suite import VOLUMES, compare, load_baseline, run_suite, uncovered_urls
+from lobbies.models import Lobby
+
+
+class ViewBenchmarkTests(TestCase):
+    """
+    Regression gate for query counts, latency and response size of every view.
+
+    Query counts must stay identical across data volumes; a growing count
+    on the larger volume means a template or view reintroduced an N+1.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.baseline = load_baseline()
+
+    def test_every_url_has_a_case(self):
+        self.assertEqual(uncovered_urls(), set())
+
+    def test_views_within_baseline(self):
+        results = {}
+        for volume in VOLUMES:
+            with self.subTest(volume=volume):
+                with transaction.atomic():
+                    results[volume] = run_suite(volume)
+                    transaction.set_rollback(True)
+                failures = compare(volume, results[volume], self.baseline)
+                self.assertEqual(failures, [], "\n".join(failures))
+
+        small, large = results["small"], results["large"]
+        for name in small:
+            with self.subTest(case=name):
+                self.assertEqual(large[name]["queries"], small[name]["queries"])
+
+    def test_matchmaking_benchmark_runs(self):
+        """Verifies the throughput benchmark seeds, reports and places every fitting player."""
+        out = StringIO()
+        call_command("benchmark_matchmaking", "--players", "20", "--lobbies", "4", stdout=out)
+
+        self.assertIn("enqueue: 20 players", out.getvalue())
+        self.assertRegex(out.getvalue(), r"match: \d+ of 20 players placed")
+
+
+class ConnectionBenchmarkTests(TransactionTestCase):
+    """
+    Runs outside a test transaction: these benchmarks close connections the
+    way a real request cycle would, or race from several threads.
+    """
+
+    def test_connection_benchmark_runs(self):
+        """Verifies both connection modes are measured and compared."""
+        out = StringIO()
+        call_command("benchmark_db_connections", "--requests", "5", stdout=out)
+
+        self.assertIn("CONN_MAX_AGE=0", out.getvalue())
+        self.assertIn("CONN_MAX_AGE=600 + health checks", out.getvalue())
+        self.assertIn("ms per request", out.getvalue())
+
+    def test_slot_join_benchmark_runs(self):
+        """
+        Verifies both join strategies seed, seat and clean up.
+
+        A single racer is used: the in-memory test database cannot take
+        concurrent writers.
+        """
+        out = StringIO()
+        call_command("benchmark_slot_joins", "--players", "1", stdout=out)
+
+        self.assertEqual(out.getvalue().count("seated 1 of 1"), 2)
+        self.assertFalse(Lobby.objects.exists())
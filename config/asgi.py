@@ -14,3 +14,8 @@ from django.core.asgi import get_asgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
 
 application = get_asgi_application()
+
+# Load the game catalog before the first request instead of during it.
+from games.registry import game_registry  # noqa: E402
+
+game_registry.warm()
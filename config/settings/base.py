@@ -1,4 +1,5 @@
 import os
+import tempfile
 from pathlib import Path
 
 import cloudinary
@@ -32,15 +33,19 @@ INSTALLED_APPS = [
     'users',
     'games',
     'lobbies',
+    'matchmaking',
+    'benchmarks',
+    'metrics',
 ]
 
 MIDDLEWARE = [
+    'metrics.middleware.RequestMetricsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
-    'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'users.middleware.CachedAuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -49,7 +54,7 @@ ROOT_URLCONF = 'config.urls'
 
 TEMPLATES = [
     {
-        'BACKEND': 'django.template.backends.django.DjangoTemplates',
+        'BACKEND': 'metrics.backends.TimedDjangoTemplates',
         'DIRS': [BASE_DIR / 'templates']
         ,
         'APP_DIRS': True,
@@ -109,6 +114,78 @@ EMAIL_BACKEND = "django.core.mail.backends.console.EmailBackend"
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
+# Cache: a shared Redis-compatible server when CACHE_URL is set (e.g. redis://host:6379/0),
+# otherwise an in-process stand-in for tests and local development
+CACHE_URL = os.getenv('CACHE_URL')
+
+if CACHE_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': CACHE_URL,
+            'KEY_PREFIX': os.getenv('CACHE_KEY_PREFIX', 'lfg'),
+            'TIMEOUT': 300,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
+# Sessions are read from the cache and written through to the database
+SESSION_ENGINE = 'django.contrib.sessions.backends.cached_db'
+SESSION_CACHE_ALIAS = 'default'
+
+# Users loaded for request.user (see users.middleware.CachedAuthenticationMiddleware)
+USER_CACHE_ALIAS = 'default'
+USER_CACHE_TIMEOUT = 300
+
+# Threads running slot action transactions (join/leave/kick) under ASGI; 0 runs
+# them in Django's default thread-sensitive mode, which tests rely on
+SLOT_ACTION_WORKERS = int(os.getenv('SLOT_ACTION_WORKERS', 0))
+
+# Avatars are spooled to AVATAR_SPOOL_DIR and pushed to AVATAR_STORAGE by a pool
+# of AVATAR_UPLOAD_WORKERS threads per process (see users.avatars); with 0 they
+# wait for 'process_avatar_uploads'. Claims older than the timeout (seconds) are
+# retried by the command, up to AVATAR_UPLOAD_MAX_ATTEMPTS uploads per avatar.
+AVATAR_STORAGE = os.getenv('AVATAR_STORAGE', 'users.avatars.CloudinaryAvatarStorage')
+AVATAR_SPOOL_DIR = Path(os.getenv('AVATAR_SPOOL_DIR', Path(tempfile.gettempdir()) / 'avatar-spool'))
+AVATAR_UPLOAD_WORKERS = int(os.getenv('AVATAR_UPLOAD_WORKERS', 2))
+AVATAR_UPLOAD_CLAIM_TIMEOUT = 300
+AVATAR_UPLOAD_MAX_ATTEMPTS = 5
+
+# Lobby activity events are buffered per process and written with one bulk
+# INSERT per batch (see lobbies.activity); 1 writes them as they happen. A
+# partial batch is written once it is older than the flush interval (seconds).
+LOBBY_EVENT_BATCH_SIZE = int(os.getenv('LOBBY_EVENT_BATCH_SIZE', 1))
+LOBBY_EVENT_FLUSH_INTERVAL = float(os.getenv('LOBBY_EVENT_FLUSH_INTERVAL', 5))
+
+# Version key of the in-process game catalog (see games.registry)
+GAME_REGISTRY_CACHE_ALIAS = 'default'
+
+# HTMX role options: browsers reuse them for max-age seconds, then revalidate
+# with their ETag; rendered options are kept in the registry cache meanwhile
+GAME_ROLE_OPTIONS_MAX_AGE = 300
+GAME_ROLE_OPTIONS_CACHE_TIMEOUT = 60 * 60 * 24
+
+# Rendered lobby list fragments served to anonymous visitors
+LOBBY_LIST_CACHE_ALIAS = 'default'
+LOBBY_LIST_CACHE_TIMEOUT = 60
+
+# Live lobby updates (Server-Sent Events). The in-process broker only reaches
+# streams of the same process; RedisBroker relays events between processes
+# over LOBBY_EVENTS_REDIS_URL (see lobbies.events)
+LOBBY_EVENTS_BROKER = 'lobbies.events.InProcessBroker'
+LOBBY_EVENTS_REDIS_URL = CACHE_URL
+LOBBY_EVENTS_CHANNEL_PREFIX = os.getenv('CACHE_KEY_PREFIX', 'lfg') + ':events:'
+LOBBY_EVENTS_RENDER_TIMEOUT = 60
+
+# Request metrics (Server-Timing header, /metrics/ histograms); 0 disables sampling
+REQUEST_METRICS_SAMPLE_RATE = float(os.getenv('REQUEST_METRICS_SAMPLE_RATE', 0))
+REQUEST_METRICS_TOKEN = os.getenv('REQUEST_METRICS_TOKEN', '')
+
 LOGIN_REDIRECT_URL = '/'
 LOGOUT_REDIRECT_URL = '/'
 
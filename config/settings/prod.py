@@ -1,3 +1,6 @@
+import dj_database_url
+from django.core.exceptions import ImproperlyConfigured
+
 from .base import *
 
 DEBUG = False
@@ -6,21 +9,65 @@ RENDER_DOMAIN = os.environ["RENDER_DOMAIN"]
 
 ALLOWED_HOSTS = ['127.0.0.1', 'localhost', RENDER_DOMAIN]
 
+# Sessions, request.user (see users.caching) and the game registry version are
+# cached; the in-process fallback of base.py would let every worker keep its
+# own, stale copy, so production needs the shared cache.
+if not CACHE_URL:
+    raise ImproperlyConfigured("CACHE_URL must point to a shared cache server in production.")
+
 # Database
 
-DATABASES = {
- 'default': {
-   'ENGINE': 'django.db.backends.postgresql',
-   'NAME': os.getenv('POSTGRES_DB'),
-   'USER': os.getenv('POSTGRES_USER'),
-   'PASSWORD': os.getenv('POSTGRES_PASSWORD'),
-   'HOST': os.getenv('POSTGRES_HOST'),
-   'PORT': os.getenv('POSTGRES_DB_PORT', 5432),
-   'OPTIONS': {
-     'sslmode': 'require',
-   },
- }
-}
+# Seconds a connection is kept open between requests (0 closes it after every
+# request, None keeps it forever). Production is served through ASGI, where
+# sync code runs on threads that do not outlive the request, so a persistent
+# connection would be left open by every such thread; connections are closed
+# per request and a pooler keeps them cheap. Set e.g. 600 when serving WSGI.
+DATABASE_CONN_MAX_AGE = int(os.getenv('DATABASE_CONN_MAX_AGE') or 0)
+
+# Set to "transaction" when connecting through a transaction-pooling proxy
+# (PgBouncer, Supavisor, ...): consecutive queries of one cursor may run on
+# different server connections, so server-side cursors must be disabled.
+DATABASE_POOLER = os.getenv('DATABASE_POOLER', '')
+
+DATABASE_URL = os.getenv('DATABASE_URL')
+
+if DATABASE_URL:
+    DATABASES = {
+        'default': dj_database_url.parse(DATABASE_URL, ssl_require=True),
+    }
+else:
+    DATABASES = {
+     'default': {
+       'ENGINE': 'django.db.backends.postgresql',
+       'NAME': os.getenv('POSTGRES_DB'),
+       'USER': os.getenv('POSTGRES_USER'),
+       'PASSWORD': os.getenv('POSTGRES_PASSWORD'),
+       'HOST': os.getenv('POSTGRES_HOST'),
+       'PORT': os.getenv('POSTGRES_DB_PORT', 5432),
+       'OPTIONS': {
+         'sslmode': 'require',
+       },
+     }
+    }
+
+DATABASES['default'].update({
+    'CONN_MAX_AGE': DATABASE_CONN_MAX_AGE,
+    # Persistent connections may have been dropped by the server or a proxy;
+    # check them once per request before reuse.
+    'CONN_HEALTH_CHECKS': DATABASE_CONN_MAX_AGE != 0,
+    'DISABLE_SERVER_SIDE_CURSORS': DATABASE_POOLER == 'transaction',
+})
+
+# Every Uvicorn worker serves event streams and 'run_matchmaker' publishes from
+# its own process, so slot changes are relayed through Redis.
+LOBBY_EVENTS_BROKER = 'lobbies.events.RedisBroker'
+
+# Slot actions run on a bounded pool per process (see lobbies.executors), which
+# also caps their database connections at this many per process.
+SLOT_ACTION_WORKERS = int(os.getenv('SLOT_ACTION_WORKERS', 8))
+
+# Up to this many lobby events per process are lost if a worker is killed.
+LOBBY_EVENT_BATCH_SIZE = int(os.getenv('LOBBY_EVENT_BATCH_SIZE', 200))
 
 SECURE_SSL_REDIRECT = True
 SESSION_COOKIE_SECURE = True
@@ -12,6 +12,8 @@ urlpatterns = [
     path("settings/general/", GeneralSettingsView.as_view(), name="settings-general"),
     path("", include("games.urls", namespace="games")),
     path("lobbies/", include("lobbies.urls", namespace="lobbies")),
+    path("matchmaking/", include("matchmaking.urls", namespace="matchmaking")),
+    path("metrics/", include("metrics.urls", namespace="metrics")),
 ]
 
 if settings.DEBUG:
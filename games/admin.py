@@ -1,6 +1,7 @@
 from django.contrib import admin
 
 from games.models import (
+    GameRank,
     GameRole,
     Game,
     UserGameProfile
@@ -17,6 +18,19 @@ class GameRoleInLine(admin.TabularInline):
     ordering = ["order"]
 
 
+class GameRankInLine(admin.TabularInline):
+    """
+    Inline admin interface for the rank ladder of a Game.
+
+    Run 'backfill_rank_values' after changing a ladder so existing
+    profiles pick up the new values.
+    """
+    model = GameRank
+    extra = 1
+    fields = ["value", "name"]
+    ordering = ["value"]
+
+
 @admin.register(Game)
 class GameAdmin(admin.ModelAdmin):
     """
@@ -29,14 +43,14 @@ class GameAdmin(admin.ModelAdmin):
     search_fields = ["title", "slug"]
     prepopulated_fields = {"slug": ["title"]}
 
-    inlines = [GameRoleInLine]
+    inlines = [GameRoleInLine, GameRankInLine]
 
     fieldsets = (
         ("Basic Information", {
             "fields": ("title", "slug", "icon")
         }),
         ("Settings", {
-            "fields": ("team_size",)
+            "fields": ("team_size", "lobby_ttl")
         }),
     )
 
@@ -69,7 +83,7 @@ class UserGameProfileAdmin(admin.ModelAdmin):
     Features autocomplete fields for related lookups to handle large datasets
     and optimized database queries.
     """
-    list_display = ["user", "game", "rank", "main_role", "updated_at"]
+    list_display = ["user", "game", "rank", "rank_value", "main_role", "updated_at"]
     list_filter = ["game", "created_at"]
     search_fields = ["user__username", "user__email", "game__title", "rank"]
     list_select_related = ["user", "game", "main_role"]
@@ -80,7 +94,7 @@ class UserGameProfileAdmin(admin.ModelAdmin):
             "fields": ("user", "game")
         }),
         ("Game Data", {
-            "fields": ("rank", "main_role")
+            "fields": ("rank", "rank_value", "main_role")
         }),
         ("Timestamps", {
             "fields": ("created_at", "updated_at"),
@@ -88,4 +102,4 @@ class UserGameProfileAdmin(admin.ModelAdmin):
         }),
     )
 
-    readonly_fields = ["created_at", "updated_at"]
+    readonly_fields = ["rank_value", "created_at", "updated_at"]
@@ -3,3 +3,16 @@ from django.apps import AppConfig
 
 class GamesConfig(AppConfig):
     name = 'games'
+
+    def ready(self):
+        from django.db.models.signals import post_delete, post_save
+
+        from games.models import Game, GameRank, GameRole
+        from games.registry import invalidate_registry
+
+        for model in (Game, GameRole, GameRank):
+            name = model.__name__.lower()
+            post_save.connect(invalidate_registry, sender=model, dispatch_uid=f"games.invalidate_registry_{name}_save")
+            post_delete.connect(
+                invalidate_registry, sender=model, dispatch_uid=f"games.invalidate_registry_{name}_delete"
+            )
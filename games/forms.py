@@ -8,6 +8,7 @@ from games.models import (
     Game,
     GameRole
 )
+from games.registry import game_registry
 
 
 class UserGameProfileForm(forms.ModelForm):
@@ -50,6 +51,10 @@ class UserGameProfileForm(forms.ModelForm):
             "hx-trigger": "change"
         })
 
+        # Choices are built from the game registry when the form is rendered;
+        # the querysets are only hit to validate a submitted form.
+        existing_game_ids = None
+
         if user and not self.instance.pk:
             existing_game_ids = user.game_profiles.values_list("game_id", flat=True)
             self.fields["game"].queryset = Game.objects.exclude(id__in=existing_game_ids)
@@ -57,15 +62,30 @@ class UserGameProfileForm(forms.ModelForm):
             self.fields["game"].disabled = True
 
         self.fields["game"].empty_label = "Select a game..."
+        self.fields["game"].choices = lambda: self._game_choices(existing_game_ids)
 
+        roles = []
         self.fields["main_role"].queryset = GameRole.objects.none()
 
         if "game" in self.data:
             try:
                 game_id = int(self.data.get("game"))
                 self.fields["main_role"].queryset = GameRole.objects.filter(game_id=game_id)
+                roles = game_registry.roles(game_id)
             except (ValueError, TypeError):
                 pass
 
         elif self.instance.pk:
-            self.fields["main_role"].queryset = self.instance.game.roles.all()
+            self.fields["main_role"].queryset = GameRole.objects.filter(game_id=self.instance.game_id)
+            roles = game_registry.roles(self.instance.game_id)
+
+        self.fields["main_role"].choices = [("", self.fields["main_role"].empty_label)] + [
+            (role.id, role.name) for role in roles
+        ]
+
+    def _game_choices(self, existing_game_ids: Any) -> list:
+        """Lists the registry games, leaving out those the user has a profile for."""
+        excluded = set(existing_game_ids) if existing_game_ids is not None else set()
+        return [("", self.fields["game"].empty_label)] + [
+            (game.id, game.title) for game in game_registry.games() if game.id not in excluded
+        ]
@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand
+from django.db.models import OuterRef, Subquery
+from django.db.models.functions import Trim
+
+from games.models import GameRank, UserGameProfile
+
+
+class Command(BaseCommand):
+    help = 'Recomputes UserGameProfile.rank_value from the rank ladder of each game.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--game",
+            help="Only backfill profiles of the game with this slug."
+        )
+
+    def handle(self, *args, **options):
+        ladder_value = GameRank.objects.filter(
+            game_id=OuterRef("game_id"),
+            name__iexact=Trim(OuterRef("rank"))
+        ).values("value")[:1]
+
+        profiles = UserGameProfile.objects.all()
+        if options["game"]:
+            profiles = profiles.filter(game__slug=options["game"])
+
+        updated = profiles.update(rank_value=Subquery(ladder_value))
+        unranked = profiles.filter(rank_value__isnull=True).exclude(rank="").count()
+
+        self.stdout.write(self.style.SUCCESS(f"Backfilled rank values of {updated} profiles."))
+        if unranked:
+            self.stdout.write(self.style.WARNING(f"{unranked} profiles have a rank missing from their game's ladder."))
@@ -2,8 +2,9 @@ import logging
 from django.core.management.base import BaseCommand
 from django.contrib.auth import get_user_model
 from django.db import transaction
-from games.models import Game, GameRole, UserGameProfile
+from games.models import Game, GameRank, GameRole, UserGameProfile
 from lobbies.models import Lobby
+from lobbies.services import create_lobby
 
 User = get_user_model()
 
@@ -61,6 +62,16 @@ class Command(BaseCommand):
             {"game_pk": 5, "name": "Support", "icon": "fa-solid fa-hand-holding-heart", "order": 5},
         ]
 
+        ranks_data = {
+            1: ["Herald", "Guardian", "Crusader", "Archon", "Legend", "Ancient", "Divine", "Immortal"],
+            2: ["Silver 1", "Silver Elite", "Gold Nova 1", "Gold Nova Master", "Master Guardian 1",
+                "Distinguished Master Guardian", "Legendary Eagle", "Supreme Master First Class", "Global Elite"],
+            3: ["Iron", "Bronze", "Silver", "Gold", "Platinum", "Diamond", "Ascendant", "Immortal", "Radiant"],
+            4: ["Bronze", "Silver", "Gold", "Platinum", "Diamond", "Master", "Grandmaster", "Champion"],
+            5: ["Iron", "Bronze", "Silver", "Gold", "Platinum", "Emerald", "Diamond", "Master", "Grandmaster",
+                "Challenger"],
+        }
+
         # 2. Data creation
         try:
             with transaction.atomic():
@@ -99,6 +110,17 @@ class Command(BaseCommand):
                         if created:
                             self.stdout.write(f" - Added role: {role.name}")
 
+                # --- B2. Create Rank Ladders ---
+                for game_pk, rank_names in ranks_data.items():
+                    game_instance = mapped_games.get(game_pk)
+                    if game_instance:
+                        for value, name in enumerate(rank_names, start=1):
+                            GameRank.objects.get_or_create(
+                                game=game_instance,
+                                name=name,
+                                defaults={'value': value}
+                            )
+
                 # --- C. Create Users ---
                 # Admin
                 admin, created = User.objects.get_or_create(
@@ -140,13 +162,15 @@ class Command(BaseCommand):
                 cs2_game = mapped_games.get(2)  # CS2
                 if cs2_game:
                     if not Lobby.objects.filter(title="Test Lobby for Review").exists():
-                        Lobby.objects.create(
-                            title="Test Lobby for Review",
-                            description="Auto-generated lobby to show functionality.",
-                            game=cs2_game,
-                            host=player,  # player1 is host
-                            size=5,
-                            is_public=True
+                        create_lobby(
+                            Lobby(
+                                title="Test Lobby for Review",
+                                description="Auto-generated lobby to show functionality.",
+                                game=cs2_game,
+                                host=player,  # player1 is host
+                                size=5,
+                                is_public=True
+                            )
                         )
                         self.stdout.write(self.style.SUCCESS("Demo Lobby created!"))
 
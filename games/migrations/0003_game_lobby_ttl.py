@@ -0,0 +1,19 @@
+# Generated by Django 4.2.27 on 2026-10-17 19:55
+
+import datetime
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('games', '0002_alter_game_options_alter_game_icon'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='game',
+            name='lobby_ttl',
+            field=models.DurationField(default=datetime.timedelta(seconds=7200), help_text="Searching lobbies without slot activity for this long are cancelled by 'reap_lobbies'."),
+        ),
+    ]
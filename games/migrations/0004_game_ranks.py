@@ -0,0 +1,40 @@
+# Generated by Django 4.2.27 on 2026-10-17 20:09
+
+import django.core.validators
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('games', '0003_game_lobby_ttl'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='usergameprofile',
+            name='rank_value',
+            field=models.PositiveSmallIntegerField(blank=True, editable=False, help_text="Ladder value of 'rank', set on save and by 'backfill_rank_values'.", null=True),
+        ),
+        migrations.CreateModel(
+            name='GameRank',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=50)),
+                ('value', models.PositiveSmallIntegerField(help_text='Position on the ladder; higher means more skilled.', validators=[django.core.validators.MinValueValidator(1)])),
+                ('game', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='ranks', to='games.game')),
+            ],
+            options={
+                'ordering': ['game', 'value'],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='gamerank',
+            constraint=models.UniqueConstraint(fields=('game', 'name'), name='unique_game_ranks'),
+        ),
+        migrations.AddConstraint(
+            model_name='gamerank',
+            constraint=models.UniqueConstraint(fields=('game', 'value'), name='unique_game_rank_values'),
+        ),
+    ]
@@ -1,3 +1,6 @@
+from datetime import timedelta
+from typing import Optional
+
 from cloudinary.models import CloudinaryField
 from django.conf import settings
 from django.core.validators import MinValueValidator, MaxValueValidator
@@ -37,6 +40,11 @@ class Game(models.Model):
         ]
     )
 
+    lobby_ttl = models.DurationField(
+        default=timedelta(hours=2),
+        help_text="Searching lobbies without slot activity for this long are cancelled by 'reap_lobbies'."
+    )
+
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
@@ -78,6 +86,47 @@ class GameRole(models.Model):
         return self.name
 
 
+class GameRank(models.Model):
+    """
+    A named step on the rank ladder of a Game (e.g., 'Gold', 'Immortal').
+
+    The ladder maps the free-text ranks players type into numbers, so
+    profiles and lobbies can be compared with plain integer predicates.
+    """
+    name = models.CharField(max_length=50)
+    value = models.PositiveSmallIntegerField(
+        validators=[MinValueValidator(1)],
+        help_text="Position on the ladder; higher means more skilled."
+    )
+
+    game = models.ForeignKey(
+        Game,
+        on_delete=models.CASCADE,
+        related_name="ranks"
+    )
+
+    class Meta:
+        ordering = ["game", "value"]
+        constraints = [
+            models.UniqueConstraint(fields=["game", "name"], name="unique_game_ranks"),
+            models.UniqueConstraint(fields=["game", "value"], name="unique_game_rank_values"),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.name} ({self.value})"
+
+    @classmethod
+    def value_for(cls, game_id: int, rank: str) -> Optional[int]:
+        """
+        Looks up the ladder value of a free-text rank, ignoring case and padding.
+        """
+        rank = rank.strip()
+        if not rank:
+            return None
+
+        return cls.objects.filter(game_id=game_id, name__iexact=rank).values_list("value", flat=True).first()
+
+
 class UserGameProfile(models.Model):
     """
     Stores user-specific gaming metadata for a particular Game.
@@ -91,6 +140,13 @@ class UserGameProfile(models.Model):
         blank=True
     )
 
+    rank_value = models.PositiveSmallIntegerField(
+        null=True,
+        blank=True,
+        editable=False,
+        help_text="Ladder value of 'rank', set on save and by 'backfill_rank_values'."
+    )
+
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -123,3 +179,16 @@ class UserGameProfile(models.Model):
 
     def __str__(self) -> str:
         return f"{self.user.username} in {self.game.title}"
+
+    def save(self, *args, **kwargs) -> None:
+        """
+        Normalizes the free-text rank into its ladder value before saving.
+        """
+        update_fields = kwargs.get("update_fields")
+
+        if update_fields is None or "rank" in update_fields:
+            self.rank_value = GameRank.value_for(self.game_id, self.rank)
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, "rank_value"}
+
+        super().save(*args, **kwargs)
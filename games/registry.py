@@ -0,0 +1,178 @@
+"""
+In-process registry of the game catalog.
+
+Games, their roles and their rank ladders only change when an admin edits
+them, yet nearly every page looks them up. The registry loads the whole
+catalog once per process and serves lookups from memory. Saving or
+deleting a Game, GameRole or GameRank moves a version stored in the shared
+cache, and every process reloads its copy once it sees the new version.
+
+Registry instances are shared by all requests of a process and must be
+treated as read-only. Their roles and ranks are prefetched, so
+'game.roles.all()' and 'game.ranks.all()' are served from memory too.
+"""
+import hashlib
+import logging
+import threading
+import time
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.base import BaseCache
+from django.db import DatabaseError, transaction
+from django.db.models import Prefetch
+from django.http import Http404
+
+from games.models import Game, GameRank, GameRole
+
+logger = logging.getLogger(__name__)
+
+VERSION_KEY = "games:registry:version"
+
+
+def get_registry_cache() -> BaseCache:
+    return caches[settings.GAME_REGISTRY_CACHE_ALIAS]
+
+
+def get_registry_version() -> int:
+    """
+    Returns the current catalog version.
+
+    A missing version (cold or evicted cache) is seeded with the current
+    time, so a process never keeps a copy loaded under an older version.
+    """
+    cache = get_registry_cache()
+    version = cache.get(VERSION_KEY)
+
+    if version is None:
+        version = time.time_ns()
+        cache.add(VERSION_KEY, version, None)
+        version = cache.get(VERSION_KEY, version)
+
+    return version
+
+
+def bump_registry_version() -> None:
+    """Makes every process reload its copy of the catalog."""
+    get_registry_cache().set(VERSION_KEY, time.time_ns(), None)
+
+
+def invalidate_registry(sender: Any, **kwargs: Any) -> None:
+    """
+    post_save/post_delete receiver of the catalog models.
+
+    The version is moved right away and again once the transaction commits,
+    so a process reloading in between cannot keep the catalog as it was
+    before the write.
+    """
+    bump_registry_version()
+    transaction.on_commit(bump_registry_version)
+
+
+def roles_digest(roles: Iterable[GameRole]) -> str:
+    """Hashes everything a rendered role list shows, in display order."""
+    raw = "|".join(f"{role.pk}:{role.order}:{role.name}:{role.icon_class}" for role in roles)
+    return hashlib.sha1(raw.encode(), usedforsecurity=False).hexdigest()
+
+
+EMPTY_ROLES_VERSION = roles_digest([])
+
+
+class Catalog(NamedTuple):
+    version: Optional[int]
+    by_slug: Dict[str, Game]
+    by_id: Dict[int, Game]
+    roles_versions: Dict[int, str]
+
+
+class GameRegistry:
+    """
+    Process-wide copy of the game catalog.
+
+    Each lookup compares the loaded version with the shared one (a cache
+    read, not a query) and reloads the catalog with three queries when it
+    moved. Unknown slugs and ids never trigger a reload.
+    """
+
+    def __init__(self) -> None:
+        self._catalog = Catalog(None, {}, {}, {})
+        self._lock = threading.Lock()
+
+    def _current(self) -> Catalog:
+        version = get_registry_version()
+        catalog = self._catalog
+
+        if catalog.version != version:
+            with self._lock:
+                catalog = self._catalog
+                if catalog.version != version:
+                    catalog = self._catalog = self._load(version)
+
+        return catalog
+
+    def _load(self, version: int) -> Catalog:
+        games = list(Game.objects.prefetch_related(
+            Prefetch("roles", queryset=GameRole.objects.order_by("order", "id")),
+            Prefetch("ranks", queryset=GameRank.objects.order_by("value")),
+        ))
+
+        return Catalog(
+            version,
+            {game.slug: game for game in games},
+            {game.pk: game for game in games},
+            {game.pk: roles_digest(game.roles.all()) for game in games},
+        )
+
+    def get(self, slug: str) -> Optional[Game]:
+        return self._current().by_slug.get(slug)
+
+    def get_by_id(self, game_id: Any) -> Optional[Game]:
+        try:
+            return self._current().by_id.get(int(game_id))
+        except (TypeError, ValueError):
+            return None
+
+    def games(self) -> List[Game]:
+        """Every game, in the default (title) order."""
+        return list(self._current().by_slug.values())
+
+    def roles(self, game_id: Any) -> List[GameRole]:
+        """The roles of a game in display order, or none for an unknown game."""
+        game = self.get_by_id(game_id)
+        return list(game.roles.all()) if game else []
+
+    def roles_version(self, game_id: Any) -> str:
+        """
+        Identifies the current roles of a game.
+
+        It only changes when one of the game's roles does, so it can key
+        rendered role lists and HTTP validators without a query.
+        """
+        try:
+            game_id = int(game_id)
+        except (TypeError, ValueError):
+            return EMPTY_ROLES_VERSION
+        return self._current().roles_versions.get(game_id, EMPTY_ROLES_VERSION)
+
+    def warm(self) -> None:
+        """
+        Loads the catalog ahead of the first request.
+
+        Called when a server process starts; a database that is not ready
+        yet only leaves the registry cold.
+        """
+        try:
+            self._current()
+        except DatabaseError:
+            logger.warning("Could not warm up the game registry", exc_info=True)
+
+
+game_registry = GameRegistry()
+
+
+def get_game_or_404(slug: str) -> Game:
+    game = game_registry.get(slug)
+    if game is None:
+        raise Http404("No game matches the given slug.")
+    return game
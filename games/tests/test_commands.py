@@ -0,0 +1,33 @@
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+
+from games.models import Game, GameRank, UserGameProfile
+
+User = get_user_model()
+
+
+class BackfillRankValuesCommandTests(TestCase):
+    """
+    Tests for the backfill_rank_values management command.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.game = Game.objects.create(title="Valorant", slug="valorant", team_size=5)
+        cls.user = User.objects.create_user(username="player", email="p@ex.com", password="pw")
+
+    def test_backfills_profiles_created_before_the_ladder(self):
+        """Verifies profiles are matched against a ladder added after they were saved."""
+        profile = UserGameProfile.objects.create(user=self.user, game=self.game, rank="gold ")
+        self.assertIsNone(profile.rank_value)
+
+        GameRank.objects.create(game=self.game, name="Gold", value=4)
+        out = StringIO()
+        call_command("backfill_rank_values", stdout=out)
+
+        profile.refresh_from_db()
+        self.assertEqual(profile.rank_value, 4)
+        self.assertIn("Backfilled rank values of 1 profiles.", out.getvalue())
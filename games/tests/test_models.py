@@ -2,7 +2,7 @@ from django.contrib.auth import get_user_model
 from django.db import IntegrityError
 from django.test import TestCase
 
-from games.models import Game, GameRole, UserGameProfile
+from games.models import Game, GameRank, GameRole, UserGameProfile
 
 User = get_user_model()
 
@@ -78,3 +78,20 @@ class UserGameProfileModelTest(TestCase):
                 game=self.game,
                 rank="Gold"
             )
+
+    def test_rank_value_follows_ladder(self):
+        """Verifies that the free-text rank is normalized to its ladder value on save."""
+        GameRank.objects.create(game=self.game, name="Silver", value=1)
+        GameRank.objects.create(game=self.game, name="Global Elite", value=9)
+
+        profile = UserGameProfile.objects.create(user=self.user, game=self.game, rank="  global elite ")
+        self.assertEqual(profile.rank_value, 9)
+
+        profile.rank = "Silver"
+        profile.save(update_fields=["rank"])
+        profile.refresh_from_db()
+        self.assertEqual(profile.rank_value, 1)
+
+        profile.rank = "Unknown"
+        profile.save()
+        self.assertIsNone(profile.rank_value)
@@ -0,0 +1,71 @@
+from django.http import Http404
+from django.test import TestCase
+from django.urls import reverse
+
+from games.models import Game, GameRank, GameRole
+from games.registry import GameRegistry, bump_registry_version, game_registry, get_game_or_404
+
+
+class GameRegistryTests(TestCase):
+    """
+    Tests for the in-process game catalog and its invalidation.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.game = Game.objects.create(title="Valorant", slug="valorant", team_size=5)
+        cls.other_game = Game.objects.create(title="Apex", slug="apex", team_size=3)
+        cls.controller = GameRole.objects.create(game=cls.game, name="Controller", order=2)
+        cls.duelist = GameRole.objects.create(game=cls.game, name="Duelist", order=1)
+        GameRank.objects.create(game=cls.game, name="Gold", value=3)
+
+    def setUp(self) -> None:
+        self.registry = GameRegistry()
+        self.registry.warm()
+
+    def test_lookups_are_served_from_memory(self) -> None:
+        """A warm registry answers game, role and rank lookups without queries."""
+        with self.assertNumQueries(0):
+            game = self.registry.get("valorant")
+            self.assertEqual(game, self.game)
+            self.assertEqual(self.registry.get_by_id(str(self.game.id)), self.game)
+            self.assertEqual(list(game.roles.all()), [self.duelist, self.controller])
+            self.assertEqual([rank.name for rank in game.ranks.all()], ["Gold"])
+            self.assertEqual(self.registry.games(), [self.other_game, self.game])
+
+    def test_unknown_games_do_not_reload(self) -> None:
+        """Misses (unknown slugs, bad ids) are answered without touching the database."""
+        with self.assertNumQueries(0):
+            self.assertIsNone(self.registry.get("missing"))
+            self.assertIsNone(self.registry.get_by_id("abc"))
+            self.assertEqual(self.registry.roles(None), [])
+
+        with self.assertRaises(Http404):
+            get_game_or_404("missing")
+
+    def test_catalog_writes_reload_the_registry(self) -> None:
+        """Saving or deleting a game or role makes the next lookup reload."""
+        support = GameRole.objects.create(game=self.game, name="Support", order=3)
+
+        with self.assertNumQueries(3):
+            self.assertIn(support, self.registry.roles(self.game.id))
+
+        self.other_game.delete()
+        self.assertIsNone(self.registry.get("apex"))
+
+    def test_version_bump_from_another_process_reloads(self) -> None:
+        """A version moved elsewhere (another process) is picked up on the next lookup."""
+        Game.objects.filter(pk=self.game.pk).update(title="Valorant 2")
+        self.assertEqual(self.registry.get("valorant").title, "Valorant")
+
+        bump_registry_version()
+        self.assertEqual(self.registry.get("valorant").title, "Valorant 2")
+
+    def test_roles_view_skips_the_database(self) -> None:
+        """The HTMX role options are rendered from the registry."""
+        game_registry.warm()
+
+        with self.assertNumQueries(0):
+            response = self.client.get(reverse("games:get-game-roles"), {"game": self.game.id})
+
+        self.assertContains(response, f'value="{self.duelist.id}"')
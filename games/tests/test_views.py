@@ -1,4 +1,5 @@
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.test import TestCase
 from django.urls import reverse
 
@@ -68,3 +69,59 @@ class GameViewTests(TestCase):
         self.assertEqual(response.status_code, 302)
 
         self.assertTrue(UserGameProfile.objects.filter(user=self.user, game=self.game).exists())
+
+
+class GameRoleOptionsCachingTests(TestCase):
+    """
+    Tests for the HTTP and fragment caching of the HTMX role options.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.game = Game.objects.create(title="Valorant", slug="valorant", team_size=5)
+        cls.role = GameRole.objects.create(game=cls.game, name="Duelist", order=1)
+
+    def setUp(self) -> None:
+        cache.clear()
+        self.url = reverse("games:get-game-roles")
+
+    def test_response_carries_validators(self) -> None:
+        """Options are public, cacheable for a while and carry an ETag."""
+        response = self.client.get(self.url, {"game": self.game.id})
+
+        self.assertTrue(response.has_header("ETag"))
+        self.assertIn("public", response["Cache-Control"])
+        self.assertIn("max-age=", response["Cache-Control"])
+        self.assertNotIn("Vary", response)
+
+    def test_matching_etag_is_not_modified_without_queries(self) -> None:
+        """A client holding the current options gets a 304 without any query."""
+        etag = self.client.get(self.url, {"game": self.game.id})["ETag"]
+
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url, {"game": self.game.id}, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+
+    def test_rendered_options_are_cached(self) -> None:
+        """Only the first request of a roles version renders the template."""
+        with self.assertTemplateUsed("games/partials/role_options.html"):
+            first = self.client.get(self.url, {"game": self.game.id})
+
+        with self.assertTemplateNotUsed("games/partials/role_options.html"):
+            second = self.client.get(self.url, {"game": self.game.id})
+
+        self.assertEqual(first.content, second.content)
+
+    def test_role_change_moves_etag(self) -> None:
+        """Editing a role of the game changes the ETag and the rendered options."""
+        etag = self.client.get(self.url, {"game": self.game.id})["ETag"]
+
+        self.role.name = "Sentinel"
+        self.role.save()
+
+        response = self.client.get(self.url, {"game": self.game.id}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertContains(response, "Sentinel")
@@ -1,12 +1,23 @@
+from typing import Any
+
+from django.conf import settings
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.db.models import QuerySet
 from django.http import HttpRequest, HttpResponse
-from django.shortcuts import render, get_object_or_404
+from django.shortcuts import get_object_or_404
+from django.template.loader import render_to_string
 from django.urls import reverse_lazy
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import quote_etag
 from django.views import generic, View
 
 from games.forms import UserGameProfileForm
-from games.models import Game, GameRole, UserGameProfile
+from games.models import Game, UserGameProfile
+from games.registry import game_registry, get_registry_cache
+
+# Bump when the role options template changes, so clients and the fragment
+# cache never keep the old markup.
+ROLE_OPTIONS_VERSION = 1
 
 
 class GameListView(generic.ListView):
@@ -28,6 +39,10 @@ class GetGameRolesView(View):
     This view is triggered when a user selects a game in the profile form.
     It returns a partial HTML template containing <option> tags for the
     roles associated with the selected game.
+
+    The options only change with the game's roles, so they are validated by
+    an ETag derived from the registry's roles version (answered with 304
+    without a query) and rendered once per version into the cache.
     """
 
     def get(self, request: HttpRequest, *args, **kwargs) -> HttpResponse:
@@ -38,15 +53,39 @@ class GetGameRolesView(View):
             request: The HTTP request containing the 'game' ID in GET parameters.
 
         Returns:
-            HttpResponse: Rendered partial HTML with role options.
+            HttpResponse: Rendered partial HTML with role options, or 304 Not
+            Modified when the client already holds the current version.
         """
         game_id = request.GET.get("game")
-        roles = GameRole.objects.none()
+        version = game_registry.roles_version(game_id)
+        etag = quote_etag(f"{ROLE_OPTIONS_VERSION}-{version}")
+
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = HttpResponse(self.render_options(game_id, version))
+
+        response["ETag"] = etag
+        patch_cache_control(response, public=True, max_age=settings.GAME_ROLE_OPTIONS_MAX_AGE)
+        return response
+
+    def render_options(self, game_id: Any, version: str) -> str:
+        """
+        Returns the rendered options of a roles version, rendering them on a miss.
+
+        The options are rendered without the request, so the response never
+        depends on (or varies with) the visitor's session.
+        """
+        cache = get_registry_cache()
+        key = f"games:role-options:{ROLE_OPTIONS_VERSION}:{version}"
 
-        if game_id:
-            roles = GameRole.objects.filter(game_id=game_id).order_by("order")
+        fragment = cache.get(key)
+        if fragment is None:
+            fragment = render_to_string("games/partials/role_options.html", {
+                "roles": game_registry.roles(game_id)
+            })
+            cache.set(key, fragment, settings.GAME_ROLE_OPTIONS_CACHE_TIMEOUT)
 
-        return render(request, "games/partials/role_options.html", {"roles": roles})
+        return fragment
 
 
 class MyGameProfilesListView(LoginRequiredMixin, generic.ListView):
@@ -0,0 +1,36 @@
+"""
+Gunicorn configuration for serving config.asgi through Uvicorn workers.
+
+    gunicorn config.asgi:application
+
+Each worker process runs one event loop. Requests that only wait (lobby
+event streams, slot actions queued on the slot-action pool) cost a
+coroutine rather than a thread, so concurrency is raised with
+SLOT_ACTION_WORKERS per process instead of more processes.
+"""
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+
+worker_class = "uvicorn.workers.UvicornWorker"
+workers = int(os.getenv("WEB_CONCURRENCY", min(multiprocessing.cpu_count() * 2 + 1, 4)))
+
+# With async workers this is the worker heartbeat, not a request limit, so open
+# event streams are not cut off.
+timeout = int(os.getenv("GUNICORN_TIMEOUT", 60))
+graceful_timeout = 30
+keepalive = 5
+
+# Recycle workers now and then to cap memory growth.
+max_requests = 2000
+max_requests_jitter = 200
+
+accesslog = "-"
+
+
+def worker_exit(server, worker):
+    """Writes the lobby events still buffered when a worker stops or is recycled."""
+    from lobbies.activity import flush_events
+
+    flush_events()
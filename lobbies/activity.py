@@ -0,0 +1,118 @@
+import logging
+import threading
+import time
+from typing import Any, List, Optional
+
+from django.conf import settings
+from django.db import DatabaseError, transaction
+
+from lobbies.models import LobbyEvent, Slot
+
+logger = logging.getLogger(__name__)
+
+
+class EventBuffer:
+    """
+    Process-wide buffer of LobbyEvent rows.
+
+    Events are handed over once the transaction that caused them commits
+    and are written with a single bulk_create per batch, so a burst of
+    joins costs one INSERT instead of one per join. A partial batch is
+    written by the next event or finished request after the flush interval,
+    and whatever is left when a server worker exits by its 'worker_exit'
+    hook (see gunicorn.conf.py).
+    """
+
+    def __init__(self) -> None:
+        self._pending: List[LobbyEvent] = []
+        self._oldest = 0.0
+        self._lock = threading.Lock()
+
+    def add(self, events: List[LobbyEvent]) -> None:
+        with self._lock:
+            if not self._pending:
+                self._oldest = time.monotonic()
+            self._pending.extend(events)
+            full = len(self._pending) >= settings.LOBBY_EVENT_BATCH_SIZE
+
+        if full or self.is_due():
+            self.flush()
+
+    def is_due(self) -> bool:
+        return bool(self._pending) and time.monotonic() - self._oldest >= settings.LOBBY_EVENT_FLUSH_INTERVAL
+
+    def flush(self) -> int:
+        """
+        Writes every pending event and returns how many were written.
+
+        The log is best effort: a failed INSERT drops the batch instead of
+        failing the request whose action already committed.
+        """
+        with self._lock:
+            batch, self._pending = self._pending, []
+
+        if not batch:
+            return 0
+
+        try:
+            LobbyEvent.objects.bulk_create(batch, batch_size=max(settings.LOBBY_EVENT_BATCH_SIZE, 100))
+        except DatabaseError:
+            logger.exception("Dropped %d lobby events", len(batch))
+            return 0
+
+        return len(batch)
+
+
+event_buffer = EventBuffer()
+
+
+def log_events(*events: Optional[LobbyEvent]) -> None:
+    """
+    Queues events for the log once the current transaction commits.
+
+    Events of a rolled back action are never written. None entries are
+    skipped, so optional events (see status_event) can be passed as is.
+    """
+    events = [event for event in events if event is not None]
+    if events:
+        transaction.on_commit(lambda: event_buffer.add(events))
+
+
+def flush_events() -> int:
+    """Writes buffered events; called by commands and server workers before they exit."""
+    return event_buffer.flush()
+
+
+def flush_due_events(**kwargs: Any) -> None:
+    """request_finished receiver writing a partial batch past the flush interval."""
+    if event_buffer.is_due():
+        event_buffer.flush()
+
+
+def slot_event(slot: Slot, kind: str, user_id: Optional[int]) -> LobbyEvent:
+    """Builds a join, leave or kick event of a player in 'slot'."""
+    return LobbyEvent(
+        lobby_id=slot.lobby_id,
+        user_id=user_id,
+        kind=kind,
+        data={"slot": slot.order, "role": slot.required_role_id}
+    )
+
+
+def status_event(change: Any, user_id: Optional[int] = None) -> Optional[LobbyEvent]:
+    """
+    Builds a status event from a lobbies.states.StatusChange, if any.
+
+    Changes come from the rows recorded by the transition itself (see
+    Lobby.status_change), never from in-memory values, so concurrent
+    changes to a lobby that was not locked are logged as they happened.
+    """
+    if change is None:
+        return None
+
+    return LobbyEvent(
+        lobby_id=change.lobby_id,
+        user_id=user_id,
+        kind=LobbyEvent.Kind.STATUS_CHANGED,
+        data={"from": change.from_status, "to": change.to_status, "trigger": str(change.trigger)}
+    )
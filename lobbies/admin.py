@@ -1,7 +1,24 @@
 from django.contrib import admin
 from django.http import HttpRequest
 
-from lobbies.models import Lobby
+from lobbies.models import Lobby, LobbyTransition
+
+
+class LobbyTransitionInline(admin.TabularInline):
+    """
+    Read-only history of status changes, written by lobbies.states.
+    """
+    model = LobbyTransition
+    fields = ["created_at", "from_status", "to_status", "trigger"]
+    readonly_fields = fields
+    extra = 0
+    can_delete = False
+
+    def has_add_permission(self, request: HttpRequest, obj: Lobby = None) -> bool:
+        return False
+
+    def has_change_permission(self, request: HttpRequest, obj: Lobby = None) -> bool:
+        return False
 
 
 @admin.register(Lobby)
@@ -14,24 +31,26 @@ class LobbyAdmin(admin.ModelAdmin):
     slot generation logic properly via Views/Forms.
     """
     list_select_related = ["host", "game"]
+    inlines = [LobbyTransitionInline]
 
     list_display = [
         "title",
         "host",
         "game",
-        "filled_slots",
+        "slots_summary",
         "status",
         "created_at"
     ]
 
     list_filter = ["status", "game", "created_at"]
     search_fields = ["title", "host__username", "invite_link"]
-    fields = ["title", "description", "status", "host", "game", "size", "invite_link"]
+    fields = ["title", "description", "status", "status_changed_at", "host", "game", "size", "invite_link"]
 
     readonly_fields = [
         "invite_link",
         "created_at",
         "updated_at",
+        "status_changed_at",
         "host",
         "game",
         "size"
@@ -40,7 +59,7 @@ class LobbyAdmin(admin.ModelAdmin):
     def has_add_permission(self, request: HttpRequest) -> bool:
         return False
 
-    def filled_slots(self, obj: Lobby) -> str:
-        return f"{obj.filled_count}/{obj.size}"
+    def slots_summary(self, obj: Lobby) -> str:
+        return f"{obj.filled_slots}/{obj.size}"
 
-    filled_slots.short_description = "Slots"
+    slots_summary.short_description = "Slots"
@@ -0,0 +1,175 @@
+import hashlib
+from typing import Any, Dict, Iterable, List
+
+from django.db.models import Count, Max
+from django.http import Http404, HttpRequest, HttpResponse, JsonResponse
+from django.urls import reverse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import quote_etag
+from django.views import View
+
+from lobbies.models import Lobby, Slot
+from lobbies.pagination import InvalidCursor
+from lobbies.views import LobbyFilterMixin
+
+# Bump when the payload shape changes, so clients never keep a stale body.
+API_VERSION = 1
+
+LOBBY_FIELDS = (
+    "id",
+    "invite_link",
+    "title",
+    "description",
+    "status",
+    "is_public",
+    "size",
+    "filled_slots",
+    "min_rank",
+    "max_rank",
+    "created_at",
+    "updated_at",
+    "host__username",
+)
+
+SLOT_FIELDS = (
+    "lobby_id",
+    "order",
+    "joined_at",
+    "player__username",
+    "required_role__name",
+)
+
+
+def strong_etag(*parts: Any) -> str:
+    """Hashes the given state into a quoted strong ETag."""
+    raw = "|".join(str(part) for part in (API_VERSION, *parts))
+    return quote_etag(hashlib.sha1(raw.encode(), usedforsecurity=False).hexdigest())
+
+
+def fetch_slots(lobby_ids: Iterable[int]) -> Dict[int, List[Dict[str, Any]]]:
+    """
+    Loads the slots of several lobbies with a single projected query,
+    grouped by lobby id.
+    """
+    slots: Dict[int, List[Dict[str, Any]]] = {}
+
+    rows = Slot.objects.filter(lobby_id__in=list(lobby_ids)).order_by("lobby_id", "order").values(*SLOT_FIELDS)
+    for row in rows:
+        slots.setdefault(row["lobby_id"], []).append({
+            "order": row["order"],
+            "player": row["player__username"],
+            "role": row["required_role__name"],
+            "joined_at": row["joined_at"],
+        })
+
+    return slots
+
+
+def serialize_lobby(row: Dict[str, Any], slots: List[Dict[str, Any]], game_slug: str) -> Dict[str, Any]:
+    """Shapes a '.values()' lobby row and its slots into the public payload."""
+    kwargs = {"game_slug": game_slug, "invite_link": row["invite_link"]}
+
+    return {
+        "invite_link": row["invite_link"],
+        "title": row["title"],
+        "description": row["description"],
+        "status": row["status"],
+        "is_public": row["is_public"],
+        "host": row["host__username"],
+        "size": row["size"],
+        "filled_slots": row["filled_slots"],
+        "min_rank": None if row["min_rank"] == Lobby.ANY_MIN_RANK else row["min_rank"],
+        "max_rank": None if row["max_rank"] == Lobby.ANY_MAX_RANK else row["max_rank"],
+        "created_at": row["created_at"],
+        "updated_at": row["updated_at"],
+        "url": reverse("lobbies:lobby-detail", kwargs=kwargs),
+        "api_url": reverse("lobbies:api-lobby-detail", kwargs=kwargs),
+        "slots": slots,
+    }
+
+
+def conditional_json(request: HttpRequest, etag: str, build: Any, **cache_control: Any) -> HttpResponse:
+    """
+    Answers with 304 Not Modified when the client already holds 'etag',
+    otherwise with the JSON payload returned by 'build()'.
+
+    The payload is only assembled (and its queries only run) on a miss.
+    """
+    response = get_conditional_response(request, etag=etag)
+    if response is None:
+        response = JsonResponse(build())
+
+    response["ETag"] = etag
+    patch_cache_control(response, no_cache=True, **cache_control)
+    return response
+
+
+class LobbyListAPIView(LobbyFilterMixin, View):
+    """
+    Read-only JSON version of the lobby list for bots and overlays.
+
+    Accepts the same filters and cursors as LobbyListView. The ETag is
+    derived from the number of matching lobbies and their latest
+    'updated_at', which moves on every slot change, so an unchanged list
+    is answered with a 304 after a single aggregate query.
+    """
+    page_size = 20
+
+    def get(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
+        queryset = self.get_filtered_queryset()
+        state = queryset.order_by().aggregate(count=Count("id"), last_update=Max("updated_at"))
+
+        etag = strong_etag(
+            self.game.id,
+            request.user.pk,
+            sorted(request.GET.lists()),
+            state["count"],
+            state["last_update"] and state["last_update"].isoformat(),
+        )
+
+        return conditional_json(request, etag, lambda: self.build_payload(queryset), private=True)
+
+    def build_payload(self, queryset: Any) -> Dict[str, Any]:
+        fields = LOBBY_FIELDS + (("search_rank",) if self.search_terms else ())
+        paginator = self.get_paginator_for(queryset.values(*fields), self.page_size)
+
+        try:
+            page = paginator.page(self.request.GET.get("cursor"))
+        except InvalidCursor:
+            raise Http404("Invalid cursor.")
+
+        slots = fetch_slots(row["id"] for row in page)
+
+        return {
+            "game": {"slug": self.game.slug, "title": self.game.title},
+            "results": [serialize_lobby(row, slots.get(row["id"], []), self.game.slug) for row in page],
+            "next_cursor": page.next_cursor,
+            "previous_cursor": page.previous_cursor,
+        }
+
+
+class LobbyDetailAPIView(View):
+    """
+    Read-only JSON version of the lobby dashboard.
+
+    Like the HTML page it is reachable by anyone holding the invite link.
+    The ETag is derived from 'Lobby.updated_at', so polling an unchanged
+    lobby costs one indexed single-row query.
+    """
+
+    def get(self, request: HttpRequest, game_slug: str, invite_link: str) -> HttpResponse:
+        row = Lobby.objects.filter(
+            invite_link=invite_link,
+            game__slug=game_slug
+        ).values(*LOBBY_FIELDS).first()
+
+        if row is None:
+            raise Http404("No lobby found.")
+
+        etag = strong_etag(row["id"], row["updated_at"].isoformat())
+
+        return conditional_json(
+            request,
+            etag,
+            lambda: serialize_lobby(row, fetch_slots([row["id"]]).get(row["id"], []), game_slug)
+        )
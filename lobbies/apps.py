@@ -1,5 +1,24 @@
 from django.apps import AppConfig
+from django.core.signals import request_finished
+from django.db.models.signals import post_migrate
+
+
+def ensure_search_index(sender, using, **kwargs):
+    """Re-creates search triggers that a SQLite table rebuild may have dropped."""
+    from django.db import connections
+
+    from lobbies.models import Lobby
+    from lobbies.search import install_search_index
+
+    with connections[using].schema_editor() as schema_editor:
+        install_search_index(schema_editor, Lobby)
 
 
 class LobbiesConfig(AppConfig):
     name = 'lobbies'
+
+    def ready(self):
+        from lobbies.activity import flush_due_events
+
+        post_migrate.connect(ensure_search_index, sender=self, dispatch_uid="lobbies.ensure_search_index")
+        request_finished.connect(flush_due_events, dispatch_uid="lobbies.flush_due_events")
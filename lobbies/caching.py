@@ -0,0 +1,61 @@
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.base import BaseCache
+from django.http import HttpRequest
+
+
+def get_list_cache() -> BaseCache:
+    return caches[settings.LOBBY_LIST_CACHE_ALIAS]
+
+
+def _version_key(game_id: int) -> str:
+    return f"lobbies:list:version:{game_id}"
+
+
+def get_list_version(game_id: int) -> int:
+    """
+    Returns the current lobby list version for a game.
+
+    A missing version (cold or evicted cache) is seeded with the current
+    time, so fragments stored under an older version are never reused.
+    """
+    cache = get_list_cache()
+    version = cache.get(_version_key(game_id))
+
+    if version is None:
+        version = time.time_ns()
+        cache.add(_version_key(game_id), version, None)
+        version = cache.get(_version_key(game_id), version)
+
+    return version
+
+
+def bump_list_version(game_id: int) -> None:
+    """
+    Invalidates every cached list fragment of a game by moving its version.
+    """
+    get_list_cache().set(_version_key(game_id), time.time_ns(), None)
+
+
+def list_fragment_key(game_id: int, request: HttpRequest) -> str:
+    """
+    Builds the cache key of a rendered list fragment.
+
+    The key varies on every query parameter that changes the rendered
+    output: role filter, availability toggle, rank, search query, cursor and
+    HTMX partial mode.
+    """
+    params = ":".join([
+        request.GET.get("role", ""),
+        request.GET.get("available_only", ""),
+        request.GET.get("rank", ""),
+        request.GET.get("q", "").strip(),
+        request.GET.get("cursor", ""),
+        "htmx" if request.headers.get("HX-Request") else "page",
+    ])
+    digest = hashlib.md5(params.encode(), usedforsecurity=False).hexdigest()
+
+    return f"lobbies:list:fragment:{game_id}:{get_list_version(game_id)}:{digest}"
@@ -0,0 +1,243 @@
+import asyncio
+import json
+import logging
+import threading
+import time
+import uuid
+from collections import defaultdict
+from functools import lru_cache
+from typing import Any, Dict, Optional, Set
+
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
+from django.template.loader import render_to_string
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+
+class BaseBroker:
+    """
+    Interface for delivering lobby events to Server-Sent Events streams.
+
+    Publishing is called from synchronous views (after commit), while
+    subscriptions are consumed by async views. A broker backed by an
+    external pub/sub only has to implement these two methods.
+    """
+
+    def publish(self, channel: str, message: Dict[str, Any]) -> None:
+        raise NotImplementedError
+
+    def subscribe(self, channel: str) -> "Subscription":
+        raise NotImplementedError
+
+
+class Subscription:
+    """
+    A single stream's view of a channel, bound to the running event loop.
+
+    Messages are handed over with call_soon_threadsafe, so publishers may
+    run in any thread. When a slow client lets the queue fill up, the
+    oldest message is dropped.
+    """
+
+    def __init__(self, broker: "InProcessBroker", channel: str, max_size: int = 100) -> None:
+        self.broker = broker
+        self.channel = channel
+        self.loop = asyncio.get_running_loop()
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_size)
+
+    async def __aenter__(self) -> "Subscription":
+        self.broker._register(self)
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        self.broker._unregister(self)
+
+    def put(self, message: Dict[str, Any]) -> None:
+        self.loop.call_soon_threadsafe(self._put_nowait, message)
+
+    def _put_nowait(self, message: Dict[str, Any]) -> None:
+        if self.queue.full():
+            self.queue.get_nowait()
+        self.queue.put_nowait(message)
+
+    async def get(self, timeout: float) -> Optional[Dict[str, Any]]:
+        """Waits for the next message, returning None when the timeout expires."""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class InProcessBroker(BaseBroker):
+    """
+    Pub/sub living in the memory of a single ASGI process.
+
+    Only streams served by the same process receive the events, which is
+    enough for a single uvicorn worker and for tests.
+    """
+
+    def __init__(self) -> None:
+        self._subscriptions: Dict[str, Set[Subscription]] = defaultdict(set)
+        self._lock = threading.Lock()
+
+    def publish(self, channel: str, message: Dict[str, Any]) -> None:
+        with self._lock:
+            subscriptions = list(self._subscriptions.get(channel, ()))
+
+        for subscription in subscriptions:
+            subscription.put(message)
+
+    def subscribe(self, channel: str) -> Subscription:
+        return Subscription(self, channel)
+
+    def _register(self, subscription: Subscription) -> None:
+        with self._lock:
+            self._subscriptions[subscription.channel].add(subscription)
+
+    def _unregister(self, subscription: Subscription) -> None:
+        with self._lock:
+            subscriptions = self._subscriptions.get(subscription.channel)
+            if subscriptions is not None:
+                subscriptions.discard(subscription)
+                if not subscriptions:
+                    del self._subscriptions[subscription.channel]
+
+
+class RedisBroker(InProcessBroker):
+    """
+    Pub/sub shared by every process through Redis (LOBBY_EVENTS_REDIS_URL).
+
+    Events are published to Redis, including by processes that serve no
+    streams (e.g. 'run_matchmaker'). A process serving streams listens on
+    one pattern subscription from a daemon thread and hands each message
+    to its local subscriptions, so open streams cost no Redis connection.
+    """
+
+    def __init__(self) -> None:
+        import redis
+
+        super().__init__()
+        self._redis = redis
+        self._client = redis.Redis.from_url(settings.LOBBY_EVENTS_REDIS_URL)
+        self._prefix = settings.LOBBY_EVENTS_CHANNEL_PREFIX
+        self._listener: Optional[threading.Thread] = None
+
+    def publish(self, channel: str, message: Dict[str, Any]) -> None:
+        """
+        Sends a message to every process. Live updates are best effort: a
+        Redis outage is logged instead of failing the committed action.
+        """
+        try:
+            self._client.publish(self._prefix + channel, json.dumps(message))
+        except self._redis.RedisError:
+            logger.exception("Could not publish a lobby event to %s", channel)
+
+    def subscribe(self, channel: str) -> Subscription:
+        if self._listener is None:
+            with self._lock:
+                if self._listener is None:
+                    self._listener = threading.Thread(target=self._listen, name="lobby-events", daemon=True)
+                    self._listener.start()
+
+        return super().subscribe(channel)
+
+    def _listen(self) -> None:
+        """Relays Redis messages to local subscriptions, reconnecting after errors."""
+        while True:
+            try:
+                pubsub = self._client.pubsub(ignore_subscribe_messages=True)
+                pubsub.psubscribe(f"{self._prefix}*")
+                for item in pubsub.listen():
+                    self._dispatch(item)
+            except self._redis.RedisError:
+                logger.warning("Lost the lobby events subscription; reconnecting", exc_info=True)
+                time.sleep(1)
+
+    def _dispatch(self, item: Dict[str, Any]) -> None:
+        if item["type"] != "pmessage":
+            return
+        channel = item["channel"].decode()[len(self._prefix):]
+        super().publish(channel, json.loads(item["data"]))
+
+
+@lru_cache(maxsize=None)
+def get_broker() -> BaseBroker:
+    return import_string(settings.LOBBY_EVENTS_BROKER)()
+
+
+def lobby_channel(lobby_id: int) -> str:
+    return f"lobby:{lobby_id}"
+
+
+def publish_slot_change(slot: Any, previous_player_id: Optional[int]) -> None:
+    """
+    Announces that a slot changed hands. Meant to run from transaction.on_commit.
+    """
+    get_broker().publish(lobby_channel(slot.lobby_id), {
+        "event_id": uuid.uuid4().hex,
+        "slot_id": slot.id,
+        "player_id": slot.player_id,
+        "previous_player_id": previous_player_id,
+    })
+
+
+def get_audience(user: Any, host_id: int, player_id: Optional[int], in_lobby: bool) -> str:
+    """
+    Classifies a viewer by everything slot_card.html varies on.
+
+    Viewers with the same audience see byte-identical cards, so a change
+    is rendered at most once per audience instead of once per viewer.
+    """
+    if not user.is_authenticated:
+        return "anonymous"
+    if user.id == player_id:
+        return "occupant"
+    if user.id == host_id:
+        return "host"
+    return "member" if in_lobby else "outsider"
+
+
+def render_slot_card(event_id: str, slot_id: int, audience: str, user: Any, in_lobby: bool) -> str:
+    """
+    Renders the slot card for an audience, memoized per event in the shared cache.
+
+    The card is rendered without a request, so its forms carry no CSRF
+    token; the client adds the page's token before swapping it in.
+    """
+    from games.models import UserGameProfile
+    from lobbies.models import Slot
+
+    cache_key = f"lobbies:slot-card:{event_id}:{audience}"
+    fragment = cache.get(cache_key)
+    if fragment is not None:
+        return fragment
+
+    slot = Slot.objects.select_related(
+        "lobby__game", "lobby__host", "player", "required_role"
+    ).get(pk=slot_id)
+
+    profile = None
+    if slot.player_id:
+        profile = UserGameProfile.objects.filter(user_id=slot.player_id, game_id=slot.lobby.game_id).first()
+
+    fragment = render_to_string("lobbies/partials/slot_card.html", {
+        "slot": slot,
+        "lobby": slot.lobby,
+        "user": user if user.is_authenticated else AnonymousUser(),
+        "user_is_in_lobby": in_lobby,
+        "profile": profile,
+    })
+    cache.set(cache_key, fragment, settings.LOBBY_EVENTS_RENDER_TIMEOUT)
+
+    return fragment
+
+
+def format_sse(event: str, data: str, event_id: Optional[str] = None) -> str:
+    lines = [f"event: {event}"]
+    if event_id:
+        lines.append(f"id: {event_id}")
+    lines.extend(f"data: {line}" for line in data.splitlines() or [""])
+    return "\n".join(lines) + "\n\n"
@@ -0,0 +1,62 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import close_old_connections
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_slot_action_executor() -> ThreadPoolExecutor:
+    """
+    Returns the process-wide pool that runs slot action transactions.
+
+    Its size bounds both the threads and the database connections used by
+    slot actions, however many requests are waiting on the event loop.
+    """
+    global _executor
+
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=settings.SLOT_ACTION_WORKERS,
+                    thread_name_prefix="slot-action"
+                )
+
+    return _executor
+
+
+def _run_in_pool_thread(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """
+    Runs 'func' with the connection handling a request thread gets.
+
+    Pool threads never see request_started/request_finished, so obsolete or
+    broken connections are closed here, honouring CONN_MAX_AGE.
+    """
+    close_old_connections()
+    try:
+        return func(*args, **kwargs)
+    finally:
+        close_old_connections()
+
+
+async def run_slot_action(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """
+    Awaits a blocking slot action without holding the event loop.
+
+    With SLOT_ACTION_WORKERS set, the call runs on the bounded slot-action
+    pool; with 0 it falls back to Django's default thread-sensitive mode,
+    which keeps it on the connection (and transaction) of the caller.
+    """
+    if not settings.SLOT_ACTION_WORKERS:
+        return await sync_to_async(func)(*args, **kwargs)
+
+    return await sync_to_async(
+        _run_in_pool_thread,
+        thread_sensitive=False,
+        executor=get_slot_action_executor()
+    )(func, *args, **kwargs)
@@ -29,9 +29,24 @@ class LobbyForm(forms.ModelForm):
         })
     )
 
+    min_rank = forms.TypedChoiceField(
+        coerce=int,
+        required=False,
+        empty_value=None,
+        label="Minimum rank",
+        widget=forms.Select(attrs={"class": "form-select"})
+    )
+    max_rank = forms.TypedChoiceField(
+        coerce=int,
+        required=False,
+        empty_value=None,
+        label="Maximum rank",
+        widget=forms.Select(attrs={"class": "form-select"})
+    )
+
     class Meta:
         model = Lobby
-        fields = ["title", "description", "size", "communication_link", "is_public"]
+        fields = ["title", "description", "size", "communication_link", "is_public", "min_rank", "max_rank"]
 
         widgets = {
             "title": forms.TextInput(attrs={
@@ -65,6 +80,8 @@ class LobbyForm(forms.ModelForm):
         super().__init__(*args, **kwargs)
 
         if self.game:
+            # Roles and ranks of a registry game are prefetched (see
+            # games.registry), so building the choices costs no query.
             roles = self.game.roles.all()
 
             self.fields["host_role"].queryset = roles
@@ -74,6 +91,14 @@ class LobbyForm(forms.ModelForm):
             self.fields["host_role"].choices = [("", "Flex")] + role_choices
             self.fields["needed_roles"].choices = role_choices
 
+            rank_choices = [(rank.value, rank.name) for rank in self.game.ranks.all()]
+            if rank_choices:
+                self.fields["min_rank"].choices = [("", "Any")] + rank_choices
+                self.fields["max_rank"].choices = [("", "Any")] + rank_choices
+            else:
+                del self.fields["min_rank"]
+                del self.fields["max_rank"]
+
             max_size = min(self.game.team_size * 2, 20)
             self.fields["size"].widget.attrs.update({
                 "min": 2,
@@ -88,3 +113,24 @@ class LobbyForm(forms.ModelForm):
         if self.game and size > self.game.team_size * 2:
             raise forms.ValidationError(f"Too many players for {self.game.title}")
         return size
+
+    def clean_min_rank(self) -> int:
+        """Stores an open lower bound as the lowest possible ladder value."""
+        value = self.cleaned_data.get("min_rank")
+        return Lobby.ANY_MIN_RANK if value is None else value
+
+    def clean_max_rank(self) -> int:
+        """Stores an open upper bound as the highest possible ladder value."""
+        value = self.cleaned_data.get("max_rank")
+        return Lobby.ANY_MAX_RANK if value is None else value
+
+    def clean(self) -> dict:
+        """Validates that the rank range is not inverted."""
+        cleaned_data = super().clean()
+        min_rank = cleaned_data.get("min_rank")
+        max_rank = cleaned_data.get("max_rank")
+
+        if min_rank is not None and max_rank is not None and min_rank > max_rank:
+            self.add_error("max_rank", "The maximum rank must not be below the minimum rank.")
+
+        return cleaned_data
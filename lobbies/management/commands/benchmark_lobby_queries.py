@@ -0,0 +1,183 @@
+import random
+import time
+import uuid
+from typing import Dict
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.db.models import Q, QuerySet
+from django.test import RequestFactory
+
+from games.models import Game, GameRole
+from lobbies.models import Lobby, Slot
+from lobbies.open_roles import summarize
+from lobbies.pagination import RankedPaginator
+from lobbies.views import LobbyListView
+
+User = get_user_model()
+
+
+class Rollback(Exception):
+    """Raised to discard the seeded benchmark data."""
+
+
+class Command(BaseCommand):
+    help = 'Seeds a large lobby dataset and prints EXPLAIN plans and timings of the list/detail queries.'
+
+    def add_arguments(self, parser):
+        parser.add_argument("--lobbies", type=int, default=10000, help="Number of lobbies to seed.")
+        parser.add_argument("--users", type=int, default=500, help="Number of players to seed.")
+        parser.add_argument("--repeat", type=int, default=5, help="Timed executions per query.")
+        parser.add_argument(
+            "--compare",
+            action="store_true",
+            help="Then run every query again with the hot-path indexes dropped."
+        )
+        parser.add_argument(
+            "--keep",
+            action="store_true",
+            help="Keep the seeded data instead of rolling it back."
+        )
+
+    def handle(self, *args, **options):
+        try:
+            with transaction.atomic():
+                game = self.seed(options["lobbies"], options["users"])
+
+                self.report("with indexes", game, options["repeat"])
+
+                # Indexes rebuilt within this transaction may be unusable to it
+                # on PostgreSQL, so the indexed plans are taken first.
+                if options["compare"]:
+                    self.toggle_indexes(create=False)
+                    self.report("without hot-path indexes", game, options["repeat"])
+                    self.toggle_indexes(create=True)
+
+                if not options["keep"]:
+                    raise Rollback
+        except Rollback:
+            self.stdout.write(self.style.WARNING("Seeded data rolled back."))
+
+    def seed(self, lobby_count: int, user_count: int) -> Game:
+        self.stdout.write(f"Seeding {lobby_count} lobbies and {user_count} users...")
+        suffix = uuid.uuid4().hex[:8]
+
+        game = Game.objects.create(title=f"Benchmark {suffix}", slug=f"benchmark-{suffix}", team_size=5)
+        roles = GameRole.objects.bulk_create([
+            GameRole(game=game, name=f"Role {i}", order=i) for i in range(1, 6)
+        ])
+        users = User.objects.bulk_create([
+            User(username=f"bench-{suffix}-{i}", email=f"bench-{suffix}-{i}@example.com")
+            for i in range(user_count)
+        ])
+
+        words = ["chill", "ranked", "competitive", "casual", "mic", "eu", "na", "tryhard", "newbies", "duo"]
+        statuses = [Lobby.Status.SEARCHING] + [Lobby.Status.COMPLETED, Lobby.Status.CANCELLED] * 2
+        batch_size = 2000
+
+        for start in range(0, lobby_count, batch_size):
+            lobbies = Lobby.objects.bulk_create([
+                Lobby(
+                    title=f"Lobby {i}",
+                    description=" ".join(random.sample(words, 3)),
+                    game=game,
+                    host=random.choice(users),
+                    status=random.choice(statuses),
+                    is_public=random.random() > 0.1,
+                    size=5,
+                )
+                for i in range(start, min(start + batch_size, lobby_count))
+            ])
+
+            slots = []
+            for lobby in lobbies:
+                players = random.sample(users, random.randint(1, 5))
+                for order in range(1, lobby.size + 1):
+                    slots.append(Slot(
+                        lobby=lobby,
+                        order=order,
+                        player=players[order - 1] if order <= len(players) else None,
+                        required_role=random.choice(roles + [None]),
+                    ))
+                lobby.filled_slots = len(players)
+                lobby.open_roles = summarize(
+                    slot.required_role_id for slot in slots[-lobby.size:] if slot.player is None
+                )
+
+            Slot.objects.bulk_create(slots)
+            Lobby.objects.bulk_update(lobbies, ["filled_slots", "open_roles"])
+
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE")
+
+        return game
+
+    def toggle_indexes(self, create: bool) -> None:
+        """
+        Drops or recreates the Meta indexes of Lobby and Slot.
+
+        Plain DDL statements are used instead of a schema editor context,
+        which SQLite refuses to open inside a transaction. Deferred foreign
+        key checks of the seeded rows are run first, as PostgreSQL refuses
+        to alter a table with pending trigger events.
+        """
+        connection.check_constraints()
+        editor = connection.schema_editor()
+
+        with connection.cursor() as cursor:
+            for model in (Lobby, Slot):
+                for index in model._meta.indexes:
+                    if create:
+                        cursor.execute(str(index.create_sql(model, editor)))
+                    else:
+                        cursor.execute(str(index.remove_sql(model, editor)))
+
+    def queries(self, game: Game) -> Dict[str, QuerySet]:
+        factory = RequestFactory()
+        user = User.objects.filter(hosted_lobbies__game=game).first()
+        lobby = Lobby.objects.filter(game=game, status=Lobby.Status.SEARCHING).first()
+        role = game.roles.first()
+
+        def list_queryset(params: dict, viewer) -> QuerySet:
+            request = factory.get("/", params)
+            request.user = viewer
+            view = LobbyListView()
+            view.setup(request, game_slug=game.slug)
+            queryset = view.get_queryset()
+            if view.search_terms:
+                return queryset.order_by(*RankedPaginator.ordering)[:11]
+            return queryset.order_by("-created_at", "-id")[:11]
+
+        # The visibility filter as it was before the EXISTS rewrite, to compare plans.
+        legacy_visibility = Lobby.objects.filter(
+            Q(is_public=True) | Q(host=user) | Q(slots__player=user),
+            game=game,
+            status=Lobby.Status.SEARCHING
+        ).distinct().select_related("host", "game").order_by("-created_at", "-id")[:11]
+
+        return {
+            "list (anonymous)": list_queryset({}, AnonymousUser()),
+            "list (authenticated)": list_queryset({}, user),
+            "list (authenticated, join + DISTINCT)": legacy_visibility,
+            "list (authenticated, role filter)": list_queryset({"role": role.id}, user),
+            "list (role filter)": list_queryset({"role": role.id}, AnonymousUser()),
+            "list (available only)": list_queryset({"available_only": "on"}, AnonymousUser()),
+            "list (search)": list_queryset({"q": "chill mic"}, AnonymousUser()),
+            "detail (lobby)": Lobby.objects.select_related("host", "game").filter(invite_link=lobby.invite_link),
+            "detail (slots)": Slot.objects.filter(lobby=lobby).order_by("order"),
+        }
+
+    def report(self, label: str, game: Game, repeat: int) -> None:
+        self.stdout.write(self.style.MIGRATE_HEADING(f"\n=== {label} ==="))
+
+        for name, queryset in self.queries(game).items():
+            timings = []
+            for _ in range(repeat):
+                started = time.perf_counter()
+                list(queryset.all())
+                timings.append((time.perf_counter() - started) * 1000)
+
+            self.stdout.write(self.style.SUCCESS(f"\n{name}: {min(timings):.2f} ms (best of {repeat})"))
+            self.stdout.write(queryset.explain())
@@ -0,0 +1,100 @@
+import csv
+import gzip
+import json
+from typing import Iterator, TextIO
+
+from django.core.management.base import BaseCommand, CommandError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections
+from django.db.models import QuerySet
+from django.utils.dateparse import parse_datetime
+
+from lobbies.models import LobbyEvent
+
+FIELDS = ["id", "created_at", "kind", "lobby_id", "game_id", "user_id", "data"]
+
+
+class Command(BaseCommand):
+    help = 'Streams the lobby event log to a (gzip-compressed) CSV or JSON Lines file.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "output",
+            help="File to write; a name ending in .gz is gzip-compressed, '-' writes to stdout."
+        )
+        parser.add_argument("--format", choices=("csv", "jsonl"), default="csv", help="Output format.")
+        parser.add_argument("--since", help="Only export events at or after this ISO datetime.")
+        parser.add_argument("--until", help="Only export events before this ISO datetime.")
+        parser.add_argument("--game", help="Only export events of lobbies of the game with this slug.")
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=5000,
+            help="Rows fetched from the database per round trip."
+        )
+
+    def handle(self, *args, **options):
+        if options["chunk_size"] < 1:
+            raise CommandError(f"--chunk-size must be at least 1, got {options['chunk_size']}")
+
+        events = LobbyEvent.objects.order_by("id")
+
+        for option, lookup in (("since", "created_at__gte"), ("until", "created_at__lt")):
+            if options[option]:
+                value = parse_datetime(options[option])
+                if value is None:
+                    raise CommandError(f"--{option} is not an ISO datetime: {options[option]!r}")
+                events = events.filter(**{lookup: value})
+
+        if options["game"]:
+            events = events.filter(lobby__game__slug=options["game"])
+
+        rows = self.stream(events.values_list(*FIELDS[:4], "lobby__game_id", *FIELDS[5:]), options["chunk_size"])
+
+        if options["output"] == "-":
+            exported = self.write(rows, self.stdout, options["format"])
+        else:
+            opener = gzip.open if options["output"].endswith(".gz") else open
+            with opener(options["output"], "wt", encoding="utf-8", newline="") as output:
+                exported = self.write(rows, output, options["format"])
+
+            self.stdout.write(self.style.SUCCESS(f"Exported {exported} events to {options['output']}."))
+
+    def stream(self, events: QuerySet, chunk_size: int) -> Iterator[tuple]:
+        """
+        Yields every row while holding at most 'chunk_size' rows in memory.
+
+        iterator() reads through a server-side cursor on PostgreSQL. When
+        those are disabled (e.g. behind a transaction pooler), the driver
+        would buffer the whole result, so rows are paged by id instead.
+        """
+        connection = connections[events.db]
+        if not connection.settings_dict.get("DISABLE_SERVER_SIDE_CURSORS"):
+            yield from events.iterator(chunk_size=chunk_size)
+            return
+
+        last_id = 0
+        while True:
+            chunk = list(events.filter(id__gt=last_id)[:chunk_size])
+            yield from chunk
+            if len(chunk) < chunk_size:
+                return
+            last_id = chunk[-1][0]
+
+    def write(self, rows: Iterator[tuple], output: TextIO, output_format: str) -> int:
+        count = 0
+
+        if output_format == "csv":
+            writer = csv.writer(output)
+            writer.writerow(FIELDS)
+            for row in rows:
+                *values, data = row
+                writer.writerow([*values, json.dumps(data)])
+                count += 1
+            return count
+
+        encoder = DjangoJSONEncoder()
+        for row in rows:
+            output.write(encoder.encode(dict(zip(FIELDS, row))) + "\n")
+            count += 1
+        return count
@@ -0,0 +1,73 @@
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.utils import timezone
+
+from games.models import Game
+from lobbies.activity import flush_events, log_events, status_event
+from lobbies.caching import bump_list_version
+from lobbies.models import Lobby, LobbyTransition
+from lobbies.states import apply_transition
+
+
+class Command(BaseCommand):
+    help = 'Cancels SEARCHING lobbies that had no slot activity for longer than their game TTL.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Maximum number of lobbies cancelled per transaction."
+        )
+        parser.add_argument(
+            "--game",
+            help="Only reap lobbies of the game with this slug."
+        )
+
+    def handle(self, *args, **options):
+        games = Game.objects.all()
+        if options["game"]:
+            games = games.filter(slug=options["game"])
+
+        total = 0
+        for game in games:
+            reaped = self.reap_game(game, options["batch_size"])
+            if reaped:
+                bump_list_version(game.id)
+                self.stdout.write(f"{game.title}: cancelled {reaped} lobbies")
+            total += reaped
+
+        flush_events()
+        self.stdout.write(self.style.SUCCESS(f"Reaped {total} stale lobbies."))
+
+    def reap_game(self, game: Game, batch_size: int) -> int:
+        """
+        Cancels the stale lobbies of one game in bounded batches.
+
+        Rows locked by a concurrent join are skipped (where the database
+        supports SKIP LOCKED) and picked up by the next run instead of
+        blocking it.
+        """
+        cutoff = timezone.now() - game.lobby_ttl
+        reaped = 0
+
+        while True:
+            with transaction.atomic():
+                stale = Lobby.objects.filter(
+                    game=game,
+                    status=Lobby.Status.SEARCHING,
+                    updated_at__lt=cutoff
+                )
+                if connection.features.has_select_for_update_skip_locked:
+                    stale = stale.select_for_update(skip_locked=True)
+
+                batch = list(stale.order_by("updated_at").values_list("pk", flat=True)[:batch_size])
+                if not batch:
+                    return reaped
+
+                transition = apply_transition(batch, LobbyTransition.Trigger.EXPIRE)
+                reaped += transition.updated
+                log_events(*[status_event(change) for change in transition.changes])
+
+            if len(batch) < batch_size:
+                return reaped
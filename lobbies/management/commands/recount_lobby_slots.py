@@ -0,0 +1,76 @@
+from collections import defaultdict
+from typing import List
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count, F, IntegerField, OuterRef, QuerySet, Subquery
+from django.db.models.functions import Coalesce
+
+from lobbies.models import Lobby, Slot
+from lobbies.open_roles import summarize
+
+
+class Command(BaseCommand):
+    help = 'Repairs drift between Lobby.filled_slots / Lobby.open_roles and the actual slots.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--game",
+            help="Only recount lobbies of the game with this slug."
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report drifted lobbies without fixing them."
+        )
+
+    def handle(self, *args, **options):
+        filled = Slot.objects.filter(
+            lobby=OuterRef("pk"),
+            player__isnull=False
+        ).values("lobby").annotate(count=Count("id")).values("count")
+        actual_count = Coalesce(Subquery(filled), 0, output_field=IntegerField())
+
+        lobbies = Lobby.objects.all()
+        if options["game"]:
+            lobbies = lobbies.filter(game__slug=options["game"])
+
+        drifted = lobbies.annotate(
+            actual_count=actual_count
+        ).exclude(filled_slots=F("actual_count"))
+
+        summaries = self.drifted_summaries(lobbies)
+
+        if options["dry_run"]:
+            self.stdout.write(self.style.WARNING(f"{drifted.count()} lobbies have drifted counters."))
+            self.stdout.write(self.style.WARNING(f"{len(summaries)} lobbies have drifted open roles."))
+            return
+
+        with transaction.atomic():
+            updated = drifted.update(filled_slots=actual_count)
+            Lobby.objects.bulk_update(summaries, ["open_roles"], batch_size=500)
+
+        if not updated and not summaries:
+            self.stdout.write(self.style.SUCCESS("All slot counters are in sync."))
+            return
+
+        self.stdout.write(self.style.SUCCESS(f"Recounted {updated} lobbies."))
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt open roles of {len(summaries)} lobbies."))
+
+    def drifted_summaries(self, lobbies: QuerySet) -> List[Lobby]:
+        """
+        Returns unsaved lobbies carrying the rebuilt open_roles summary of
+        every lobby whose stored summary differs from its open slots.
+        """
+        open_slots = defaultdict(list)
+        rows = Slot.objects.filter(lobby__in=lobbies, player__isnull=True).values_list("lobby_id", "required_role_id")
+        for lobby_id, role_id in rows.iterator(chunk_size=2000):
+            open_slots[lobby_id].append(role_id)
+
+        drifted = []
+        for lobby_id, stored in lobbies.values_list("pk", "open_roles").iterator(chunk_size=2000):
+            actual = summarize(open_slots.get(lobby_id, ()))
+            if stored != actual:
+                drifted.append(Lobby(pk=lobby_id, open_roles=actual))
+
+        return drifted
@@ -0,0 +1,35 @@
+# Generated by Django 4.2.27 on 2026-10-17 19:47
+
+from django.db import migrations, models
+from django.db.models import Count, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_filled_slots(apps, schema_editor):
+    Lobby = apps.get_model("lobbies", "Lobby")
+    Slot = apps.get_model("lobbies", "Slot")
+
+    filled = Slot.objects.filter(
+        lobby=OuterRef("pk"),
+        player__isnull=False
+    ).values("lobby").annotate(count=Count("id")).values("count")
+
+    Lobby.objects.update(
+        filled_slots=Coalesce(Subquery(filled), 0, output_field=IntegerField())
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lobbies', '0003_lobby_communication_link'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='lobby',
+            name='filled_slots',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Denormalized number of occupied slots, kept in sync on every slot change.'),
+        ),
+        migrations.RunPython(backfill_filled_slots, migrations.RunPython.noop),
+    ]
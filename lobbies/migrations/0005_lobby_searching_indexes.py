@@ -0,0 +1,21 @@
+# Generated by Django 4.2.27 on 2026-10-17 19:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lobbies', '0004_lobby_filled_slots'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='lobby',
+            index=models.Index(condition=models.Q(('status', 'SE')), fields=['game', '-created_at'], name='lobby_searching_list_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='lobby',
+            index=models.Index(condition=models.Q(('status', 'SE')), fields=['game', 'updated_at'], name='lobby_searching_stale_idx'),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 4.2.27 on 2026-10-17 19:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lobbies', '0005_lobby_searching_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='lobby',
+            name='lobby_searching_list_idx',
+        ),
+        migrations.AddIndex(
+            model_name='lobby',
+            index=models.Index(condition=models.Q(('status', 'SE')), fields=['game', '-created_at', '-id'], name='lobby_searching_list_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='slot',
+            index=models.Index(condition=models.Q(('player__isnull', True)), fields=['lobby', 'required_role'], name='slot_open_role_idx'),
+        ),
+    ]
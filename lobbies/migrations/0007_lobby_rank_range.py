@@ -0,0 +1,27 @@
+# Generated by Django 4.2.27 on 2026-10-17 20:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lobbies', '0006_lobby_hot_path_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='lobby',
+            name='max_rank',
+            field=models.PositiveSmallIntegerField(default=32767, help_text='Highest accepted ladder value (see GameRank).'),
+        ),
+        migrations.AddField(
+            model_name='lobby',
+            name='min_rank',
+            field=models.PositiveSmallIntegerField(default=0, help_text='Lowest accepted ladder value (see GameRank).'),
+        ),
+        migrations.AddIndex(
+            model_name='lobby',
+            index=models.Index(condition=models.Q(('status', 'SE')), fields=['game', 'min_rank', 'max_rank'], name='lobby_searching_rank_idx'),
+        ),
+    ]
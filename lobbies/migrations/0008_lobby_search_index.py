@@ -0,0 +1,24 @@
+from django.db import migrations
+
+from lobbies.search import install_search_index, uninstall_search_index
+
+
+def forwards(apps, schema_editor):
+    install_search_index(schema_editor, apps.get_model("lobbies", "Lobby"))
+
+
+def backwards(apps, schema_editor):
+    uninstall_search_index(schema_editor, apps.get_model("lobbies", "Lobby"))
+
+
+# Full-text search over title and description: a GIN index on PostgreSQL,
+# an FTS5 table kept in sync by triggers on SQLite.
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("lobbies", "0007_lobby_rank_range"),
+    ]
+
+    operations = [
+        migrations.RunPython(forwards, backwards),
+    ]
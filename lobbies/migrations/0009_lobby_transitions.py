@@ -0,0 +1,38 @@
+# Generated by Django 4.2.27 on 2026-10-17 20:34
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lobbies', '0008_lobby_search_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='lobby',
+            name='previous_status',
+            field=models.CharField(blank=True, choices=[('SE', 'Searching'), ('IP', 'In progress'), ('CO', 'Completed'), ('CA', 'Canceled')], editable=False, help_text='Status before the last transition (see lobbies.states).', max_length=2),
+        ),
+        migrations.AddField(
+            model_name='lobby',
+            name='status_changed_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.CreateModel(
+            name='LobbyTransition',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('from_status', models.CharField(choices=[('SE', 'Searching'), ('IP', 'In progress'), ('CO', 'Completed'), ('CA', 'Canceled')], max_length=2)),
+                ('to_status', models.CharField(choices=[('SE', 'Searching'), ('IP', 'In progress'), ('CO', 'Completed'), ('CA', 'Canceled')], max_length=2)),
+                ('trigger', models.CharField(choices=[('join', 'Player joined'), ('leave', 'Player left'), ('kick', 'Player kicked'), ('match', 'Matchmaker filled slots'), ('close', 'Closed by host'), ('expire', 'Expired')], max_length=10)),
+                ('created_at', models.DateTimeField()),
+                ('lobby', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='transitions', to='lobbies.lobby')),
+            ],
+            options={
+                'ordering': ['lobby', 'created_at', 'id'],
+            },
+        ),
+    ]
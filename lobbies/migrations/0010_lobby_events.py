@@ -0,0 +1,32 @@
+# Generated by Django 4.2.27 on 2026-10-17 20:41
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('lobbies', '0009_lobby_transitions'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LobbyEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('created', 'Created'), ('joined', 'Joined'), ('left', 'Left'), ('kicked', 'Kicked'), ('privacy', 'Privacy changed'), ('status', 'Status changed')], max_length=10)),
+                ('data', models.JSONField(blank=True, default=dict)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('lobby', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='events', to='lobbies.lobby')),
+                ('user', models.ForeignKey(blank=True, help_text='Player the event is about (the kicked player for kicks).', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['id'],
+                'indexes': [models.Index(fields=['created_at'], name='lobby_event_created_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,52 @@
+from collections import defaultdict
+
+from django.contrib.postgres.indexes import GinIndex
+from django.db import migrations, models
+
+from lobbies.open_roles import summarize
+
+# Backs the open_roles key lookup (?|) of the role filter on PostgreSQL.
+OPEN_ROLES_INDEX = GinIndex(
+    fields=["open_roles"],
+    condition=models.Q(status="SE"),
+    name="lobby_searching_roles_idx",
+)
+
+
+def fill_open_roles(apps, schema_editor):
+    Lobby = apps.get_model("lobbies", "Lobby")
+    Slot = apps.get_model("lobbies", "Slot")
+
+    open_slots = defaultdict(list)
+    for lobby_id, role_id in Slot.objects.filter(player__isnull=True).values_list("lobby_id", "required_role_id"):
+        open_slots[lobby_id].append(role_id)
+
+    lobbies = [Lobby(pk=lobby_id, open_roles=summarize(role_ids)) for lobby_id, role_ids in open_slots.items()]
+    Lobby.objects.bulk_update(lobbies, ["open_roles"], batch_size=500)
+
+
+def add_index(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.add_index(apps.get_model("lobbies", "Lobby"), OPEN_ROLES_INDEX)
+
+
+def remove_index(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.remove_index(apps.get_model("lobbies", "Lobby"), OPEN_ROLES_INDEX)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lobbies', '0010_lobby_events'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='lobby',
+            name='open_roles',
+            field=models.JSONField(blank=True, default=dict, editable=False, help_text="Open slots per required role id ('any' for flex slots), kept in sync on every slot change."),
+        ),
+        migrations.RunPython(fill_open_roles, migrations.RunPython.noop),
+        migrations.RunPython(add_index, remove_index),
+    ]
@@ -1,11 +1,15 @@
 import uuid
-from typing import Any, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from django.conf import settings
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.db import models, transaction
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
+from lobbies.caching import bump_list_version
+from lobbies.open_roles import role_key, shift_counts, summarize
+
 
 class Lobby(models.Model):
     """
@@ -27,12 +31,52 @@ class Lobby(models.Model):
         default=Status.SEARCHING,
     )
 
+    previous_status = models.CharField(
+        max_length=2,
+        choices=Status.choices,
+        blank=True,
+        editable=False,
+        help_text="Status before the last transition (see lobbies.states)."
+    )
+
+    status_changed_at = models.DateTimeField(null=True, blank=True, editable=False)
+
     title = models.CharField(max_length=200)
     description = models.TextField(max_length=500, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     is_public = models.BooleanField(default=True)
 
+    filled_slots = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        help_text="Denormalized number of occupied slots, kept in sync on every slot change."
+    )
+
+    open_roles = models.JSONField(
+        default=dict,
+        blank=True,
+        editable=False,
+        help_text="Open slots per required role id ('any' for flex slots), kept in sync on every slot change."
+    )
+
+    # Fields only ever changed by the conditional UPDATEs of lobbies.states.
+    TRANSITION_FIELDS = ("filled_slots", "open_roles", "previous_status", "status_changed_at")
+
+    # Bounds of an open rank range; a lobby with both accepts every player.
+    ANY_MIN_RANK = 0
+    ANY_MAX_RANK = 32767
+
+    min_rank = models.PositiveSmallIntegerField(
+        default=ANY_MIN_RANK,
+        help_text="Lowest accepted ladder value (see GameRank)."
+    )
+
+    max_rank = models.PositiveSmallIntegerField(
+        default=ANY_MAX_RANK,
+        help_text="Highest accepted ladder value (see GameRank)."
+    )
+
     size = models.PositiveIntegerField(
         default=5,
         validators=[
@@ -69,39 +113,191 @@ class Lobby(models.Model):
         verbose_name = "Lobby"
         verbose_name_plural = "Lobbies"
         ordering = ["-created_at"]
+        indexes = [
+            # Partial indexes stay as small as the set of live (SEARCHING) lobbies.
+            models.Index(
+                fields=["game", "-created_at", "-id"],
+                condition=models.Q(status="SE"),
+                name="lobby_searching_list_idx"
+            ),
+            models.Index(
+                fields=["game", "updated_at"],
+                condition=models.Q(status="SE"),
+                name="lobby_searching_stale_idx"
+            ),
+            models.Index(
+                fields=["game", "min_rank", "max_rank"],
+                condition=models.Q(status="SE"),
+                name="lobby_searching_rank_idx"
+            ),
+        ]
+
+    # Status change (lobbies.states.StatusChange) recorded by the last
+    # transition applied through this instance; None if it left the status.
+    status_change = None
 
     def __str__(self) -> str:
         return f"{self.title} ({self.game.title})"
 
-    def save(self, *args, **kwargs) -> None:
+    def save(
+        self,
+        *args,
+        host_role: Any = None,
+        needed_roles: Iterable[Any] = (),
+        **kwargs
+    ) -> None:
         """
         Saves the lobby and triggers slot generation for new instances.
 
         Uses an atomic transaction to ensure that a lobby is never created
-        without its corresponding slots.
+        without its corresponding slots. Once committed, the cached lobby
+        list of the game is invalidated.
+
+        Args:
+            host_role (GameRole): Role of the host's slot. Only used on creation.
+            needed_roles (Iterable[GameRole]): Roles reserved for the following
+                slots, in order. Only used on creation.
         """
         is_new = self.pk is None
+
+        if is_new:
+            # The host always takes the first slot, so the counters and status
+            # are final before the INSERT and no follow-up UPDATE is needed.
+            slot_roles = self._slot_roles(host_role, needed_roles)
+            self.filled_slots = 1
+            self.open_roles = summarize(role.pk if role else None for role in slot_roles[1:])
+            if self.status == self.Status.SEARCHING and self.size <= 1:
+                self.status = self.Status.IN_PROGRESS
+
+        elif kwargs.get("update_fields") is None:
+            # The slot counter and the transition bookkeeping are only ever
+            # changed by conditional UPDATEs (see lobbies.states), so a full
+            # save from a possibly stale instance must never overwrite them.
+            kwargs["update_fields"] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in self.TRANSITION_FIELDS
+            ]
+
         with transaction.atomic():
             super().save(*args, **kwargs)
 
             if is_new:
-                self._create_slots()
+                self._create_slots(slot_roles)
+
+            game_id = self.game_id
+            transaction.on_commit(lambda: bump_list_version(game_id))
+
+    def _slot_roles(self, host_role: Any = None, needed_roles: Iterable[Any] = ()) -> List[Any]:
+        """
+        Returns the required role of every slot, in order.
+
+        The first slot is the host's with their role; the next slots are
+        reserved for 'needed_roles' in order, the rest accept any role.
+        """
+        roles = [host_role, *needed_roles][:self.size]
+        return roles + [None] * (self.size - len(roles))
 
-    def _create_slots(self) -> None:
+    def _create_slots(self, slot_roles: List[Any]) -> None:
         """
-        Generates empty slots and assigns the first one to the host.
-        Uses bulk_create for database performance optimization.
+        Generates all slots in memory and persists them with a single bulk_create.
         """
-        slots = []
+        slots = [
+            Slot(lobby=self, order=i, required_role=role)
+            for i, role in enumerate(slot_roles, start=1)
+        ]
 
-        for i in range(1, self.size + 1):
-            slots.append(Slot(lobby=self, order=i))
+        slots[0].player = self.host
+        slots[0].joined_at = timezone.now()
 
         Slot.objects.bulk_create(slots)
 
-        first_slot = self.slots.get(order=1)
-        first_slot.player = self.host
-        first_slot.save()
+    def shift_filled_slots(
+        self,
+        delta: int,
+        trigger: Any = None,
+        open_roles: Optional[Dict[str, int]] = None
+    ) -> None:
+        """
+        Atomically adjusts the occupied slot counter by 'delta'.
+
+        Runs a single UPDATE with F() expressions, so concurrent joins and
+        leaves never lose increments. The resulting status transition (a
+        full lobby starts, a running one that loses a player reopens) is
+        folded into the same statement instead of re-counting slots, and
+        'updated_at' records the slot activity used for lobby expiry.
+
+        Args:
+            trigger (LobbyTransition.Trigger): Cause recorded for a status
+                change. Defaults to JOIN or LEAVE depending on 'delta'.
+            open_roles (dict): Shift of the open_roles summary, e.g.
+                {"3": -1} when a slot needing role 3 is filled.
+        """
+        if not delta:
+            return
+
+        trigger = trigger or LobbyTransition.Trigger.for_delta(delta)
+        transition = Lobby.shift_filled_slots_of([self.pk], delta, trigger, open_roles)
+
+        self._follow(transition)
+        self.filled_slots += delta
+        self.open_roles = shift_counts(self.open_roles, open_roles or {})
+
+    @classmethod
+    def shift_filled_slots_of(
+        cls,
+        lobby_ids: Iterable[int],
+        delta: int,
+        trigger: Any = None,
+        open_roles: Optional[Dict[str, int]] = None
+    ) -> Any:
+        """
+        Applies shift_filled_slots to many lobbies with one UPDATE.
+
+        Used by batch writers (e.g. the matchmaker) that change the same
+        slots in several lobbies. Returns the lobbies.states.Transition.
+        """
+        from lobbies.states import apply_transition
+
+        trigger = trigger or LobbyTransition.Trigger.for_delta(delta)
+        return apply_transition(lobby_ids, trigger, delta, open_roles)
+
+    def close(self) -> bool:
+        """
+        Ends the lobby: a searching lobby is cancelled, a running one completed.
+
+        The lobby and its slots are kept, so the transition stays on record.
+
+        Returns:
+            bool: False if the lobby had already ended.
+        """
+        from lobbies.states import apply_transition
+
+        transition = apply_transition([self.pk], LobbyTransition.Trigger.CLOSE)
+        self._follow(transition)
+        if not transition.updated:
+            return False
+
+        game_id = self.game_id
+        transaction.on_commit(lambda: bump_list_version(game_id))
+        return True
+
+    def _follow(self, transition: Any) -> None:
+        """
+        Applies a lobbies.states.Transition of this lobby to the instance.
+
+        The status is taken from the recorded change rather than derived from
+        the loaded values, which may be stale when the row was not locked.
+        """
+        self.status_change = next(
+            (change for change in transition.changes if change.lobby_id == self.pk),
+            None
+        )
+        if transition.updated:
+            self.updated_at = transition.changed_at
+        if self.status_change:
+            self.previous_status = self.status_change.from_status
+            self.status = self.status_change.to_status
+            self.status_changed_at = transition.changed_at
 
     def get_invite_url(self) -> str:
         return f"/lobbies/join/{self.invite_link}/"
@@ -126,11 +322,25 @@ class Lobby(models.Model):
         """
         Returns the number of slots currently occupied by players.
         """
-        return self.slots.filter(player__isnull=False).count()
+        return self.filled_slots
 
     @property
     def is_full(self) -> bool:
-        return self.filled_count >= self.size
+        return self.filled_slots >= self.size
+
+    @property
+    def has_rank_range(self) -> bool:
+        return self.min_rank != self.ANY_MIN_RANK or self.max_rank != self.ANY_MAX_RANK
+
+    def accepts_rank(self, rank_value: Optional[int]) -> bool:
+        """
+        Checks a player's ladder value against the rank range.
+
+        Unranked players (no ladder value) only fit lobbies without a range.
+        """
+        if rank_value is None:
+            return not self.has_rank_range
+        return self.min_rank <= rank_value <= self.max_rank
 
 
 class Slot(models.Model):
@@ -171,28 +381,104 @@ class Slot(models.Model):
             models.UniqueConstraint(fields=["lobby", "order"], name="unique_slot_positions"),
             models.UniqueConstraint(fields=["lobby", "player"], name="unique_player_per_lobby"),
         ]
+        indexes = [
+            # Open slots only: backs the role filter of the lobby list.
+            models.Index(
+                fields=["lobby", "required_role"],
+                condition=models.Q(player__isnull=True),
+                name="slot_open_role_idx"
+            ),
+        ]
+
+    # Player assigned when the row was loaded; used to compute counter deltas.
+    _loaded_player_id = None
+
+    @classmethod
+    def from_db(cls, db, field_names, values) -> "Slot":
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_player_id = instance.__dict__.get("player_id")
+        return instance
 
     def __str__(self) -> str:
         role_str = self.required_role.name if self.required_role else "Any"
         player_str = self.player.username if self.player else "Empty"
         return f"Slot {self.order}: {player_str} ({role_str})"
 
-    def save(self, *args, **kwargs) -> None:
-        """
-        Auto-updates 'joined_at' timestamp and checks Lobby fullness status.
+    def save(self, *args, trigger: Any = None, **kwargs) -> None:
         """
-        from django.utils import timezone
+        Auto-updates 'joined_at' timestamp and keeps the Lobby slot counter in sync.
 
+        The counter is shifted by the difference between the player loaded
+        from the database and the one being saved, so no aggregate query runs.
+
+        Args:
+            trigger (LobbyTransition.Trigger): Cause recorded if the lobby
+                status changes (e.g. KICK). Defaults to JOIN or LEAVE.
+        """
         if self.player and not self.joined_at:
             self.joined_at = timezone.now()
         elif not self.player:
             self.joined_at = None
 
-        super().save(*args, **kwargs)
+        delta = int(self.player_id is not None) - int(self._loaded_player_id is not None)
+
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+
+            if delta:
+                self.lobby.shift_filled_slots(delta, trigger, {role_key(self.required_role_id): -delta})
+
+            game_id = self.lobby.game_id
+            transaction.on_commit(lambda: bump_list_version(game_id))
+
+        self._loaded_player_id = self.player_id
+
+    def claim(self, player: Any) -> bool:
+        """
+        Seats 'player' in this slot without taking row locks.
+
+        A single conditional UPDATE only succeeds while the slot is empty and
+        the lobby is still searching; the counter and the status transition
+        follow with the conditional update of shift_filled_slots. Concurrent
+        joins never wait on a lock held across other queries: the loser of a
+        race simply updates no row.
+
+        Returns:
+            bool: False if the slot was taken or the lobby closed meanwhile.
+
+        Raises:
+            IntegrityError: If 'player' already occupies another slot of the
+                lobby ('unique_player_per_lobby').
+        """
+        now = timezone.now()
 
-        if self.lobby.status == Lobby.Status.SEARCHING and self.lobby.is_full:
-            self.lobby.status = Lobby.Status.IN_PROGRESS
-            self.lobby.save(update_fields=["status"])
+        with transaction.atomic():
+            # 'player IS NULL' must stay in the outer WHERE of the UPDATE: a
+            # join on the lobby makes Django wrap the filter in 'id IN
+            # (SELECT ...)', whose snapshot PostgreSQL does not re-check after
+            # waiting on the row lock, so two racers would both succeed.
+            claimed = Slot.objects.filter(
+                pk=self.pk,
+                player__isnull=True,
+                lobby__in=Lobby.objects.filter(pk=self.lobby_id, status=Lobby.Status.SEARCHING)
+            ).update(player=player, joined_at=now)
+
+            if not claimed:
+                return False
+
+            self.lobby.shift_filled_slots(
+                1,
+                LobbyTransition.Trigger.JOIN,
+                {role_key(self.required_role_id): -1}
+            )
+
+            game_id = self.lobby.game_id
+            transaction.on_commit(lambda: bump_list_version(game_id))
+
+        self.player = player
+        self.joined_at = now
+        self._loaded_player_id = self.player_id
+        return True
 
     @property
     def is_filled(self) -> bool:
@@ -209,3 +495,88 @@ class Slot(models.Model):
     @property
     def role_icon(self) -> str:
         return self.required_role.icon_class if self.required_role else "fa-solid fa-users"
+
+
+class LobbyTransition(models.Model):
+    """
+    Append-only record of a Lobby status change.
+
+    Rows are written by lobbies.states in the same transaction as the
+    change itself and are never updated.
+    """
+
+    class Trigger(models.TextChoices):
+        JOIN = "join", _("Player joined")
+        LEAVE = "leave", _("Player left")
+        KICK = "kick", _("Player kicked")
+        MATCH = "match", _("Matchmaker filled slots")
+        CLOSE = "close", _("Closed by host")
+        EXPIRE = "expire", _("Expired")
+
+        @classmethod
+        def for_delta(cls, delta: int) -> "LobbyTransition.Trigger":
+            """Default trigger of a slot change."""
+            return cls.JOIN if delta > 0 else cls.LEAVE
+
+    lobby = models.ForeignKey(
+        Lobby,
+        on_delete=models.CASCADE,
+        related_name="transitions"
+    )
+
+    from_status = models.CharField(max_length=2, choices=Lobby.Status.choices)
+    to_status = models.CharField(max_length=2, choices=Lobby.Status.choices)
+    trigger = models.CharField(max_length=10, choices=Trigger.choices)
+    created_at = models.DateTimeField()
+
+    class Meta:
+        ordering = ["lobby", "created_at", "id"]
+
+    def __str__(self) -> str:
+        return f"{self.get_from_status_display()} -> {self.get_to_status_display()} ({self.trigger})"
+
+
+class LobbyEvent(models.Model):
+    """
+    Append-only activity log of a lobby, kept for analytics exports.
+
+    Unlike Slot.joined_at, which is cleared on leave, every join, leave and
+    kick stays on record. Rows are buffered and bulk inserted by
+    lobbies.activity and are never updated.
+    """
+
+    class Kind(models.TextChoices):
+        CREATED = "created", _("Created")
+        JOINED = "joined", _("Joined")
+        LEFT = "left", _("Left")
+        KICKED = "kicked", _("Kicked")
+        PRIVACY_CHANGED = "privacy", _("Privacy changed")
+        STATUS_CHANGED = "status", _("Status changed")
+
+    lobby = models.ForeignKey(
+        Lobby,
+        on_delete=models.CASCADE,
+        related_name="events"
+    )
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+",
+        help_text="Player the event is about (the kicked player for kicks)."
+    )
+
+    kind = models.CharField(max_length=10, choices=Kind.choices)
+    data = models.JSONField(default=dict, blank=True)
+    created_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        ordering = ["id"]
+        indexes = [
+            models.Index(fields=["created_at"], name="lobby_event_created_idx"),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.get_kind_display()} ({self.lobby_id})"
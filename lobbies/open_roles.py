@@ -0,0 +1,100 @@
+"""
+Denormalized summary of the open slots of a lobby.
+
+Lobby.open_roles maps the role of every open slot to the number of open
+slots needing it, e.g. {"3": 2, "any": 1}. Roles are stored as JSON object
+keys, so the role filter of the lobby list is a key lookup on the lobby
+row, and the counts are shifted in the same UPDATE as the slot counter
+(see lobbies.states).
+"""
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional
+
+from django.db import NotSupportedError
+from django.db.models import F, Func, JSONField, Q
+
+# Key of slots that accept any role.
+ANY_ROLE = "any"
+
+
+def role_key(role_id: Optional[int]) -> str:
+    return ANY_ROLE if role_id is None else str(role_id)
+
+
+def summarize(role_ids: Iterable[Optional[int]]) -> Dict[str, int]:
+    """Builds the summary from the required role ids of the open slots."""
+    return dict(Counter(role_key(role_id) for role_id in role_ids))
+
+
+def shift_counts(counts: Dict[str, int], deltas: Dict[str, int]) -> Dict[str, int]:
+    """Python mirror of ShiftCounts, for in-memory instances."""
+    shifted = dict(counts)
+    for key, delta in deltas.items():
+        value = shifted.get(key, 0) + delta
+        if value:
+            shifted[key] = value
+        else:
+            shifted.pop(key, None)
+    return shifted
+
+
+def open_role_filter(role_id: Any) -> Q:
+    """Lobbies with an open slot for 'role_id', counting slots open to any role."""
+    return Q(open_roles__has_any_keys=[role_key(role_id), ANY_ROLE])
+
+
+def expand(counts: Dict[str, int], roles: Dict[int, Any]) -> List[Any]:
+    """
+    Lists one entry per open slot for rendering: the GameRole, or None for
+    slots open to any role. Roles keep the game's order, flex slots come last.
+    """
+    open_roles = []
+    for role_id, role in roles.items():
+        open_roles += [role] * counts.get(role_key(role_id), 0)
+    return open_roles + [None] * counts.get(ANY_ROLE, 0)
+
+
+class ShiftCounts(Func):
+    """
+    Adds 'deltas' to the counts stored in a JSON object column.
+
+    Keys reaching zero are dropped. Every count is read from the row being
+    updated, so concurrent shifts compose like F() increments, and each
+    key references the column once, so the SQL stays linear in the
+    number of keys.
+    """
+    output_field = JSONField()
+
+    def __init__(self, field: str, deltas: Dict[str, int]) -> None:
+        super().__init__(F(field))
+        self.deltas = deltas
+
+    def as_sql(self, compiler: Any, connection: Any, **extra_context: Any) -> Any:
+        raise NotSupportedError(f"ShiftCounts is not implemented for {connection.vendor}.")
+
+    def _compile(self, compiler: Any, connection: Any, template: str, pair: str, path: Any) -> Any:
+        column, column_params = compiler.compile(self.source_expressions[0])
+        pairs, params = [], []
+
+        for key, delta in self.deltas.items():
+            pairs.append(pair.format(column=column))
+            params += [key, *column_params, path(key), delta]
+
+        return template.format(column=column, pairs=", ".join(pairs)), [*column_params, *params]
+
+    def as_sqlite(self, compiler: Any, connection: Any, **extra_context: Any) -> Any:
+        # JSON_PATCH removes the keys that are set to null.
+        return self._compile(
+            compiler, connection,
+            template="JSON_PATCH({column}, JSON_OBJECT({pairs}))",
+            pair="%s, NULLIF(COALESCE(JSON_EXTRACT({column}, %s), 0) + %s, 0)",
+            path=lambda key: f'$."{key}"'
+        )
+
+    def as_postgresql(self, compiler: Any, connection: Any, **extra_context: Any) -> Any:
+        return self._compile(
+            compiler, connection,
+            template="JSONB_STRIP_NULLS({column} || JSONB_BUILD_OBJECT({pairs}))",
+            pair="%s::text, NULLIF(COALESCE(({column} ->> %s)::integer, 0) + %s, 0)",
+            path=lambda key: key
+        )
@@ -0,0 +1,178 @@
+import base64
+import binascii
+from datetime import datetime
+from typing import Any, Iterator, List, Optional, Tuple
+
+from django.db.models import Model, Q, QuerySet
+
+
+class InvalidCursor(ValueError):
+    """Raised when a cursor token cannot be decoded."""
+
+
+class CursorPage:
+    """
+    A single page of results produced by CursorPaginator.
+
+    Unlike Django's Page, it knows nothing about the total number of
+    objects; it only carries opaque tokens for its neighbours.
+    """
+
+    def __init__(
+        self,
+        object_list: List[Model],
+        next_cursor: Optional[str],
+        previous_cursor: Optional[str]
+    ) -> None:
+        self.object_list = object_list
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def __iter__(self) -> Iterator[Model]:
+        return iter(self.object_list)
+
+    def __len__(self) -> int:
+        return len(self.object_list)
+
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+    def has_previous(self) -> bool:
+        return self.previous_cursor is not None
+
+    def has_other_pages(self) -> bool:
+        return self.has_next() or self.has_previous()
+
+
+class CursorPaginator:
+    """
+    Keyset paginator over a queryset ordered by ("-created_at", "-id").
+
+    Each page is fetched with a range predicate on the last seen
+    (created_at, id) pair instead of OFFSET, and no COUNT query is issued,
+    so deep pages cost the same as the first one.
+    """
+    NEXT = "n"
+    PREVIOUS = "p"
+
+    def __init__(self, queryset: QuerySet, per_page: int) -> None:
+        self.queryset = queryset
+        self.per_page = per_page
+
+    def page(self, cursor: Optional[str] = None) -> CursorPage:
+        """
+        Returns the page following (or preceding) the given cursor token.
+
+        Raises:
+            InvalidCursor: If the token is malformed.
+        """
+        if not cursor:
+            rows = list(self.queryset.order_by("-created_at", "-id")[:self.per_page + 1])
+            return self._build_page(rows, came_from_cursor=False)
+
+        direction, created_at, pk = self.decode_cursor(cursor)
+
+        if direction == self.NEXT:
+            rows = list(
+                self.queryset.filter(
+                    Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=pk)
+                ).order_by("-created_at", "-id")[:self.per_page + 1]
+            )
+            return self._build_page(rows, came_from_cursor=True)
+
+        rows = list(
+            self.queryset.filter(
+                Q(created_at__gt=created_at) | Q(created_at=created_at, id__gt=pk)
+            ).order_by("created_at", "id")[:self.per_page + 1]
+        )
+        has_previous = len(rows) > self.per_page
+        rows = rows[:self.per_page][::-1]
+
+        return CursorPage(
+            rows,
+            next_cursor=self.encode_cursor(self.NEXT, rows[-1]) if rows else None,
+            previous_cursor=self.encode_cursor(self.PREVIOUS, rows[0]) if has_previous else None
+        )
+
+    def _build_page(self, rows: List[Model], came_from_cursor: bool) -> CursorPage:
+        has_next = len(rows) > self.per_page
+        rows = rows[:self.per_page]
+
+        return CursorPage(
+            rows,
+            next_cursor=self.encode_cursor(self.NEXT, rows[-1]) if has_next else None,
+            previous_cursor=self.encode_cursor(self.PREVIOUS, rows[0]) if came_from_cursor and rows else None
+        )
+
+    @staticmethod
+    def encode_cursor(direction: str, obj: Any) -> str:
+        """Encodes the keyset of a model instance or a '.values()' row."""
+        if isinstance(obj, dict):
+            created_at, pk = obj["created_at"], obj["id"]
+        else:
+            created_at, pk = obj.created_at, obj.pk
+
+        raw = f"{direction}|{created_at.isoformat()}|{pk}"
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+    @classmethod
+    def decode_cursor(cls, cursor: str) -> Tuple[str, datetime, int]:
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            direction, created_at, pk = base64.urlsafe_b64decode(padded).decode().split("|")
+            if direction not in (cls.NEXT, cls.PREVIOUS):
+                raise ValueError(direction)
+            return direction, datetime.fromisoformat(created_at), int(pk)
+        except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+            raise InvalidCursor(cursor) from exc
+
+
+class RankedPaginator:
+    """
+    Paginator over search results ordered by relevance ("search_rank").
+
+    Relevance is not a stable keyset, so pages are addressed by offset,
+    wrapped in the same opaque cursor tokens as CursorPaginator.
+    """
+    OFFSET = "o"
+    ordering = ("-search_rank", "-created_at", "-id")
+
+    def __init__(self, queryset: QuerySet, per_page: int) -> None:
+        self.queryset = queryset
+        self.per_page = per_page
+
+    def page(self, cursor: Optional[str] = None) -> CursorPage:
+        """
+        Returns the page starting at the offset carried by the cursor token.
+
+        Raises:
+            InvalidCursor: If the token is malformed.
+        """
+        offset = self.decode_cursor(cursor) if cursor else 0
+
+        rows = list(
+            self.queryset.order_by(*self.ordering)[offset:offset + self.per_page + 1]
+        )
+        has_next = len(rows) > self.per_page
+
+        return CursorPage(
+            rows[:self.per_page],
+            next_cursor=self.encode_cursor(offset + self.per_page) if has_next else None,
+            previous_cursor=self.encode_cursor(max(offset - self.per_page, 0)) if offset else None
+        )
+
+    @classmethod
+    def encode_cursor(cls, offset: int) -> str:
+        raw = f"{cls.OFFSET}|{offset}"
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+    @classmethod
+    def decode_cursor(cls, cursor: str) -> int:
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            kind, offset = base64.urlsafe_b64decode(padded).decode().split("|")
+            if kind != cls.OFFSET or int(offset) < 0:
+                raise ValueError(kind)
+            return int(offset)
+        except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+            raise InvalidCursor(cursor) from exc
@@ -0,0 +1,137 @@
+import re
+from typing import Any, List
+
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.db import connection
+from django.db.models import FloatField, Q, QuerySet, Value
+from django.db.models.expressions import RawSQL
+
+SEARCH_CONFIG = "simple"
+SEARCH_INDEX_NAME = "lobby_search_idx"
+FTS_TABLE = "lobbies_lobby_fts"
+MAX_TERMS = 8
+
+_SQLITE_TRIGGERS = {
+    f"{FTS_TABLE}_ai": f"""
+        CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON lobbies_lobby BEGIN
+            INSERT INTO {FTS_TABLE}(rowid, title, description) VALUES (new.id, new.title, new.description);
+        END
+    """,
+    f"{FTS_TABLE}_ad": f"""
+        CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON lobbies_lobby BEGIN
+            INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, description)
+            VALUES ('delete', old.id, old.title, old.description);
+        END
+    """,
+    f"{FTS_TABLE}_au": f"""
+        CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au AFTER UPDATE OF title, description ON lobbies_lobby BEGIN
+            INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, description)
+            VALUES ('delete', old.id, old.title, old.description);
+            INSERT INTO {FTS_TABLE}(rowid, title, description) VALUES (new.id, new.title, new.description);
+        END
+    """,
+}
+
+
+def search_terms(query: str) -> List[str]:
+    """
+    Splits a user query into lowercase word terms.
+
+    Only word characters survive, so the terms are safe to embed in the
+    FTS5 and tsquery syntaxes. At most MAX_TERMS terms are kept.
+    """
+    return re.findall(r"\w+", query.lower())[:MAX_TERMS]
+
+
+def search_document() -> SearchVector:
+    """The tsvector searched on PostgreSQL; the GIN index is built on this exact expression."""
+    return SearchVector("title", "description", config=SEARCH_CONFIG)
+
+
+def search_lobbies(queryset: QuerySet, terms: List[str]) -> QuerySet:
+    """
+    Narrows a lobby queryset to the lobbies matching every term (as a prefix).
+
+    Matches are annotated with 'search_rank' (higher is better). PostgreSQL
+    uses the GIN-indexed tsvector, SQLite the FTS5 shadow table; other
+    backends fall back to unindexed substring matching.
+    """
+    vendor = connection.vendor
+
+    if vendor == "postgresql":
+        query = SearchQuery(
+            " & ".join(f"{term}:*" for term in terms),
+            config=SEARCH_CONFIG,
+            search_type="raw"
+        )
+        return queryset.alias(
+            search_document=search_document()
+        ).filter(
+            search_document=query
+        ).annotate(
+            search_rank=SearchRank(search_document(), query)
+        )
+
+    if vendor == "sqlite":
+        match = " ".join(f'"{term}"*' for term in terms)
+        return queryset.filter(
+            id__in=RawSQL(f"SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s", [match])
+        ).annotate(
+            # FTS5's rank is bm25, where lower is better.
+            search_rank=RawSQL(
+                f"SELECT -rank FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s AND rowid = lobbies_lobby.id",
+                [match],
+                output_field=FloatField()
+            )
+        )
+
+    for term in terms:
+        queryset = queryset.filter(Q(title__icontains=term) | Q(description__icontains=term))
+    return queryset.annotate(search_rank=Value(0.0, output_field=FloatField()))
+
+
+def install_search_index(schema_editor: Any, model: Any) -> None:
+    """
+    Creates the search index of the current backend if it is missing.
+
+    On SQLite the FTS5 table is kept in sync by triggers on lobbies_lobby.
+    Django rebuilds SQLite tables when altering them, which drops those
+    triggers, so this also runs after every migrate and rebuilds the FTS
+    content whenever a trigger had to be recreated.
+    """
+    vendor = schema_editor.connection.vendor
+
+    if vendor == "postgresql":
+        with schema_editor.connection.cursor() as cursor:
+            indexes = schema_editor.connection.introspection.get_constraints(cursor, model._meta.db_table)
+        if SEARCH_INDEX_NAME not in indexes:
+            schema_editor.add_index(model, GinIndex(search_document(), name=SEARCH_INDEX_NAME))
+
+    elif vendor == "sqlite":
+        with schema_editor.connection.cursor() as cursor:
+            cursor.execute("SELECT name FROM sqlite_master WHERE type = 'trigger' AND name LIKE %s", [f"{FTS_TABLE}_%"])
+            existing = {row[0] for row in cursor.fetchall()}
+
+            cursor.execute(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+                "title, description, content='lobbies_lobby', content_rowid='id', "
+                "tokenize='unicode61 remove_diacritics 2')"
+            )
+            if existing != set(_SQLITE_TRIGGERS):
+                for sql in _SQLITE_TRIGGERS.values():
+                    cursor.execute(sql)
+                cursor.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')")
+
+
+def uninstall_search_index(schema_editor: Any, model: Any) -> None:
+    vendor = schema_editor.connection.vendor
+
+    if vendor == "postgresql":
+        schema_editor.remove_index(model, GinIndex(search_document(), name=SEARCH_INDEX_NAME))
+
+    elif vendor == "sqlite":
+        with schema_editor.connection.cursor() as cursor:
+            for name in _SQLITE_TRIGGERS:
+                cursor.execute(f"DROP TRIGGER IF EXISTS {name}")
+            cursor.execute(f"DROP TABLE IF EXISTS {FTS_TABLE}")
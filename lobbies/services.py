@@ -0,0 +1,26 @@
+from typing import Any, Iterable
+
+from lobbies.activity import log_events
+from lobbies.models import Lobby, LobbyEvent
+
+
+def create_lobby(
+    lobby: Lobby,
+    host_role: Any = None,
+    needed_roles: Iterable[Any] = ()
+) -> Lobby:
+    """
+    Persists a new lobby together with all of its slots.
+
+    Role assignment happens in memory, so creation costs one INSERT for the
+    lobby and one bulk INSERT for the slots regardless of the lobby size.
+    Shared by the create view and the setup_dev command.
+
+    Args:
+        lobby (Lobby): Unsaved lobby with 'host' and 'game' set.
+        host_role (GameRole): Optional role of the host's slot.
+        needed_roles (Iterable[GameRole]): Roles reserved for the remaining slots.
+    """
+    lobby.save(host_role=host_role, needed_roles=needed_roles or ())
+    log_events(LobbyEvent(lobby=lobby, user_id=lobby.host_id, kind=LobbyEvent.Kind.CREATED))
+    return lobby
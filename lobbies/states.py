@@ -0,0 +1,212 @@
+"""
+Status transitions of a Lobby.
+
+Every status change goes through 'apply_transition', which folds the new
+status into the same conditional UPDATE that shifts the slot counter, so
+the decision is made by the database on the current row instead of by
+re-counting slots. The UPDATE reports which lobbies it moved; only those
+are recorded in LobbyTransition within the same transaction, and they are
+what callers build status events and in-memory state from.
+"""
+from datetime import datetime
+from functools import reduce
+from operator import or_
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from django.db import connection, transaction
+from django.db.models import Case, DateTimeField, F, Q, QuerySet, Value, When
+from django.db.models.sql import UpdateQuery
+from django.utils import timezone
+
+from lobbies.models import Lobby, LobbyTransition
+from lobbies.open_roles import ShiftCounts
+
+Status = Lobby.Status
+Trigger = LobbyTransition.Trigger
+
+# Triggers caused by a slot being filled or emptied.
+SLOT_TRIGGERS = frozenset({Trigger.JOIN, Trigger.LEAVE, Trigger.KICK, Trigger.MATCH})
+
+
+class Rule(NamedTuple):
+    """
+    A single 'source -> target' edge of the state machine.
+
+    'when_full' restricts the edge to lobbies that are full (True) or not
+    full (False) once the slot delta is applied; None means always.
+    """
+    source: str
+    target: str
+    when_full: Optional[bool] = None
+
+    def condition(self, delta: int) -> Q:
+        """The rule as a filter on the row *before* the update."""
+        condition = Q(status=self.source)
+        if self.when_full is True:
+            condition &= Q(filled_slots__gte=F("size") - delta)
+        elif self.when_full is False:
+            condition &= Q(filled_slots__lt=F("size") - delta)
+        return condition
+
+
+def rules_for(trigger: str, delta: int = 0) -> List[Rule]:
+    """
+    Returns the edges that 'trigger' may take.
+
+    Joins fill a searching lobby up to IN_PROGRESS; leaves and kicks reopen
+    a running lobby that is no longer full. Closing ends the lobby either
+    way, and expiry only cancels lobbies that never started.
+    """
+    if trigger in SLOT_TRIGGERS:
+        if delta > 0:
+            return [Rule(Status.SEARCHING, Status.IN_PROGRESS, when_full=True)]
+        if delta < 0:
+            return [Rule(Status.IN_PROGRESS, Status.SEARCHING, when_full=False)]
+        return []
+
+    if trigger == Trigger.CLOSE:
+        return [
+            Rule(Status.SEARCHING, Status.CANCELLED),
+            Rule(Status.IN_PROGRESS, Status.COMPLETED),
+        ]
+
+    if trigger == Trigger.EXPIRE:
+        return [Rule(Status.SEARCHING, Status.CANCELLED)]
+
+    raise ValueError(f"Unknown lobby trigger: {trigger!r}")
+
+
+class StatusChange(NamedTuple):
+    """A status change as recorded in LobbyTransition."""
+    lobby_id: int
+    from_status: str
+    to_status: str
+    trigger: str
+
+
+class Transition(NamedTuple):
+    """
+    Outcome of 'apply_transition'.
+
+    'changes' lists the lobbies whose status the UPDATE actually moved, as
+    decided by the database, so it holds for lobbies that were not locked
+    or loaded by the caller.
+    """
+    changed_at: datetime
+    updated: int
+    changes: List[StatusChange]
+
+
+def apply_transition(
+    lobby_ids: Iterable[int],
+    trigger: str,
+    delta: int = 0,
+    open_roles: Optional[Dict[str, int]] = None
+) -> Transition:
+    """
+    Shifts the slot counter of the lobbies by 'delta' and moves their status.
+
+    Runs one UPDATE: the counter, the open_roles summary (shifted by
+    'open_roles'), the new status, 'previous_status' and
+    'status_changed_at' are all computed from the same row, so concurrent
+    joins and leaves never act on a stale count. Triggers without a delta
+    only touch the lobbies they can move.
+
+    Returns:
+        Transition: The stored 'updated_at', the number of updated lobbies
+        and the status changes that were recorded.
+    """
+    lobby_ids = list(lobby_ids)
+    rules = rules_for(trigger, delta)
+    now = timezone.now()
+
+    queryset = Lobby.objects.filter(pk__in=lobby_ids)
+    updates = {"updated_at": now}
+
+    if delta:
+        updates["filled_slots"] = F("filled_slots") + delta
+        if open_roles:
+            updates["open_roles"] = ShiftCounts("open_roles", open_roles)
+    else:
+        queryset = queryset.filter(status__in=[rule.source for rule in rules])
+
+    if rules:
+        changed = reduce(or_, (rule.condition(delta) for rule in rules))
+        updates["status"] = Case(
+            *[When(rule.condition(delta), then=Value(rule.target)) for rule in rules],
+            default=F("status")
+        )
+        # SET expressions see the row before the update, so F("status") is the old value.
+        updates["previous_status"] = Case(When(changed, then=F("status")), default=F("previous_status"))
+        updates["status_changed_at"] = Case(
+            When(changed, then=Value(now, output_field=DateTimeField())),
+            default=F("status_changed_at")
+        )
+
+    # Callers usually hold a transaction already; don't pay for a savepoint.
+    with transaction.atomic(savepoint=False):
+        if rules:
+            updated, changes = update_returning_changes(queryset, updates, lobby_ids, trigger, now)
+            if changes:
+                record_transitions(changes, now)
+        else:
+            updated, changes = queryset.update(**updates), []
+
+    return Transition(now, updated, changes)
+
+
+def update_returning_changes(
+    queryset: QuerySet,
+    updates: Dict[str, Any],
+    lobby_ids: List[int],
+    trigger: str,
+    changed_at: datetime
+) -> Tuple[int, List[StatusChange]]:
+    """
+    Runs the UPDATE of apply_transition and returns which lobbies it moved.
+
+    Where the database supports it, the UPDATE itself returns its rows
+    (RETURNING) flagged by whether their status changed at 'changed_at';
+    otherwise the moved lobbies among 'lobby_ids' are read back with a query.
+
+    Returns:
+        tuple: The number of updated lobbies and their status changes.
+    """
+    if not connection.features.can_return_columns_from_insert:
+        updated = queryset.update(**updates)
+        moved = Lobby.objects.filter(pk__in=lobby_ids, status_changed_at=changed_at)
+        changes = moved.values_list("pk", "previous_status", "status")
+        return updated, [StatusChange(*change, str(trigger)) for change in changes]
+
+    query = queryset.query.chain(UpdateQuery)
+    query.add_update_values(updates)
+    update_sql, params = query.get_compiler(queryset.db).as_sql()
+
+    quote = connection.ops.quote_name
+    columns = ", ".join(
+        quote(Lobby._meta.get_field(name).column) for name in ("id", "previous_status", "status")
+    )
+    changed = f"{quote(Lobby._meta.get_field('status_changed_at').column)} = %s"
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"{update_sql} RETURNING {columns}, {changed}",
+            (*params, connection.ops.adapt_datetimefield_value(changed_at))
+        )
+        rows = cursor.fetchall()
+
+    return len(rows), [StatusChange(*row[:3], str(trigger)) for row in rows if row[3]]
+
+
+def record_transitions(changes: List[StatusChange], changed_at: datetime) -> None:
+    """Appends a LobbyTransition for every status change, with one INSERT."""
+    LobbyTransition.objects.bulk_create([
+        LobbyTransition(
+            lobby_id=change.lobby_id,
+            from_status=change.from_status,
+            to_status=change.to_status,
+            trigger=change.trigger,
+            created_at=changed_at
+        )
+        for change in changes
+    ])
@@ -0,0 +1,123 @@
+import importlib.util
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from games.models import Game, UserGameProfile
+from lobbies.activity import event_buffer, flush_events, log_events
+from lobbies.models import Lobby, LobbyEvent
+
+User = get_user_model()
+
+Kind = LobbyEvent.Kind
+
+
+class LobbyActivityLogTest(TestCase):
+    """Test suite for the buffered lobby event log."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.game = Game.objects.create(title="Valorant", slug="val", team_size=5)
+        cls.host = User.objects.create_user(username="host", email="h@ex.com", password="pw")
+        cls.player = User.objects.create_user(username="player", email="p@ex.com", password="pw")
+        UserGameProfile.objects.create(user=cls.player, game=cls.game, rank="Gold")
+
+    def setUp(self):
+        flush_events()
+        self.lobby = Lobby.objects.create(title="Duo", game=self.game, host=self.host, size=2)
+        self.slot_2 = self.lobby.slots.get(order=2)
+
+    def slot_url(self, name: str) -> str:
+        return reverse(name, kwargs={
+            "game_slug": self.game.slug,
+            "invite_link": self.lobby.invite_link,
+            "slot_id": self.slot_2.id
+        })
+
+    def events(self) -> list:
+        return list(self.lobby.events.values_list("kind", "user_id", "data"))
+
+    def test_join_and_leave_keep_history(self):
+        """Joins and leaves stay on record, with the status changes they caused."""
+        self.client.force_login(self.player)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(self.slot_url("lobbies:lobby-join"))
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(self.slot_url("lobbies:lobby-leave"))
+
+        slot = {"slot": 2, "role": None}
+        self.assertEqual(self.events(), [
+            (Kind.JOINED, self.player.id, slot),
+            (Kind.STATUS_CHANGED, None, {"from": "SE", "to": "IP", "trigger": "join"}),
+            (Kind.LEFT, self.player.id, slot),
+            (Kind.STATUS_CHANGED, None, {"from": "IP", "to": "SE", "trigger": "leave"}),
+        ])
+
+    def test_kick_privacy_and_close_are_logged(self):
+        """Host actions are logged with the player they affect."""
+        self.slot_2.player = self.player
+        self.slot_2.save()
+        self.client.force_login(self.host)
+        lobby_kwargs = {"game_slug": self.game.slug, "invite_link": self.lobby.invite_link}
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(self.slot_url("lobbies:lobby-kick"))
+            self.client.post(reverse("lobbies:lobby-toggle-privacy", kwargs=lobby_kwargs))
+            self.client.post(reverse("lobbies:lobby-delete", kwargs=lobby_kwargs))
+
+        self.assertEqual([(kind, user_id) for kind, user_id, _ in self.events()], [
+            (Kind.KICKED, self.player.id),
+            (Kind.STATUS_CHANGED, None),
+            (Kind.PRIVACY_CHANGED, self.host.id),
+            (Kind.STATUS_CHANGED, self.host.id),
+        ])
+        self.assertEqual(self.events()[-1][2], {"from": "SE", "to": "CA", "trigger": "close"})
+
+    def test_rolled_back_actions_are_not_logged(self):
+        """Events are only handed to the buffer once their transaction commits."""
+        with self.captureOnCommitCallbacks(execute=True):
+            try:
+                with transaction.atomic():
+                    log_events(LobbyEvent(lobby=self.lobby, kind=Kind.JOINED))
+                    raise RuntimeError
+            except RuntimeError:
+                pass
+
+        self.assertFalse(self.lobby.events.exists())
+
+    @override_settings(LOBBY_EVENT_BATCH_SIZE=3, LOBBY_EVENT_FLUSH_INTERVAL=60)
+    def test_events_are_written_in_batches(self):
+        """A batch is written with one INSERT once it is full."""
+        for _ in range(2):
+            event_buffer.add([LobbyEvent(lobby=self.lobby, kind=Kind.PRIVACY_CHANGED)])
+        self.assertFalse(self.lobby.events.exists())
+
+        with self.assertNumQueries(1):
+            event_buffer.add([LobbyEvent(lobby=self.lobby, kind=Kind.PRIVACY_CHANGED)])
+
+        self.assertEqual(self.lobby.events.count(), 3)
+
+    @override_settings(LOBBY_EVENT_BATCH_SIZE=100, LOBBY_EVENT_FLUSH_INTERVAL=0)
+    def test_partial_batch_is_flushed_after_interval(self):
+        """A partial batch older than the flush interval is written by the next event."""
+        event_buffer.add([LobbyEvent(lobby=self.lobby, kind=Kind.PRIVACY_CHANGED)])
+
+        self.assertEqual(self.lobby.events.count(), 1)
+
+    @override_settings(LOBBY_EVENT_BATCH_SIZE=100, LOBBY_EVENT_FLUSH_INTERVAL=60)
+    def test_worker_exit_flushes_partial_batch(self):
+        """The gunicorn 'worker_exit' hook writes events a stopping worker still buffers."""
+        spec = importlib.util.spec_from_file_location("gunicorn_conf", settings.BASE_DIR / "gunicorn.conf.py")
+        gunicorn_conf = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(gunicorn_conf)
+
+        event_buffer.add([LobbyEvent(lobby=self.lobby, kind=Kind.PRIVACY_CHANGED)])
+        self.assertFalse(self.lobby.events.exists())
+
+        gunicorn_conf.worker_exit(server=None, worker=None)
+
+        self.assertEqual(self.lobby.events.count(), 1)
@@ -0,0 +1,160 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+
+from games.models import Game, GameRank, GameRole
+from lobbies.api import LobbyListAPIView
+from lobbies.models import Lobby
+from lobbies.services import create_lobby
+
+User = get_user_model()
+
+
+class LobbyListAPITests(TestCase):
+    """
+    Tests for the JSON lobby list.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.game = Game.objects.create(title="Valorant", slug="valorant", team_size=5)
+        cls.role = GameRole.objects.create(game=cls.game, name="Duelist", order=1)
+        GameRank.objects.create(game=cls.game, name="Gold", value=4)
+        cls.host = User.objects.create_user(username="host", email="h@ex.com", password="pw")
+        cls.player = User.objects.create_user(username="player", email="p@ex.com", password="pw")
+
+        cls.lobby = Lobby.objects.create(
+            title="EU grind", description="Chill, mic required.", game=cls.game, host=cls.host, size=3, max_rank=4
+        )
+        Lobby.objects.create(title="Secret", game=cls.game, host=cls.host, size=3, is_public=False)
+
+    def setUp(self):
+        self.url = reverse("lobbies:api-lobby-list", kwargs={"game_slug": self.game.slug})
+
+    def test_lists_public_lobbies_with_slots(self):
+        """The payload mirrors the list page: host, counter, rank range and slots."""
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "application/json")
+
+        results = response.json()["results"]
+        self.assertEqual([lobby["title"] for lobby in results], ["EU grind"])
+
+        lobby = results[0]
+        self.assertEqual(lobby["host"], "host")
+        self.assertEqual(lobby["filled_slots"], 1)
+        self.assertEqual(lobby["size"], 3)
+        self.assertIsNone(lobby["min_rank"])
+        self.assertEqual(lobby["max_rank"], 4)
+        self.assertEqual(lobby["invite_link"], str(self.lobby.invite_link))
+        self.assertEqual([slot["player"] for slot in lobby["slots"]], ["host", None, None])
+
+    def test_accepts_list_filters(self):
+        """Filters are shared with the HTML list."""
+        self.assertEqual(len(self.client.get(self.url, {"q": "chill"}).json()["results"]), 1)
+        self.assertEqual(len(self.client.get(self.url, {"q": "tryhard"}).json()["results"]), 0)
+        self.assertEqual(len(self.client.get(self.url, {"rank": 9}).json()["results"]), 0)
+
+    def test_pages_with_cursor(self):
+        """Cursors returned by the API continue after the last row."""
+        for i in range(LobbyListAPIView.page_size):
+            Lobby.objects.create(title=f"Room {i}", game=self.game, host=self.host, size=3)
+
+        first = self.client.get(self.url).json()
+        self.assertIsNotNone(first["next_cursor"])
+
+        second = self.client.get(self.url, {"cursor": first["next_cursor"]}).json()
+        self.assertEqual([lobby["title"] for lobby in second["results"]], ["EU grind"])
+
+        self.assertEqual(self.client.get(self.url, {"cursor": "garbage"}).status_code, 404)
+
+    def test_unchanged_list_is_not_modified(self):
+        """A matching If-None-Match is answered with 304 after the aggregate query alone."""
+        etag = self.client.get(self.url)["ETag"]
+
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+        self.assertEqual(response.content, b"")
+
+    def test_slot_change_moves_etag(self):
+        """Joining a slot changes the list ETag."""
+        etag = self.client.get(self.url)["ETag"]
+
+        slot = self.lobby.slots.get(order=2)
+        slot.player = self.player
+        slot.save()
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_etag_varies_on_filters(self):
+        """Each filter combination has its own ETag."""
+        self.assertNotEqual(
+            self.client.get(self.url)["ETag"],
+            self.client.get(self.url, {"q": "chill"})["ETag"]
+        )
+
+
+class LobbyDetailAPITests(TestCase):
+    """
+    Tests for the JSON lobby detail.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.game = Game.objects.create(title="Valorant", slug="valorant", team_size=5)
+        cls.role = GameRole.objects.create(game=cls.game, name="Duelist", order=1)
+        cls.host = User.objects.create_user(username="host", email="h@ex.com", password="pw")
+        cls.player = User.objects.create_user(username="player", email="p@ex.com", password="pw")
+        cls.lobby = create_lobby(
+            Lobby(title="Private room", game=cls.game, host=cls.host, size=2, is_public=False),
+            needed_roles=[cls.role]
+        )
+
+    def setUp(self):
+        self.url = reverse(
+            "lobbies:api-lobby-detail",
+            kwargs={"game_slug": self.game.slug, "invite_link": self.lobby.invite_link}
+        )
+
+    def test_returns_lobby_with_slots(self):
+        """Private lobbies are readable through their invite link."""
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data["title"], "Private room")
+        self.assertFalse(data["is_public"])
+        self.assertEqual(data["slots"][1], {"order": 2, "player": None, "role": "Duelist", "joined_at": None})
+
+    def test_unknown_game_returns_404(self):
+        url = reverse("lobbies:api-lobby-detail", kwargs={"game_slug": "cs2", "invite_link": self.lobby.invite_link})
+
+        self.assertEqual(self.client.get(url).status_code, 404)
+
+    def test_unchanged_lobby_is_not_modified(self):
+        """Polling an unchanged lobby costs a single query."""
+        etag = self.client.get(self.url)["ETag"]
+        self.assertFalse(etag.startswith("W/"))
+
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 304)
+
+    def test_updated_lobby_is_sent_again(self):
+        """A slot change touches 'updated_at' and therefore the ETag."""
+        etag = self.client.get(self.url)["ETag"]
+
+        slot = self.lobby.slots.get(order=2)
+        slot.player = self.player
+        slot.save()
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["slots"][1]["player"], "player")
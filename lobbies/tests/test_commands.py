@@ -0,0 +1,213 @@
+import csv
+import gzip
+import json
+import os
+import tempfile
+from datetime import timedelta
+from io import StringIO
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test import TestCase
+from django.utils import timezone
+
+from games.models import Game
+from lobbies.management.commands.export_lobby_events import FIELDS
+from lobbies.models import Lobby, LobbyEvent
+
+User = get_user_model()
+
+
+class RecountLobbySlotsCommandTest(TestCase):
+    """Tests for the recount_lobby_slots management command."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.game = Game.objects.create(title="Test Game", slug="test-game", team_size=5)
+        cls.host = User.objects.create_user(
+            username="host",
+            email="host@test.com",
+            password="password"
+        )
+
+    def setUp(self):
+        self.lobby = Lobby.objects.create(
+            title="Drift Test",
+            game=self.game,
+            host=self.host,
+            size=3
+        )
+
+    def test_repairs_drifted_counter(self):
+        """Verifies drifted counters are restored to the real occupied slot count."""
+        Lobby.objects.filter(pk=self.lobby.pk).update(filled_slots=3)
+
+        out = StringIO()
+        call_command("recount_lobby_slots", stdout=out)
+
+        self.lobby.refresh_from_db()
+        self.assertEqual(self.lobby.filled_slots, 1)
+        self.assertIn("Recounted 1 lobbies", out.getvalue())
+
+    def test_rebuilds_drifted_open_roles(self):
+        """Verifies the open roles summary is rebuilt from the open slots."""
+        Lobby.objects.filter(pk=self.lobby.pk).update(open_roles={"any": 5})
+
+        out = StringIO()
+        call_command("recount_lobby_slots", stdout=out)
+
+        self.lobby.refresh_from_db()
+        self.assertEqual(self.lobby.open_roles, {"any": 2})
+        self.assertIn("Rebuilt open roles of 1 lobbies", out.getvalue())
+
+    def test_dry_run_leaves_counter_untouched(self):
+        """Verifies --dry-run only reports drift."""
+        Lobby.objects.filter(pk=self.lobby.pk).update(filled_slots=0)
+
+        out = StringIO()
+        call_command("recount_lobby_slots", "--dry-run", stdout=out)
+
+        self.lobby.refresh_from_db()
+        self.assertEqual(self.lobby.filled_slots, 0)
+        self.assertIn("1 lobbies have drifted", out.getvalue())
+
+
+class ReapLobbiesCommandTest(TestCase):
+    """Tests for the reap_lobbies management command."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.game = Game.objects.create(
+            title="Test Game",
+            slug="test-game",
+            team_size=5,
+            lobby_ttl=timedelta(hours=1)
+        )
+        cls.host = User.objects.create_user(
+            username="host",
+            email="host@test.com",
+            password="password"
+        )
+
+    def _create_lobby(self, title: str, idle_for: timedelta, **kwargs) -> Lobby:
+        lobby = Lobby.objects.create(title=title, game=self.game, host=self.host, size=3, **kwargs)
+        Lobby.objects.filter(pk=lobby.pk).update(updated_at=timezone.now() - idle_for)
+        return lobby
+
+    def test_cancels_only_stale_searching_lobbies(self):
+        """Verifies lobbies idle past the game TTL are cancelled and others are untouched."""
+        stale = self._create_lobby("Stale", timedelta(hours=2))
+        fresh = self._create_lobby("Fresh", timedelta(minutes=10))
+        running = self._create_lobby("Running", timedelta(hours=2), status=Lobby.Status.IN_PROGRESS)
+
+        out = StringIO()
+        call_command("reap_lobbies", stdout=out)
+
+        stale.refresh_from_db()
+        fresh.refresh_from_db()
+        running.refresh_from_db()
+        self.assertEqual(stale.status, Lobby.Status.CANCELLED)
+        self.assertEqual(fresh.status, Lobby.Status.SEARCHING)
+        self.assertEqual(running.status, Lobby.Status.IN_PROGRESS)
+        self.assertEqual(
+            list(stale.transitions.values_list("from_status", "to_status", "trigger")),
+            [(Lobby.Status.SEARCHING, Lobby.Status.CANCELLED, "expire")]
+        )
+        self.assertFalse(running.transitions.exists())
+        self.assertIn("Reaped 1 stale lobbies", out.getvalue())
+
+    def test_reaps_in_batches(self):
+        """Verifies every stale lobby is reaped even when it takes several batches."""
+        for i in range(5):
+            self._create_lobby(f"Stale {i}", timedelta(hours=3))
+
+        call_command("reap_lobbies", "--batch-size", "2", stdout=StringIO())
+
+        self.assertEqual(Lobby.objects.filter(status=Lobby.Status.CANCELLED).count(), 5)
+
+
+class ExportLobbyEventsCommandTest(TestCase):
+    """Tests for the export_lobby_events management command."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.game = Game.objects.create(title="Test Game", slug="test-game", team_size=5)
+        other_game = Game.objects.create(title="Other Game", slug="other-game", team_size=5)
+        cls.host = User.objects.create_user(username="host", email="host@test.com", password="password")
+        cls.lobby = Lobby.objects.create(title="Logged", game=cls.game, host=cls.host, size=3)
+        other = Lobby.objects.create(title="Other", game=other_game, host=cls.host, size=3)
+
+        LobbyEvent.objects.bulk_create([
+            LobbyEvent(lobby=cls.lobby, user=cls.host, kind=LobbyEvent.Kind.CREATED),
+            LobbyEvent(lobby=cls.lobby, kind=LobbyEvent.Kind.PRIVACY_CHANGED, data={"is_public": False}),
+            LobbyEvent(lobby=cls.lobby, user=cls.host, kind=LobbyEvent.Kind.JOINED, data={"slot": 2}),
+            LobbyEvent(lobby=other, user=cls.host, kind=LobbyEvent.Kind.CREATED),
+        ])
+
+    def export(self, name: str, *args: str) -> str:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, name)
+        call_command("export_lobby_events", path, *args, stdout=StringIO())
+        return path
+
+    def test_exports_compressed_csv(self):
+        """Verifies a .gz target is gzip-compressed and keeps the JSON payload."""
+        with gzip.open(self.export("events.csv.gz", "--game", "test-game"), "rt", newline="") as exported:
+            rows = list(csv.DictReader(exported))
+
+        self.assertEqual([row["kind"] for row in rows], ["created", "privacy", "joined"])
+        self.assertEqual(rows[0]["game_id"], str(self.game.id))
+        self.assertEqual(json.loads(rows[1]["data"]), {"is_public": False})
+
+    def test_exports_json_lines(self):
+        """Verifies one JSON object per event, in id order."""
+        with open(self.export("events.jsonl", "--format", "jsonl")) as exported:
+            rows = [json.loads(line) for line in exported]
+
+        self.assertEqual(len(rows), 4)
+        self.assertEqual(rows[2]["data"], {"slot": 2})
+        self.assertEqual(rows[2]["user_id"], self.host.id)
+        self.assertEqual([row["id"] for row in rows], sorted(row["id"] for row in rows))
+
+    def test_pages_by_id_without_server_side_cursors(self):
+        """Verifies the keyset fallback returns every row exactly once."""
+        with patch.dict(connection.settings_dict, {"DISABLE_SERVER_SIDE_CURSORS": True}):
+            with self.assertNumQueries(2):
+                out = StringIO()
+                call_command("export_lobby_events", "-", "--format", "jsonl", "--chunk-size", "3", stdout=out)
+
+        self.assertEqual(len(out.getvalue().splitlines()), 4)
+
+    def test_time_window(self):
+        """Verifies --since and --until bound the export."""
+        out = StringIO()
+        call_command("export_lobby_events", "-", "--until", "2000-01-01T00:00:00+00:00", stdout=out)
+
+        self.assertEqual(out.getvalue().splitlines(), [",".join(FIELDS)])
+
+    def test_rejects_empty_chunks(self):
+        """Verifies a chunk size below 1 is refused instead of paging forever."""
+        with self.assertRaisesMessage(CommandError, "--chunk-size must be at least 1"):
+            call_command("export_lobby_events", "-", "--chunk-size", "0", stdout=StringIO())
+
+
+class BenchmarkLobbyQueriesCommandTest(TestCase):
+    """Smoke test for the benchmark_lobby_queries management command."""
+
+    def test_prints_plans_and_rolls_back(self):
+        """Verifies plans are printed for both phases and the seeded data is discarded."""
+        out = StringIO()
+        call_command(
+            "benchmark_lobby_queries",
+            "--lobbies", "20", "--users", "10", "--repeat", "1", "--compare",
+            stdout=out
+        )
+
+        output = out.getvalue()
+        self.assertIn("without hot-path indexes", output)
+        self.assertIn("list (role filter)", output)
+        self.assertIn("detail (slots)", output)
+        self.assertFalse(Lobby.objects.exists())
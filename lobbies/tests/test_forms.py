@@ -1,7 +1,8 @@
 from django.test import TestCase
 
-from games.models import Game, GameRole
+from games.models import Game, GameRank, GameRole
 from lobbies.forms import LobbyForm
+from lobbies.models import Lobby
 
 
 class LobbyFormTest(TestCase):
@@ -105,3 +106,28 @@ class LobbyFormTest(TestCase):
 
         self.assertFalse(form.is_valid())
         self.assertIn("host_role", form.errors)
+
+    def test_rank_fields_hidden_without_ladder(self):
+        """Verifies that games without a rank ladder offer no rank range."""
+        form = LobbyForm(game=self.other_game)
+
+        self.assertNotIn("min_rank", form.fields)
+        self.assertNotIn("max_rank", form.fields)
+
+    def test_rank_range_validation(self):
+        """
+        Verifies that open bounds are stored as the ladder extremes and
+        that an inverted range is rejected.
+        """
+        gold = GameRank.objects.create(game=self.game, name="Gold", value=3)
+        elite = GameRank.objects.create(game=self.game, name="Global Elite", value=9)
+        form_data = {"title": "Ranked", "size": 5, "is_public": True}
+
+        form = LobbyForm(data={**form_data, "min_rank": gold.value}, game=self.game)
+        self.assertTrue(form.is_valid())
+        self.assertEqual(form.cleaned_data["min_rank"], gold.value)
+        self.assertEqual(form.cleaned_data["max_rank"], Lobby.ANY_MAX_RANK)
+
+        form = LobbyForm(data={**form_data, "min_rank": elite.value, "max_rank": gold.value}, game=self.game)
+        self.assertFalse(form.is_valid())
+        self.assertIn("max_rank", form.errors)
@@ -1,9 +1,11 @@
 from django.contrib.auth import get_user_model
-from django.db import IntegrityError
+from django.db import IntegrityError, connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 
 from games.models import Game, GameRole
 from lobbies.models import Lobby
+from lobbies.services import create_lobby
 
 User = get_user_model()
 
@@ -41,6 +43,27 @@ class LobbyModelTest(TestCase):
         second_slot = lobby.slots.get(order=2)
         self.assertIsNone(second_slot.player)
 
+    def test_create_lobby_assigns_roles_in_one_bulk_insert(self):
+        """Verifies host and needed roles are assigned without follow-up queries."""
+        tank = GameRole.objects.create(game=self.game, name="Tank", order=1)
+        healer = GameRole.objects.create(game=self.game, name="Healer", order=2)
+
+        with CaptureQueriesContext(connection) as queries:
+            lobby = create_lobby(
+                Lobby(title="Roles", game=self.game, host=self.host, size=4),
+                host_role=tank,
+                needed_roles=[healer, healer]
+            )
+
+        statements = [q["sql"].split()[0] for q in queries.captured_queries]
+        self.assertEqual([s for s in statements if s in ("INSERT", "UPDATE", "SELECT")], ["INSERT", "INSERT"])
+
+        slots = list(lobby.slots.order_by("order"))
+        self.assertEqual([slot.required_role for slot in slots], [tank, healer, healer, None])
+        self.assertEqual(slots[0].player, self.host)
+        self.assertIsNotNone(slots[0].joined_at)
+        self.assertEqual(lobby.filled_slots, 1)
+
     def test_can_join_logic(self):
         """Verifies the can_join method returns correct boolean and reason."""
         lobby = Lobby.objects.create(
@@ -71,6 +94,7 @@ class LobbyModelTest(TestCase):
         slot_3 = lobby.slots.get(order=3)
         slot_3.player = filler_user
         slot_3.save()
+        lobby.refresh_from_db()
 
         other_user = User.objects.create_user(
             username="other",
@@ -162,6 +186,59 @@ class SlotModelTest(TestCase):
         self.lobby.refresh_from_db()
         self.assertEqual(self.lobby.status, Lobby.Status.IN_PROGRESS)
 
+    def test_filled_slots_counter_follows_joins_and_leaves(self):
+        """Verifies the denormalized counter is shifted on join and leave without drift."""
+        self.assertEqual(self.lobby.filled_slots, 1)
+
+        self.slot_2.player = self.player
+        self.slot_2.save()
+        self.lobby.refresh_from_db()
+        self.assertEqual(self.lobby.filled_slots, 2)
+
+        self.slot_2.player = None
+        self.slot_2.save()
+        self.lobby.refresh_from_db()
+        self.assertEqual(self.lobby.filled_slots, 1)
+
+    def test_full_save_does_not_overwrite_counter(self):
+        """Verifies a stale Lobby instance cannot clobber the slot counter."""
+        stale_lobby = Lobby.objects.get(pk=self.lobby.pk)
+
+        self.slot_2.player = self.player
+        self.slot_2.save()
+
+        stale_lobby.title = "Renamed"
+        stale_lobby.save()
+
+        self.lobby.refresh_from_db()
+        self.assertEqual(self.lobby.title, "Renamed")
+        self.assertEqual(self.lobby.filled_slots, 2)
+
+    def test_open_roles_follow_slot_changes(self):
+        """Verifies the open roles summary is shifted with the slot counter."""
+        lobby = create_lobby(
+            Lobby(title="Roles", game=self.game, host=self.host, size=4),
+            needed_roles=[self.role, self.role]
+        )
+        self.assertEqual(lobby.open_roles, {str(self.role.id): 2, "any": 1})
+
+        slot = lobby.slots.get(order=2)
+        stale = lobby.slots.get(order=3)
+        slot.player = self.player
+        slot.save()
+        rival = User.objects.create_user(username="rival", email="rival@test.com", password="password")
+        self.assertTrue(stale.claim(rival))
+
+        lobby.refresh_from_db()
+        self.assertEqual(lobby.open_roles, {"any": 1})
+
+        slot.player = None
+        slot.save()
+
+        lobby.refresh_from_db()
+        self.assertEqual(lobby.open_roles, {"any": 1, str(self.role.id): 1})
+        self.assertEqual(slot.lobby.open_roles, lobby.open_roles)
+
     def test_unique_player_constraint(self):
         """Verifies database constraint: A player cannot occupy two slots in the same lobby."""
         slot_2 = self.lobby.slots.get(order=2)
@@ -169,3 +246,59 @@ class SlotModelTest(TestCase):
 
         with self.assertRaises(IntegrityError):
             slot_2.save()
+
+    def test_claim_seats_player_and_fills_lobby(self):
+        """Verifies a claim sets the player, the counter and the status in conditional UPDATEs."""
+        with CaptureQueriesContext(connection) as queries:
+            self.assertTrue(self.slot_2.claim(self.player))
+
+        statements = [q["sql"].split()[0] for q in queries.captured_queries]
+        self.assertEqual([s for s in statements if s in ("SELECT", "UPDATE")], ["UPDATE", "UPDATE"])
+
+        self.slot_2.refresh_from_db()
+        self.lobby.refresh_from_db()
+        self.assertEqual(self.slot_2.player, self.player)
+        self.assertIsNotNone(self.slot_2.joined_at)
+        self.assertEqual(self.lobby.filled_slots, 2)
+        self.assertEqual(self.lobby.status, Lobby.Status.IN_PROGRESS)
+
+    def test_claim_loses_race_for_taken_slot(self):
+        """Verifies a stale instance cannot claim a slot someone else took meanwhile."""
+        stale_slot = self.lobby.slots.get(order=2)
+        rival = User.objects.create_user(username="rival", email="rival@test.com", password="password")
+        self.assertTrue(self.slot_2.claim(rival))
+
+        self.assertFalse(stale_slot.claim(self.player))
+
+        stale_slot.refresh_from_db()
+        self.lobby.refresh_from_db()
+        self.assertEqual(stale_slot.player, rival)
+        self.assertEqual(self.lobby.filled_slots, 2)
+
+    def test_claim_checks_empty_slot_on_the_updated_row(self):
+        """
+        Verifies the empty-slot condition is not wrapped in an 'id IN (SELECT ...)'
+        subquery, which PostgreSQL would not re-check after a concurrent claim.
+        """
+        with CaptureQueriesContext(connection) as queries:
+            self.slot_2.claim(self.player)
+
+        claim_sql = next(q["sql"] for q in queries.captured_queries if q["sql"].startswith('UPDATE "lobbies_slot"'))
+        self.assertNotIn('"lobbies_slot"."id" IN (SELECT', claim_sql)
+        self.assertIn('"lobbies_slot"."player_id" IS NULL', claim_sql)
+
+    def test_claim_requires_searching_lobby(self):
+        """Verifies closed lobbies reject claims even for empty slots."""
+        Lobby.objects.filter(pk=self.lobby.pk).update(status=Lobby.Status.CANCELLED)
+
+        self.assertFalse(self.slot_2.claim(self.player))
+        self.slot_2.refresh_from_db()
+        self.assertIsNone(self.slot_2.player)
+
+    def test_claim_rejects_player_already_in_lobby(self):
+        """Verifies the unique constraint stops a second seat for the same player."""
+        with self.assertRaises(IntegrityError):
+            self.slot_2.claim(self.host)
+
+        self.lobby.refresh_from_db()
+        self.assertEqual(self.lobby.filled_slots, 1)
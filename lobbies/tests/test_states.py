@@ -0,0 +1,156 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+
+from games.models import Game
+from lobbies.models import Lobby, LobbyTransition
+from lobbies.activity import status_event
+from lobbies.states import StatusChange, apply_transition
+
+User = get_user_model()
+
+Status = Lobby.Status
+Trigger = LobbyTransition.Trigger
+
+
+class LobbyStateMachineTest(TestCase):
+    """Test suite for status transitions driven by slot changes and closing."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.game = Game.objects.create(title="Test Game", slug="test-game", team_size=5)
+        cls.host = User.objects.create_user(username="host", email="host@test.com", password="password")
+        cls.player = User.objects.create_user(username="player", email="player@test.com", password="password")
+
+    def setUp(self):
+        self.lobby = Lobby.objects.create(title="States", game=self.game, host=self.host, size=2)
+        self.slot_2 = self.lobby.slots.get(order=2)
+
+    def transitions(self) -> list:
+        return list(self.lobby.transitions.values_list("from_status", "to_status", "trigger"))
+
+    def test_leaving_full_lobby_reopens_it(self):
+        """Verifies a running lobby that loses a player goes back to SEARCHING."""
+        self.slot_2.player = self.player
+        self.slot_2.save()
+        self.slot_2.player = None
+        self.slot_2.save()
+
+        self.lobby.refresh_from_db()
+        self.assertEqual(self.lobby.status, Status.SEARCHING)
+        self.assertEqual(self.lobby.previous_status, Status.IN_PROGRESS)
+        self.assertIsNotNone(self.lobby.status_changed_at)
+        self.assertEqual(self.transitions(), [
+            (Status.SEARCHING, Status.IN_PROGRESS, Trigger.JOIN),
+            (Status.IN_PROGRESS, Status.SEARCHING, Trigger.LEAVE),
+        ])
+
+    def test_trigger_is_recorded(self):
+        """Verifies callers can name the cause of a slot change."""
+        self.slot_2.player = self.player
+        self.slot_2.save()
+        self.slot_2.player = None
+        self.slot_2.save(trigger=Trigger.KICK)
+
+        self.assertEqual(self.transitions()[-1], (Status.IN_PROGRESS, Status.SEARCHING, Trigger.KICK))
+
+    def test_instance_follows_stored_status(self):
+        """Verifies the in-memory lobby matches the row without a reload."""
+        self.slot_2.player = self.player
+        self.slot_2.save()
+
+        self.assertEqual(self.slot_2.lobby.status, Status.IN_PROGRESS)
+        self.assertEqual(self.slot_2.lobby.previous_status, Status.SEARCHING)
+
+        stored = Lobby.objects.get(pk=self.lobby.pk)
+        self.assertEqual(self.slot_2.lobby.status_changed_at, stored.status_changed_at)
+
+    def test_no_transition_without_status_change(self):
+        """Verifies joins that leave a lobby searching update one row and record nothing."""
+        lobby = Lobby.objects.create(title="Big", game=self.game, host=self.host, size=5)
+        slot = lobby.slots.get(order=2)
+        slot.player = self.player
+
+        with self.assertNumQueries(4):
+            # Savepoint pair, slot UPDATE and lobby UPDATE; no INSERT without a status edge.
+            slot.save()
+
+        lobby.refresh_from_db()
+        self.assertEqual(lobby.status, Status.SEARCHING)
+        self.assertEqual(lobby.previous_status, "")
+        self.assertFalse(lobby.transitions.exists())
+
+    def test_close_cancels_searching_and_completes_running_lobby(self):
+        """Verifies closing picks the end status from the current one."""
+        self.assertTrue(self.lobby.close())
+        self.assertEqual(self.lobby.status, Status.CANCELLED)
+
+        running = Lobby.objects.create(title="Running", game=self.game, host=self.host, size=1)
+        self.assertTrue(running.close())
+
+        running.refresh_from_db()
+        self.assertEqual(running.status, Status.COMPLETED)
+        self.assertEqual(running.transitions.get().trigger, Trigger.CLOSE)
+
+    def test_close_is_idempotent(self):
+        """Verifies an ended lobby cannot be closed again."""
+        self.lobby.close()
+
+        self.assertFalse(Lobby.objects.get(pk=self.lobby.pk).close())
+        self.assertEqual(self.lobby.transitions.count(), 1)
+
+    def test_full_save_keeps_transition_fields(self):
+        """Verifies a stale instance cannot clobber the transition bookkeeping."""
+        stale = Lobby.objects.get(pk=self.lobby.pk)
+        self.slot_2.player = self.player
+        self.slot_2.save()
+
+        stale.title = "Renamed"
+        stale.save()
+
+        self.lobby.refresh_from_db()
+        self.assertEqual(self.lobby.previous_status, Status.SEARCHING)
+        self.assertIsNotNone(self.lobby.status_changed_at)
+
+    def test_batch_only_moves_matching_lobbies(self):
+        """Verifies one UPDATE decides per row and records only the changed lobbies."""
+        big = Lobby.objects.create(title="Big", game=self.game, host=self.host, size=5)
+
+        transition = apply_transition([self.lobby.pk, big.pk], Trigger.MATCH, delta=1)
+
+        self.assertEqual(transition.updated, 2)
+        self.assertEqual(transition.changes, [
+            StatusChange(self.lobby.pk, Status.SEARCHING, Status.IN_PROGRESS, Trigger.MATCH)
+        ])
+
+        self.assertEqual(
+            dict(Lobby.objects.filter(pk__in=[self.lobby.pk, big.pk]).values_list("pk", "status")),
+            {self.lobby.pk: Status.IN_PROGRESS, big.pk: Status.SEARCHING}
+        )
+        self.assertEqual(LobbyTransition.objects.filter(lobby=big).count(), 0)
+        self.assertEqual(LobbyTransition.objects.filter(lobby=self.lobby).count(), 1)
+
+    def test_stale_instance_follows_recorded_change(self):
+        """Verifies the status change comes from the row, not from stale in-memory values."""
+        lobby = Lobby.objects.create(title="Trio", game=self.game, host=self.host, size=3)
+        stale_slot = lobby.slots.select_related("lobby").get(order=3)
+        rival = User.objects.create_user(username="rival", email="rival@test.com", password="password")
+        other_slot = Lobby.objects.get(pk=lobby.pk).slots.get(order=2)
+        other_slot.player = rival
+        other_slot.save()
+
+        self.assertTrue(stale_slot.claim(self.player))
+
+        change = StatusChange(lobby.pk, Status.SEARCHING, Status.IN_PROGRESS, Trigger.JOIN)
+        self.assertEqual(stale_slot.lobby.status_change, change)
+        self.assertEqual(stale_slot.lobby.status, Status.IN_PROGRESS)
+        self.assertEqual(status_event(change).data, {"from": "SE", "to": "IP", "trigger": "join"})
+
+    def test_unchanged_status_records_no_change(self):
+        """Verifies a transition that leaves the status reports no change."""
+        lobby = Lobby.objects.create(title="Trio", game=self.game, host=self.host, size=3)
+        slot = lobby.slots.select_related("lobby").get(order=2)
+        slot.player = self.player
+        slot.save()
+
+        self.assertIsNone(slot.lobby.status_change)
+        self.assertIsNone(status_event(slot.lobby.status_change))
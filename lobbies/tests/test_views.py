@@ -1,9 +1,24 @@
+import random
+import threading
+from typing import Any
+from unittest.mock import Mock, patch
+
+from asgiref.sync import async_to_sync, sync_to_async
 from django.contrib.auth import get_user_model
-from django.test import TestCase
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import Q
+from django.test import RequestFactory, TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
-from games.models import Game, GameRole, UserGameProfile
+from games.models import Game, GameRank, GameRole, UserGameProfile
+from lobbies.events import RedisBroker, Subscription, publish_slot_change
+from lobbies.executors import run_slot_action
 from lobbies.models import Lobby
+from lobbies.services import create_lobby
+from lobbies.views import LobbyListView
 
 User = get_user_model()
 
@@ -198,6 +213,23 @@ class SlotActionTests(TestCase):
         self.slot_2.refresh_from_db()
         self.assertEqual(self.slot_2.player, self.player)
 
+    def test_join_rejects_second_slot_in_same_lobby(self):
+        """A player already seated gets an error instead of a second slot."""
+        self.slot_2.player = self.player
+        self.slot_2.save()
+        slot_3 = self.lobby.slots.get(order=3)
+
+        self.client.force_login(self.player)
+        response = self.client.post(reverse("lobbies:lobby-join", kwargs={
+            "game_slug": self.game.slug,
+            "invite_link": self.lobby.invite_link,
+            "slot_id": slot_3.id
+        }), follow=True)
+
+        self.assertContains(response, "You are already in this lobby")
+        slot_3.refresh_from_db()
+        self.assertIsNone(slot_3.player)
+
     def test_host_cannot_leave_lobby(self):
         """Host attempts to leave their slot -> Error."""
         self.client.force_login(self.host)
@@ -244,3 +276,645 @@ class SlotActionTests(TestCase):
         self.assertEqual(response.status_code, 302)
         self.slot_2.refresh_from_db()
         self.assertIsNone(self.slot_2.player)
+
+    def test_double_kick_shifts_counters_once(self):
+        """A repeated kick, or one arriving after the player left, leaves the counters alone."""
+        self.slot_2.player = self.player
+        self.slot_2.save()
+        self.client.force_login(self.host)
+        url = reverse("lobbies:lobby-kick", kwargs={
+            "game_slug": self.game.slug,
+            "invite_link": self.lobby.invite_link,
+            "slot_id": self.slot_2.id
+        })
+
+        self.client.post(url)
+        response = self.client.post(url)
+
+        self.assertEqual(response.status_code, 302)
+        self.lobby.refresh_from_db()
+        self.assertEqual(self.lobby.filled_slots, 1)
+        self.assertEqual(self.lobby.open_roles, {"any": 4})
+        self.assertEqual(self.lobby.slots.filter(player__isnull=False).count(), 1)
+
+    def test_leaving_full_lobby_lists_it_again(self):
+        """A full lobby that loses a player is searching again and back on the list."""
+        lobby = Lobby.objects.create(title="Duo", game=self.game, host=self.host, size=2)
+        slot = lobby.slots.get(order=2)
+        slot.player = self.player
+        slot.save()
+        list_url = reverse("lobbies:lobby-list", kwargs={"game_slug": self.game.slug})
+        self.assertNotContains(self.client.get(list_url), "Duo")
+
+        self.client.force_login(self.player)
+        self.client.post(reverse("lobbies:lobby-leave", kwargs={
+            "game_slug": self.game.slug,
+            "invite_link": lobby.invite_link,
+            "slot_id": slot.id
+        }))
+
+        lobby.refresh_from_db()
+        self.assertEqual(lobby.status, Lobby.Status.SEARCHING)
+        self.assertContains(self.client.get(list_url), "Duo")
+
+    def test_delete_closes_lobby(self):
+        """Deleting cancels the lobby but keeps it and its history."""
+        self.client.force_login(self.host)
+
+        response = self.client.post(reverse("lobbies:lobby-delete", kwargs={
+            "game_slug": self.game.slug,
+            "invite_link": self.lobby.invite_link
+        }))
+
+        self.assertRedirects(response, reverse("lobbies:lobby-list", kwargs={"game_slug": self.game.slug}))
+        self.lobby.refresh_from_db()
+        self.assertEqual(self.lobby.status, Lobby.Status.CANCELLED)
+        self.assertEqual(self.lobby.transitions.get().trigger, "close")
+
+    def test_detail_query_count_does_not_grow_with_players(self):
+        """Detail page loads every player's game profile in a fixed number of queries."""
+        url = reverse("lobbies:lobby-detail", kwargs={
+            "game_slug": self.game.slug,
+            "invite_link": self.lobby.invite_link
+        })
+        self.slot_2.player = self.player
+        self.slot_2.save()
+
+        with CaptureQueriesContext(connection) as two_players:
+            response = self.client.get(url)
+        self.assertContains(response, "Radiant")
+        self.assertContains(response, "Gold")
+
+        third = User.objects.create_user(username="third", email="t@ex.com", password="pw")
+        UserGameProfile.objects.create(user=third, game=self.game, rank="Silver")
+        slot_3 = self.lobby.slots.get(order=3)
+        slot_3.player = third
+        slot_3.save()
+
+        with CaptureQueriesContext(connection) as three_players:
+            response = self.client.get(url)
+        self.assertContains(response, "Silver")
+
+        self.assertEqual(len(three_players), len(two_players))
+
+    def test_htmx_join_renders_validated_profile(self):
+        """HTMX join returns the slot card with the profile checked before joining."""
+        self.client.force_login(self.player)
+
+        url = reverse("lobbies:lobby-join", kwargs={
+            "game_slug": self.game.slug,
+            "invite_link": self.lobby.invite_link,
+            "slot_id": self.slot_2.id
+        })
+
+        response = self.client.post(url, HTTP_HX_REQUEST="true")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "Gold")
+        self.assertContains(response, "YOU")
+
+
+@override_settings(SLOT_ACTION_WORKERS=2)
+class PooledSlotActionTests(TransactionTestCase):
+    """
+    Tests for slot actions served as async views on the slot-action pool.
+
+    Pool threads use their own database connections, so the data must be
+    committed for them to see it.
+    """
+
+    def setUp(self):
+        self.game = Game.objects.create(title="Valorant", slug="val", team_size=5)
+        self.host = User.objects.create_user(username="host", email="h@ex.com", password="pw")
+        self.player = User.objects.create_user(username="player", email="p@ex.com", password="pw")
+        UserGameProfile.objects.create(user=self.player, game=self.game, rank="Gold")
+
+        self.lobby = Lobby.objects.create(title="Ranked", game=self.game, host=self.host, size=5)
+        self.slot_2 = self.lobby.slots.get(order=2)
+        self.url = reverse("lobbies:lobby-join", kwargs={
+            "game_slug": self.game.slug,
+            "invite_link": self.lobby.invite_link,
+            "slot_id": self.slot_2.id
+        })
+
+    def test_actions_run_on_pool_threads(self):
+        """Slot actions leave the event loop for the dedicated pool."""
+        thread = async_to_sync(run_slot_action)(threading.current_thread)
+
+        self.assertTrue(thread.name.startswith("slot-action"))
+
+    def test_htmx_join_through_pool(self):
+        """A join committed on a pool thread renders the slot card."""
+        self.client.force_login(self.player)
+
+        response = self.client.post(self.url, HTTP_HX_REQUEST="true")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "player")
+        self.slot_2.refresh_from_db()
+        self.assertEqual(self.slot_2.player, self.player)
+
+    def test_login_is_checked_on_the_pool(self):
+        """Anonymous users are redirected to the login page."""
+        response = self.client.post(self.url)
+
+        self.assertEqual(response.status_code, 302)
+        self.assertIn(reverse("login"), response["Location"])
+
+    def test_unsupported_method_is_rejected(self):
+        """Other methods still get a 405 from the async dispatch."""
+        self.client.force_login(self.player)
+
+        self.assertEqual(self.client.get(self.url).status_code, 405)
+
+
+class LobbyCursorPaginationTests(TestCase):
+    """
+    Tests for keyset pagination of LobbyListView.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.game = Game.objects.create(title="CS2", slug="cs2", team_size=5)
+        cls.host = User.objects.create_user(
+            username="host",
+            email="host@ex.com",
+            password="pw"
+        )
+        cls.lobbies = [
+            Lobby.objects.create(title=f"Lobby {i:02d}", game=cls.game, host=cls.host, size=5)
+            for i in range(12)
+        ]
+
+    def setUp(self):
+        cache.clear()
+        self.url = reverse("lobbies:lobby-list", kwargs={"game_slug": self.game.slug})
+
+    def test_first_page_has_next_cursor(self):
+        """The first page shows the newest lobbies and links to the next batch."""
+        response = self.client.get(self.url)
+
+        page = response.context["page_obj"]
+        self.assertEqual(len(page), 10)
+        self.assertTrue(page.has_next())
+        self.assertFalse(page.has_previous())
+        self.assertContains(response, "Lobby 11")
+        self.assertNotContains(response, "Lobby 01")
+
+    def test_next_cursor_returns_remaining_lobbies(self):
+        """Following the next cursor continues after the last lobby shown."""
+        first = self.client.get(self.url).context["page_obj"]
+
+        response = self.client.get(self.url, {"cursor": first.next_cursor})
+
+        page = response.context["page_obj"]
+        self.assertEqual([lobby.title for lobby in page], ["Lobby 01", "Lobby 00"])
+        self.assertFalse(page.has_next())
+        self.assertTrue(page.has_previous())
+
+        previous = self.client.get(self.url, {"cursor": page.previous_cursor}).context["page_obj"]
+        self.assertEqual([lobby.title for lobby in previous], [f"Lobby {i:02d}" for i in range(11, 1, -1)])
+
+    def test_htmx_request_returns_partial(self):
+        """HTMX "load more" requests render only the lobby cards."""
+        first = self.client.get(self.url).context["page_obj"]
+
+        response = self.client.get(
+            self.url,
+            {"cursor": first.next_cursor},
+            HTTP_HX_REQUEST="true"
+        )
+
+        self.assertTemplateUsed(response, "lobbies/partials/lobby_page.html")
+        self.assertTemplateNotUsed(response, "base.html")
+        self.assertContains(response, "Lobby 00")
+
+    def test_invalid_cursor_returns_404(self):
+        response = self.client.get(self.url, {"cursor": "not-a-cursor"})
+
+        self.assertEqual(response.status_code, 404)
+
+
+class LobbyRoleFilterTests(TestCase):
+    """
+    Tests for the role filter and "Looking for" icons, served from Lobby.open_roles.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.game = Game.objects.create(title="Valorant", slug="valorant", team_size=5)
+        cls.duelist = GameRole.objects.create(game=cls.game, name="Duelist", order=1)
+        cls.sentinel = GameRole.objects.create(game=cls.game, name="Sentinel", order=2)
+        cls.host = User.objects.create_user(username="host", email="h@ex.com", password="pw")
+        cls.player = User.objects.create_user(username="player", email="p@ex.com", password="pw")
+        cls.url = reverse("lobbies:lobby-list", kwargs={"game_slug": cls.game.slug})
+
+    def setUp(self):
+        cache.clear()
+
+    def make_lobby(self, title: str, *roles: GameRole) -> Lobby:
+        return create_lobby(Lobby(title=title, game=self.game, host=self.host, size=len(roles) + 1), needed_roles=roles)
+
+    def titles(self, **params: Any) -> list:
+        # Logged in, so the anonymous list cache never serves a stale page.
+        self.client.force_login(self.host)
+        return [lobby.title for lobby in self.client.get(self.url, params).context["lobbies"]]
+
+    def test_role_filter_matches_open_role_and_flex_slots(self):
+        """Lobbies with an open slot for the role or for any role are listed."""
+        self.make_lobby("Needs duelist", self.duelist)
+        self.make_lobby("Needs sentinel", self.sentinel)
+        create_lobby(Lobby(title="Flex", game=self.game, host=self.host, size=2))
+
+        self.assertEqual(self.titles(role=self.duelist.id), ["Flex", "Needs duelist"])
+
+    def test_role_filter_follows_joins_and_leaves(self):
+        """Taking the last slot of a role removes the lobby from that role's results."""
+        lobby = self.make_lobby("Duo", self.duelist, self.sentinel)
+        slot = lobby.slots.get(required_role=self.duelist)
+
+        slot.player = self.player
+        slot.save()
+        self.assertEqual(self.titles(role=self.duelist.id), [])
+        self.assertEqual(self.titles(role=self.sentinel.id), ["Duo"])
+
+        slot.player = None
+        slot.save()
+        self.assertEqual(self.titles(role=self.duelist.id), ["Duo"])
+
+    def test_list_renders_open_roles_without_loading_slots(self):
+        """The icons come from the lobby row; no slot is queried."""
+        self.make_lobby("Trio", self.sentinel, self.duelist, self.duelist)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url)
+
+        self.assertFalse([q for q in queries.captured_queries if "lobbies_slot" in q["sql"]])
+        self.assertEqual(
+            response.context["lobbies"][0].open_slot_roles,
+            [self.duelist, self.duelist, self.sentinel]
+        )
+        self.assertContains(response, "Need: Duelist", count=2)
+
+
+class LobbyFilterEquivalenceTests(TestCase):
+    """
+    Checks the semi-join visibility filter and the open_roles role filter
+    against the slot join + DISTINCT they replaced, on random data.
+    """
+
+    seeds = (1, 7, 42)
+
+    def seed_dataset(self, rng: random.Random) -> tuple:
+        game = Game.objects.create(title=f"Game {rng.random()}", slug=f"game-{rng.randrange(10 ** 9)}", team_size=5)
+        roles = [GameRole.objects.create(game=game, name=f"Role {i}", order=i) for i in range(3)]
+        users = [
+            User.objects.create_user(username=f"u{game.id}-{i}", email=f"u{game.id}-{i}@ex.com", password="pw")
+            for i in range(6)
+        ]
+
+        for i in range(25):
+            size = rng.randint(1, 5)
+            lobby = create_lobby(
+                Lobby(title=f"L{i}", game=game, host=rng.choice(users), size=size, is_public=rng.random() < 0.5),
+                needed_roles=[rng.choice(roles + [None]) for _ in range(rng.randint(0, size - 1))]
+            )
+            members = {lobby.host_id}
+            for slot in lobby.slots.exclude(order=1):
+                player = rng.choice(users + [None, None])
+                if player is not None and player.id not in members:
+                    members.add(player.id)
+                    slot.player = player
+                    slot.save()
+
+        return game, roles, users
+
+    def filtered_ids(self, game: Game, viewer: Any, params: dict) -> list:
+        request = RequestFactory().get("/", params)
+        request.user = viewer
+        view = LobbyListView()
+        view.setup(request, game_slug=game.slug)
+        return list(view.get_filtered_queryset().order_by("-created_at", "-id").values_list("id", flat=True))
+
+    def legacy_ids(self, game: Game, viewer: Any, params: dict) -> list:
+        queryset = Lobby.objects.filter(game=game, status=Lobby.Status.SEARCHING)
+        if viewer.is_authenticated:
+            queryset = queryset.filter(Q(is_public=True) | Q(host=viewer) | Q(slots__player=viewer)).distinct()
+        else:
+            queryset = queryset.filter(is_public=True)
+        if params.get("role"):
+            queryset = queryset.filter(
+                Q(slots__player__isnull=True) &
+                (Q(slots__required_role_id=params["role"]) | Q(slots__required_role__isnull=True))
+            ).distinct()
+        return list(queryset.order_by("-created_at", "-id").values_list("id", flat=True))
+
+    def test_filters_match_legacy_join(self):
+        """Same lobbies, same order, no duplicates, for every viewer and role."""
+        for seed in self.seeds:
+            rng = random.Random(seed)
+            game, roles, users = self.seed_dataset(rng)
+
+            for viewer in [AnonymousUser(), *users]:
+                for params in [{}, *({"role": role.id} for role in roles)]:
+                    with self.subTest(seed=seed, viewer=str(viewer), params=params):
+                        ids = self.filtered_ids(game, viewer, params)
+                        self.assertEqual(ids, self.legacy_ids(game, viewer, params))
+                        self.assertEqual(len(ids), len(set(ids)))
+
+    def test_no_distinct_in_list_query(self):
+        """The authenticated list query is a plain scan of lobby rows."""
+        game, roles, users = self.seed_dataset(random.Random(0))
+        request = RequestFactory().get("/", {"role": roles[0].id})
+        request.user = users[0]
+        view = LobbyListView()
+        view.setup(request, game_slug=game.slug)
+
+        sql = str(view.get_filtered_queryset().query).upper()
+
+        self.assertNotIn("DISTINCT", sql)
+        self.assertNotIn("JOIN", sql)
+
+
+class LobbyRankFilterTests(TestCase):
+    """
+    Tests for the rank range filter of the lobby list.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.game = Game.objects.create(title="Valorant", slug="valorant", team_size=5)
+        cls.gold = GameRank.objects.create(game=cls.game, name="Gold", value=4)
+        cls.radiant = GameRank.objects.create(game=cls.game, name="Radiant", value=9)
+        cls.host = User.objects.create_user(username="host", email="h@ex.com", password="pw")
+
+        cls.open_lobby = Lobby.objects.create(title="Anyone", game=cls.game, host=cls.host, size=5)
+        cls.high_lobby = Lobby.objects.create(
+            title="Radiant only", game=cls.game, host=cls.host, size=5, min_rank=cls.radiant.value
+        )
+        cls.low_lobby = Lobby.objects.create(
+            title="Gold and below", game=cls.game, host=cls.host, size=5, max_rank=cls.gold.value
+        )
+
+    def setUp(self):
+        cache.clear()
+
+    def test_rank_filter_uses_range(self):
+        """Only lobbies whose range contains the selected rank are listed."""
+        url = reverse("lobbies:lobby-list", kwargs={"game_slug": self.game.slug})
+
+        response = self.client.get(url, {"rank": self.gold.value})
+        self.assertContains(response, "Anyone")
+        self.assertContains(response, "Gold and below")
+        self.assertNotContains(response, "Radiant only")
+
+        response = self.client.get(url, {"rank": self.radiant.value})
+        self.assertContains(response, "Radiant only")
+        self.assertNotContains(response, "Gold and below")
+
+    def test_rank_range_badge(self):
+        """Lobby cards show the named bounds of their rank range."""
+        response = self.client.get(reverse("lobbies:lobby-list", kwargs={"game_slug": self.game.slug}))
+
+        self.assertContains(response, "Radiant – Any")
+        self.assertContains(response, "Any – Gold")
+
+
+class LobbySearchTests(TestCase):
+    """
+    Tests for the full-text search of the lobby list.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.game = Game.objects.create(title="Valorant", slug="valorant", team_size=5)
+        cls.gold = GameRank.objects.create(game=cls.game, name="Gold", value=4)
+        cls.host = User.objects.create_user(username="host", email="h@ex.com", password="pw")
+
+        cls.eu_lobby = Lobby.objects.create(
+            title="EU ranked grind", description="Chill players, mic required.",
+            game=cls.game, host=cls.host, size=5
+        )
+        cls.na_lobby = Lobby.objects.create(
+            title="NA casual", description="Chill vibes only.",
+            game=cls.game, host=cls.host, size=5, min_rank=9
+        )
+        cls.other_lobby = Lobby.objects.create(
+            title="Tryhards", description="Comms in English.",
+            game=cls.game, host=cls.host, size=5
+        )
+
+    def setUp(self):
+        cache.clear()
+        self.url = reverse("lobbies:lobby-list", kwargs={"game_slug": self.game.slug})
+
+    def test_search_matches_title_and_description(self):
+        """Terms are matched against both the title and the description."""
+        response = self.client.get(self.url, {"q": "chill"})
+        self.assertContains(response, "EU ranked grind")
+        self.assertContains(response, "NA casual")
+        self.assertNotContains(response, "Tryhards")
+
+        response = self.client.get(self.url, {"q": "EU"})
+        self.assertContains(response, "EU ranked grind")
+        self.assertNotContains(response, "NA casual")
+
+    def test_search_matches_prefixes(self):
+        """The last typed word matches as a prefix."""
+        response = self.client.get(self.url, {"q": "tryh"})
+
+        self.assertContains(response, "Tryhards")
+        self.assertNotContains(response, "EU ranked grind")
+
+    def test_search_ranks_best_match_first(self):
+        """Lobbies matching every term are required; stronger matches come first."""
+        Lobby.objects.create(
+            title="Chill", description="Chill chill, very chill.", game=self.game, host=self.host, size=5
+        )
+
+        response = self.client.get(self.url, {"q": "chill"})
+        titles = [lobby.title for lobby in response.context["page_obj"].object_list]
+        self.assertEqual(titles[0], "Chill")
+        self.assertEqual(len(titles), 3)
+
+        response = self.client.get(self.url, {"q": "chill mic"})
+        titles = [lobby.title for lobby in response.context["page_obj"].object_list]
+        self.assertEqual(titles, ["EU ranked grind"])
+
+    def test_search_composes_with_filters(self):
+        """Search narrows the result of the other list filters."""
+        response = self.client.get(self.url, {"q": "chill", "rank": self.gold.value})
+
+        self.assertContains(response, "EU ranked grind")
+        self.assertNotContains(response, "NA casual")
+
+    def test_search_index_follows_edits(self):
+        """Updated and deleted lobbies are reflected in the search results."""
+        self.other_lobby.description = "Chill and friendly."
+        self.other_lobby.save()
+        self.eu_lobby.delete()
+
+        response = self.client.get(self.url, {"q": "chill"})
+
+        self.assertContains(response, "Tryhards")
+        self.assertContains(response, "NA casual")
+        self.assertNotContains(response, "EU ranked grind")
+
+    def test_search_pages_by_offset(self):
+        """Search results page with offset cursors and reject malformed ones."""
+        for i in range(10):
+            Lobby.objects.create(title=f"Chill room {i}", game=self.game, host=self.host, size=5)
+
+        first = self.client.get(self.url, {"q": "chill"}).context["page_obj"]
+        self.assertIsNotNone(first.next_cursor)
+
+        second = self.client.get(self.url, {"q": "chill", "cursor": first.next_cursor}).context["page_obj"]
+        first_ids = {lobby.id for lobby in first.object_list}
+        second_ids = {lobby.id for lobby in second.object_list}
+        self.assertFalse(first_ids & second_ids)
+        self.assertEqual(len(first_ids | second_ids), 12)
+
+        response = self.client.get(self.url, {"q": "chill", "cursor": "garbage"})
+        self.assertEqual(response.status_code, 404)
+
+    def test_search_query_is_kept_in_links(self):
+        """The search box and filter links carry the current query."""
+        response = self.client.get(self.url, {"q": "chill"})
+
+        self.assertContains(response, 'name="q" value="chill"')
+        self.assertContains(response, "&q=chill")
+
+
+class LobbyListCacheTests(TestCase):
+    """
+    Tests for the anonymous lobby list fragment cache.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.game = Game.objects.create(title="Overwatch", slug="ow", team_size=5)
+        cls.host = User.objects.create_user(
+            username="host",
+            email="host@ex.com",
+            password="pw"
+        )
+        cls.player = User.objects.create_user(
+            username="player",
+            email="player@ex.com",
+            password="pw"
+        )
+        cls.lobby = Lobby.objects.create(title="Cached Room", game=cls.game, host=cls.host, size=5)
+
+    def setUp(self):
+        cache.clear()
+        self.url = reverse("lobbies:lobby-list", kwargs={"game_slug": self.game.slug})
+
+    def test_cache_hit_does_not_touch_database(self):
+        """A repeated anonymous request is served from the cache."""
+        self.client.get(self.url)
+
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url)
+
+        self.assertContains(response, "Cached Room")
+        self.assertContains(response, "1 / 5")
+
+    def test_slot_change_invalidates_cached_list(self):
+        """Joining a slot bumps the game version and the list is re-rendered."""
+        self.client.get(self.url)
+
+        slot = self.lobby.slots.get(order=2)
+        with self.captureOnCommitCallbacks(execute=True):
+            slot.player = self.player
+            slot.save()
+
+        response = self.client.get(self.url)
+        self.assertContains(response, "2 / 5")
+
+    def test_authenticated_users_bypass_cache(self):
+        """Logged-in users see their private lobbies, so they are never served from the cache."""
+        self.client.get(self.url)
+        self.client.force_login(self.host)
+
+        response = self.client.get(self.url)
+
+        self.assertIn("page_obj", response.context)
+
+
+class LobbyEventsTests(TestCase):
+    """
+    Tests for the Server-Sent Events stream of slot updates.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.game = Game.objects.create(title="Apex", slug="apex", team_size=3)
+        cls.host = User.objects.create_user(
+            username="host",
+            email="host@ex.com",
+            password="pw"
+        )
+        cls.player = User.objects.create_user(
+            username="newcomer",
+            email="newcomer@ex.com",
+            password="pw"
+        )
+        UserGameProfile.objects.create(user=cls.player, game=cls.game, rank="Diamond")
+        cls.lobby = Lobby.objects.create(title="Live Room", game=cls.game, host=cls.host, size=3)
+        cls.slot = cls.lobby.slots.get(order=2)
+
+    async def test_stream_pushes_rendered_slot_card(self):
+        """A committed slot change is delivered as a rendered slot card event."""
+        url = reverse("lobbies:lobby-events", kwargs={
+            "game_slug": self.game.slug,
+            "invite_link": self.lobby.invite_link
+        })
+        response = await self.async_client.get(url)
+
+        self.assertEqual(response["Content-Type"], "text/event-stream")
+        stream = aiter(response.streaming_content)
+        self.assertEqual(await anext(stream), b": connected\n\n")
+
+        def join_slot():
+            self.slot.player = self.player
+            self.slot.save()
+            publish_slot_change(self.slot, None)
+
+        await sync_to_async(join_slot)()
+        event = (await anext(stream)).decode()
+        await stream.aclose()
+
+        self.assertIn("event: slot", event)
+        self.assertIn(f'id="slot-{self.slot.id}"', event)
+        self.assertIn("newcomer", event)
+        self.assertIn("Diamond", event)
+
+    @override_settings(LOBBY_EVENTS_REDIS_URL="redis://localhost:6379/0", LOBBY_EVENTS_CHANNEL_PREFIX="test:")
+    async def test_redis_broker_relays_events_of_other_processes(self):
+        """Events published through Redis reach the streams of the listening process."""
+        publisher, listener = RedisBroker(), RedisBroker()
+        publisher._client = Mock()
+
+        publisher.publish("lobby:1", {"slot_id": 3})
+        channel, data = publisher._client.publish.call_args.args
+        self.assertEqual(channel, "test:lobby:1")
+
+        async with Subscription(listener, "lobby:1") as subscription:
+            listener._dispatch({"type": "pmessage", "channel": channel.encode(), "data": data.encode()})
+            self.assertEqual(await subscription.get(1), {"slot_id": 3})
+
+    def test_join_publishes_event_on_commit(self):
+        """JoinSlotView announces the change only once the transaction commits."""
+        self.client.force_login(self.player)
+        url = reverse("lobbies:lobby-join", kwargs={
+            "game_slug": self.game.slug,
+            "invite_link": self.lobby.invite_link,
+            "slot_id": self.slot.id
+        })
+
+        with patch("lobbies.views.publish_slot_change") as publish:
+            with self.captureOnCommitCallbacks(execute=True):
+                self.client.post(url)
+
+        publish.assert_called_once()
+        self.assertEqual(publish.call_args.args[0].player, self.player)
@@ -1,5 +1,6 @@
 from django.urls import path
 
+from .api import LobbyDetailAPIView, LobbyListAPIView
 from .views import (
     LobbyListView,
     LobbyCreateView,
@@ -8,7 +9,8 @@ from .views import (
     JoinSlotView,
     LeaveSlotView,
     KickPlayerView,
-    ToggleLobbyPrivacyView
+    ToggleLobbyPrivacyView,
+    LobbyEventsView
 )
 
 app_name = "lobbies"
@@ -19,6 +21,11 @@ urlpatterns = [
         LobbyListView.as_view(),
         name="lobby-list"
     ),
+    path(
+        "<slug:game_slug>/api/",
+        LobbyListAPIView.as_view(),
+        name="api-lobby-list"
+    ),
     path(
         "<slug:game_slug>/create/",
         LobbyCreateView.as_view(),
@@ -29,6 +36,11 @@ urlpatterns = [
         LobbyDetailView.as_view(),
         name="lobby-detail"
     ),
+    path(
+        "<slug:game_slug>/<uuid:invite_link>/api/",
+        LobbyDetailAPIView.as_view(),
+        name="api-lobby-detail"
+    ),
     path(
         "<slug:game_slug>/<uuid:invite_link>/delete/",
         LobbyDeleteView.as_view(),
@@ -54,4 +66,9 @@ urlpatterns = [
         ToggleLobbyPrivacyView.as_view(),
         name="lobby-toggle-privacy"
     ),
+    path(
+        "<slug:game_slug>/<uuid:invite_link>/events/",
+        LobbyEventsView.as_view(),
+        name="lobby-events"
+    ),
 ]
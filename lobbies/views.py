@@ -1,18 +1,39 @@
-from typing import Any, Dict
+from inspect import isawaitable
+from typing import Any, AsyncIterator, Dict
 
+from asgiref.sync import sync_to_async
+
+from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
-from django.db import transaction
-from django.db.models import Count, Q, F, Subquery, OuterRef, IntegerField, Prefetch, QuerySet
-from django.db.models.functions import Coalesce
-from django.http import HttpResponse, HttpResponseForbidden, HttpRequest
+from django.db import IntegrityError, transaction
+from django.db.models import F, Prefetch, Q, QuerySet, prefetch_related_objects
+from django.http import Http404, HttpResponse, HttpResponseForbidden, HttpRequest, StreamingHttpResponse
 from django.shortcuts import render, get_object_or_404, redirect
+from django.template.loader import render_to_string
+from django.utils.safestring import mark_safe
 from django.urls import reverse, reverse_lazy
 from django.views import generic, View
 
-from games.models import Game, UserGameProfile, GameRole
+from games.models import UserGameProfile
+from games.registry import game_registry, get_game_or_404
+from lobbies.activity import log_events, slot_event, status_event
+from lobbies.caching import get_list_cache, list_fragment_key
+from lobbies.events import (
+    format_sse,
+    get_audience,
+    get_broker,
+    lobby_channel,
+    publish_slot_change,
+    render_slot_card,
+)
+from lobbies.executors import run_slot_action
 from lobbies.forms import LobbyForm
-from lobbies.models import Lobby, Slot
+from lobbies.models import Lobby, LobbyEvent, LobbyTransition, Slot
+from lobbies.open_roles import expand, open_role_filter
+from lobbies.pagination import CursorPaginator, InvalidCursor, RankedPaginator
+from lobbies.search import search_lobbies, search_terms
+from lobbies.services import create_lobby
 
 
 class HTMXRedirect(HttpResponse):
@@ -25,20 +46,37 @@ class HTMXRedirect(HttpResponse):
         self.status_code = 200
 
 
-class LobbyListView(generic.ListView):
+def slots_with_profiles(game_id: int) -> Prefetch:
     """
-    Displays a list of active lobbies for a specific game.
+    Prefetches a lobby's slots with their player, required role and the
+    player's profile (and main role) for the lobby's game.
 
-    Includes complex filtering logic for roles and availability,
-    and optimizes database queries with subqueries and prefetching.
+    The profile is stored in 'player.game_profile_cache' as a list of at
+    most one item, the same way the lobby list caches host profiles.
     """
-    model = Lobby
-    context_object_name = "lobbies"
-    paginate_by = 10
+    return Prefetch(
+        "slots",
+        queryset=Slot.objects.select_related("player", "required_role").prefetch_related(
+            Prefetch(
+                "player__game_profiles",
+                queryset=UserGameProfile.objects.filter(game_id=game_id).select_related("main_role"),
+                to_attr="game_profile_cache"
+            )
+        )
+    )
 
-    def get_queryset(self) -> QuerySet[Lobby]:
-        game_slug = self.kwargs.get("game_slug")
-        self.game = get_object_or_404(Game, slug=game_slug)
+
+class LobbyFilterMixin:
+    """
+    Shared filtering of the searching lobbies of a game.
+
+    Applies visibility, role, availability, rank and full-text search
+    ('q') filters from the query string. Used by the HTML list and the
+    JSON API so both always return the same lobbies.
+    """
+
+    def get_filtered_queryset(self) -> QuerySet[Lobby]:
+        self.game = get_game_or_404(self.kwargs.get("game_slug"))
         user = self.request.user
 
         queryset = Lobby.objects.filter(
@@ -47,63 +85,154 @@ class LobbyListView(generic.ListView):
         )
 
         if user.is_authenticated:
+            # A semi-join on the viewer's slots instead of a slot join: each
+            # lobby stays a single row, so no DISTINCT has to sort or hash the
+            # joined rows before pagination. The subquery is uncorrelated, so
+            # it runs once (a hashed subplan on PostgreSQL) and the lobby
+            # index still yields rows in list order.
             queryset = queryset.filter(
                 Q(is_public=True) |
                 Q(host=user) |
-                Q(slots__player=user)
-            ).distinct()
+                Q(pk__in=Slot.objects.filter(player=user).values("lobby_id"))
+            )
         else:
             queryset = queryset.filter(is_public=True)
 
         role_id = self.request.GET.get("role")
         if role_id:
-            queryset = queryset.filter(
-                Q(slots__player__isnull=True) &
-                (
-                        Q(slots__required_role_id=role_id) |
-                        Q(slots__required_role__isnull=True)
-                )
-            ).distinct()
-
-        filled_slots_subquery = Slot.objects.filter(
-            lobby=OuterRef("pk"),
-            player__isnull=False
-        ).values("lobby").annotate(
-            count=Count("id")
-        ).values("count")
-
-        queryset = queryset.select_related(
-            "host", "game"
-        ).annotate(
-            filled_slots_count=Coalesce(
-                Subquery(filled_slots_subquery),
-                0,
-                output_field=IntegerField()
-            )
+            # A key lookup on the open_roles summary instead of a slot join.
+            queryset = queryset.filter(open_role_filter(role_id))
+
+        if self.request.GET.get("available_only"):
+            queryset = queryset.filter(filled_slots__lt=F("size"))
+
+        rank_value = self.get_rank_value()
+        if rank_value is not None:
+            # Open bounds are stored as the extremes, so this is a single range predicate.
+            queryset = queryset.filter(min_rank__lte=rank_value, max_rank__gte=rank_value)
+
+        self.search_terms = search_terms(self.request.GET.get("q", ""))
+        if self.search_terms:
+            queryset = search_lobbies(queryset, self.search_terms)
+
+        return queryset
+
+    def get_rank_value(self) -> int | None:
+        """Parses the 'rank' filter (a ladder value of the game)."""
+        try:
+            return int(self.request.GET["rank"])
+        except (KeyError, ValueError):
+            return None
+
+    def get_paginator_for(self, queryset: QuerySet, page_size: int) -> CursorPaginator | RankedPaginator:
+        """Search results are ordered by relevance instead of recency."""
+        if self.search_terms:
+            return RankedPaginator(queryset, page_size)
+        return CursorPaginator(queryset, page_size)
+
+
+class LobbyListView(LobbyFilterMixin, generic.ListView):
+    """
+    Displays a list of active lobbies for a specific game.
+
+    Includes complex filtering logic for roles, availability, rank and
+    full-text search ('q'), and optimizes database queries with the
+    denormalized slot counter and open roles summary.
+    Pages are served with keyset pagination on (created_at, id), search
+    results by relevance; HTMX "load more" requests receive only the next
+    batch of lobby cards.
+
+    For anonymous visitors the rendered list fragment is cached per game and
+    query string, so a cache hit is served without touching the database.
+    """
+    model = Lobby
+    context_object_name = "lobbies"
+    paginate_by = 10
+
+    def get(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
+        if not request.user.is_authenticated:
+            game = game_registry.get(kwargs["game_slug"])
+            if game is not None:
+                fragment = get_list_cache().get(list_fragment_key(game.id, request))
+                if fragment is not None:
+                    return self._render_fragment(mark_safe(fragment))
+
+        return super().get(request, *args, **kwargs)
+
+    def get_queryset(self) -> QuerySet[Lobby]:
+        # The game is known already; joining it makes SQLite scan games first
+        # and sort the lobbies instead of reading them in index order.
+        return self.get_filtered_queryset().select_related(
+            "host"
         ).prefetch_related(
-            "slots__player",
-            "slots__required_role",
             Prefetch(
                 "host__game_profiles",
                 queryset=UserGameProfile.objects.filter(game=self.game),
                 to_attr="host_profile_cache"
             )
-        ).order_by("-created_at")
+        ).order_by("-created_at", "-id")
 
-        if self.request.GET.get("available_only"):
-            queryset = queryset.filter(filled_slots_count__lt=F("size"))
+    def paginate_queryset(self, queryset: QuerySet[Lobby], page_size: int) -> tuple:
+        """
+        Replaces offset pagination with a cursor page, skipping the COUNT query.
+        """
+        paginator = self.get_paginator_for(queryset, page_size)
 
-        return queryset
+        try:
+            page = paginator.page(self.request.GET.get("cursor"))
+        except InvalidCursor:
+            raise Http404("Invalid cursor.")
+
+        return paginator, page, page.object_list, page.has_other_pages()
+
+    def render_to_response(self, context: Dict[str, Any], **response_kwargs: Any) -> HttpResponse:
+        """
+        Renders the list fragment and stores it in the cache for anonymous visitors.
+        """
+        if self.request.headers.get("HX-Request"):
+            template_name = "lobbies/partials/lobby_page.html"
+        else:
+            template_name = "lobbies/partials/lobby_list_content.html"
+
+        fragment = render_to_string(template_name, context, self.request)
+
+        if not self.request.user.is_authenticated:
+            get_list_cache().set(
+                list_fragment_key(self.game.id, self.request),
+                fragment,
+                settings.LOBBY_LIST_CACHE_TIMEOUT
+            )
+
+        return self._render_fragment(fragment)
+
+    def _render_fragment(self, fragment: str) -> HttpResponse:
+        if self.request.headers.get("HX-Request"):
+            return HttpResponse(fragment)
+
+        return render(self.request, "lobbies/lobby_list.html", {"list_fragment": fragment})
 
     def get_context_data(self, **kwargs: Any) -> Dict[str, Any]:
         context = super().get_context_data(**kwargs)
         context["game"] = self.game
-        context["roles"] = GameRole.objects.filter(game=self.game).order_by("order")
+        context["roles"] = roles = list(self.game.roles.all())
+
+        # The "Looking for" icons are drawn from the open_roles summary, so
+        # no slot of the listed lobbies is loaded.
+        roles_by_id = {role.id: role for role in roles}
+        for lobby in context["lobbies"]:
+            lobby.game = self.game
+            lobby.open_slot_roles = expand(lobby.open_roles, roles_by_id)
 
         current_role_id = self.request.GET.get("role")
         if current_role_id:
             context["current_role_id"] = int(current_role_id)
 
+        ranks = list(self.game.ranks.all())
+        context["ranks"] = ranks
+        context["rank_names"] = {rank.value: rank.name for rank in ranks}
+        context["current_rank"] = self.get_rank_value()
+        context["current_query"] = self.request.GET.get("q", "").strip()
+
         return context
 
 
@@ -119,7 +248,7 @@ class LobbyCreateView(LoginRequiredMixin, generic.CreateView):
 
     def setup(self, request: HttpRequest, *args: Any, **kwargs: Any) -> None:
         super().setup(request, *args, **kwargs)
-        self.game = get_object_or_404(Game, slug=self.kwargs.get("game_slug"))
+        self.game = get_game_or_404(self.kwargs.get("game_slug"))
 
     def dispatch(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
         if request.user.is_authenticated and not request.user.game_profiles.filter(game=self.game).exists():
@@ -145,28 +274,11 @@ class LobbyCreateView(LoginRequiredMixin, generic.CreateView):
         form.instance.host = self.request.user
         form.instance.game = self.game
 
-        with transaction.atomic():
-            self.object = form.save()
-
-            host_role = form.cleaned_data.get("host_role")
-            if host_role:
-                self.object.slots.filter(order=1).update(required_role=host_role)
-
-            needed_roles = form.cleaned_data.get("needed_roles")
-            if needed_roles:
-                empty_slots = list(
-                    self.object.slots.exclude(order=1)
-                    .order_by("order")[:len(needed_roles)]
-                )
-
-                slots_to_update = []
-                for i, role in enumerate(needed_roles):
-                    if i < len(empty_slots):
-                        empty_slots[i].required_role = role
-                        slots_to_update.append(empty_slots[i])
-
-                if slots_to_update:
-                    Slot.objects.bulk_update(slots_to_update, ["required_role"])
+        self.object = create_lobby(
+            form.instance,
+            host_role=form.cleaned_data.get("host_role"),
+            needed_roles=form.cleaned_data.get("needed_roles")
+        )
 
         return redirect(self.get_success_url())
 
@@ -185,43 +297,38 @@ class LobbyDetailView(generic.DetailView):
     def get_queryset(self) -> QuerySet[Lobby]:
         """
         Displays the lobby dashboard.
+        """
+        return super().get_queryset().select_related("host", "game")
 
+    def get_object(self, queryset: QuerySet | None = None) -> Lobby:
+        """
         Fetches all necessary related data (slots, players, profiles) to
         minimize database queries when rendering the lobby grid.
+
+        The game is only known once the lobby is loaded, so the slots and the
+        game-specific profiles of their players are prefetched afterwards.
         """
-        return super().get_queryset().select_related(
-            "host", "game"
-        ).prefetch_related(
-            "slots__player",
-            "slots__required_role"
-        ).annotate(
-            filled_slots_count=Count("slots", filter=Q(slots__player__isnull=False))
-        )
+        lobby = super().get_object(queryset)
+        prefetch_related_objects([lobby], slots_with_profiles(lobby.game_id))
+        return lobby
 
     def get_context_data(self, **kwargs: Any) -> Dict[str, Any]:
         context = super().get_context_data(**kwargs)
-        lobby = self.object
-
-        player_ids = [slot.player.id for slot in lobby.slots.all() if slot.player]
-
-        profiles = UserGameProfile.objects.filter(
-            user_id__in=player_ids,
-            game=lobby.game
-        ).select_related("main_role")
-
-        profiles_dict = {p.user_id: p for p in profiles}
-
-        context["profiles_dict"] = profiles_dict
 
         if self.request.user.is_authenticated:
-            context['user_is_in_lobby'] = self.request.user.id in player_ids
+            context['user_is_in_lobby'] = any(
+                slot.player_id == self.request.user.id for slot in self.object.slots.all()
+            )
 
         return context
 
 
 class LobbyDeleteView(LoginRequiredMixin, UserPassesTestMixin, generic.DeleteView):
     """
-    Allows the host to delete (cancel) the lobby.
+    Allows the host to close the lobby.
+
+    The lobby is not deleted: it is cancelled (or completed if it was
+    running), which takes it off the list and keeps its history.
     """
     model = Lobby
     slug_url_kwarg = "invite_link"
@@ -233,7 +340,7 @@ class LobbyDeleteView(LoginRequiredMixin, UserPassesTestMixin, generic.DeleteVie
         return self._cached_object
 
     def test_func(self) -> bool:
-        """Ensures only the host can delete the lobby."""
+        """Ensures only the host can close the lobby."""
         return self.get_object().host == self.request.user
 
     def get_success_url(self) -> str:
@@ -242,6 +349,36 @@ class LobbyDeleteView(LoginRequiredMixin, UserPassesTestMixin, generic.DeleteVie
             kwargs={"game_slug": self.get_object().game.slug}
         )
 
+    def form_valid(self, form: Any) -> HttpResponse:
+        lobby = self.get_object()
+
+        if lobby.close():
+            log_events(status_event(lobby.status_change, self.request.user.id))
+
+        return redirect(self.get_success_url())
+
+
+class PooledDispatchMixin:
+    """
+    Serves a sync view as a coroutine under ASGI.
+
+    The whole sync dispatch (login check, locking transaction, rendering)
+    runs on the bounded slot-action pool while the request coroutine
+    awaits, so a join storm queues on the pool instead of spawning a thread
+    per request. Must come before LoginRequiredMixin, whose check may query
+    the database.
+    """
+    view_is_async = True
+
+    async def dispatch(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
+        response = await run_slot_action(super().dispatch, request, *args, **kwargs)
+
+        # View answers unsupported methods with a coroutine when view_is_async is set.
+        if isawaitable(response):
+            response = await response
+
+        return response
+
 
 class SlotActionMixin:
     """
@@ -250,9 +387,17 @@ class SlotActionMixin:
     """
 
     def _get_locked_slot(self, slot_id: int, invite_link: str) -> Slot:
-        """ Fetches a slot with SELECT FOR UPDATE to prevent race conditions. """
+        """
+        Fetches a slot with SELECT FOR UPDATE to prevent race conditions.
+
+        The slot and its lobby are locked, so the player seen here is the one
+        the counter shift starts from; the game, host, player and required
+        role are only joined so the slot card renders without extra queries.
+        """
         return get_object_or_404(
-            Slot.objects.select_for_update().select_related('lobby'),
+            Slot.objects.select_for_update(of=("self", "lobby")).select_related(
+                "lobby__game", "lobby__host", "player", "required_role"
+            ),
             id=slot_id,
             lobby__invite_link=invite_link
         )
@@ -288,10 +433,15 @@ class SlotActionMixin:
         return self._redirect_to_lobby(game_slug, invite_link)
 
 
-class JoinSlotView(LoginRequiredMixin, SlotActionMixin, View):
+class JoinSlotView(PooledDispatchMixin, LoginRequiredMixin, SlotActionMixin, View):
     """
     Handles a user's request to occupy a specific slot.
-    Uses database locking to prevent two users from taking the same slot simultaneously.
+
+    The join is optimistic: the slot is read without locks and claimed with
+    a conditional UPDATE (see Slot.claim), so concurrent joins to the same
+    lobby never queue behind each other's checks. The checks on the loaded
+    lobby only fail fast; the UPDATE and the 'unique_player_per_lobby'
+    constraint have the final word.
     """
 
     def post(
@@ -301,49 +451,59 @@ class JoinSlotView(LoginRequiredMixin, SlotActionMixin, View):
         invite_link: str,
         slot_id: int
     ) -> HttpResponse:
-        with transaction.atomic():
-            slot = self._get_locked_slot(slot_id, invite_link)
-            lobby = slot.lobby
+        slot = get_object_or_404(
+            Slot.objects.select_related("lobby__game", "lobby__host", "required_role"),
+            id=slot_id,
+            lobby__invite_link=invite_link
+        )
+        lobby = slot.lobby
+
+        player_profile = request.user.game_profiles.filter(game_id=lobby.game_id).first()
+        if player_profile is None:
+            error_msg = f"You need a {lobby.game.title} profile to join!"
+            messages.warning(request, error_msg)
 
-            if not request.user.game_profiles.filter(game=lobby.game).exists():
-                error_msg = f"You need a {lobby.game.title} profile to join!"
-                messages.warning(request, error_msg)
+            if request.headers.get("HX-Request"):
+                response = HttpResponse(status=204)
+                response["HX-Redirect"] = reverse("games:profile-create")
+                return response
 
-                if request.headers.get("HX-Request"):
-                    response = HttpResponse(status=204)
-                    response["HX-Redirect"] = reverse("games:profile-create")
-                    return response
+            return redirect("games:profile-create")
 
-                return redirect("games:profile-create")
+        if lobby.status != Lobby.Status.SEARCHING:
+            return self._handle_error(request, "Lobby is not accepting players", game_slug, invite_link)
 
-            can_join, reason = lobby.can_join(request.user)
-            if not can_join:
-                return self._handle_error(request, reason, game_slug, invite_link)
+        if not slot.is_available:
+            return self._handle_error(request, "This slot is already taken", game_slug, invite_link)
 
-            if not slot.is_available:
-                return self._handle_error(
-                    request, "This slot is already taken", game_slug, invite_link
-                )
+        try:
+            claimed = slot.claim(request.user)
+        except IntegrityError:
+            return self._handle_error(request, "You are already in this lobby", game_slug, invite_link)
 
-            slot.player = request.user
-            slot.save()
+        if not claimed:
+            return self._handle_error(request, "This slot is no longer available", game_slug, invite_link)
 
-            messages.success(request, f"You joined as {slot.role_name}!")
+        transaction.on_commit(lambda: publish_slot_change(slot, None))
+        log_events(
+            slot_event(slot, LobbyEvent.Kind.JOINED, request.user.id),
+            status_event(lobby.status_change)
+        )
 
-            if request.headers.get("HX-Request"):
-                player_profile = request.user.game_profiles.filter(game=lobby.game).first()
+        messages.success(request, f"You joined as {slot.role_name}!")
 
-                return render(request, "lobbies/partials/slot_card.html", {
-                    "slot": slot,
-                    "lobby": lobby,
-                    "user": request.user,
-                    "profile": player_profile
-                })
+        if request.headers.get("HX-Request"):
+            return render(request, "lobbies/partials/slot_card.html", {
+                "slot": slot,
+                "lobby": lobby,
+                "user": request.user,
+                "profile": player_profile
+            })
 
         return self._redirect_to_lobby(game_slug, invite_link)
 
 
-class LeaveSlotView(LoginRequiredMixin, SlotActionMixin, View):
+class LeaveSlotView(PooledDispatchMixin, LoginRequiredMixin, SlotActionMixin, View):
     """
     Allows a user to leave their slot.
     """
@@ -369,6 +529,11 @@ class LeaveSlotView(LoginRequiredMixin, SlotActionMixin, View):
 
             slot.player = None
             slot.save()
+            transaction.on_commit(lambda: publish_slot_change(slot, request.user.id))
+            log_events(
+                slot_event(slot, LobbyEvent.Kind.LEFT, request.user.id),
+                status_event(lobby.status_change)
+            )
 
             messages.success(request, "You have left the lobby.")
 
@@ -382,7 +547,7 @@ class LeaveSlotView(LoginRequiredMixin, SlotActionMixin, View):
         return self._redirect_to_lobby(game_slug, invite_link)
 
 
-class KickPlayerView(LoginRequiredMixin, SlotActionMixin, View):
+class KickPlayerView(PooledDispatchMixin, LoginRequiredMixin, SlotActionMixin, View):
     """
     Allows the host to remove a player from a slot.
     """
@@ -395,11 +560,7 @@ class KickPlayerView(LoginRequiredMixin, SlotActionMixin, View):
             slot_id: int
     ) -> HttpResponse:
         with transaction.atomic():
-            slot = get_object_or_404(
-                Slot.objects.select_related("lobby", "player"),
-                id=slot_id,
-                lobby__invite_link=invite_link
-            )
+            slot = self._get_locked_slot(slot_id, invite_link)
             lobby = slot.lobby
 
             if request.user != lobby.host:
@@ -408,9 +569,20 @@ class KickPlayerView(LoginRequiredMixin, SlotActionMixin, View):
             if slot.player == request.user:
                 return HttpResponse(status=204)
 
+            if slot.player is None:
+                # Kicked twice, or the player left first: the counter was already shifted.
+                messages.error(request, "This slot is already empty.")
+                return self._redirect_to_lobby(game_slug, invite_link)
+
             kicked_user_name = slot.player.username
+            kicked_user_id = slot.player_id
             slot.player = None
-            slot.save()
+            slot.save(trigger=LobbyTransition.Trigger.KICK)
+            transaction.on_commit(lambda: publish_slot_change(slot, kicked_user_id))
+            log_events(
+                slot_event(slot, LobbyEvent.Kind.KICKED, kicked_user_id),
+                status_event(lobby.status_change)
+            )
 
             messages.success(request, f"Kicked {kicked_user_name} from the lobby.")
 
@@ -439,7 +611,13 @@ class ToggleLobbyPrivacyView(LoginRequiredMixin, View):
         lobby = get_object_or_404(Lobby, invite_link=invite_link, host=request.user)
 
         lobby.is_public = not lobby.is_public
-        lobby.save()
+        lobby.save(update_fields=["is_public", "updated_at"])
+        log_events(LobbyEvent(
+            lobby=lobby,
+            user_id=request.user.id,
+            kind=LobbyEvent.Kind.PRIVACY_CHANGED,
+            data={"is_public": lobby.is_public}
+        ))
 
         status_msg = "Lobby is now PUBLIC" if lobby.is_public else "Lobby is now PRIVATE"
         messages.success(request, status_msg)
@@ -448,3 +626,68 @@ class ToggleLobbyPrivacyView(LoginRequiredMixin, View):
             "lobby": lobby,
             "user": request.user
         })
+
+
+class LobbyEventsView(View):
+    """
+    Streams live slot updates of a lobby as Server-Sent Events.
+
+    Each event carries a re-rendered slot card, so viewers no longer reload
+    the whole lobby page to see players joining or leaving. The stream holds
+    the connection open and must be served through config/asgi.py.
+    """
+    heartbeat_interval = 15
+
+    async def get(
+            self,
+            request: HttpRequest,
+            game_slug: str,
+            invite_link: str,
+    ) -> StreamingHttpResponse:
+        lobby = await sync_to_async(get_object_or_404)(
+            Lobby,
+            invite_link=invite_link,
+            game__slug=game_slug
+        )
+        user, in_lobby = await sync_to_async(self._get_viewer)(request, lobby)
+
+        response = StreamingHttpResponse(
+            self._stream(lobby, user, in_lobby),
+            content_type="text/event-stream"
+        )
+        response["Cache-Control"] = "no-cache"
+        response["X-Accel-Buffering"] = "no"
+        return response
+
+    def _get_viewer(self, request: HttpRequest, lobby: Lobby) -> tuple:
+        """Resolves the lazy user and whether they already occupy a slot."""
+        user = request.user
+        in_lobby = user.is_authenticated and lobby.slots.filter(player=user).exists()
+        return user, in_lobby
+
+    async def _stream(self, lobby: Lobby, user: Any, in_lobby: bool) -> AsyncIterator[str]:
+        async with get_broker().subscribe(lobby_channel(lobby.id)) as subscription:
+            yield ": connected\n\n"
+
+            while True:
+                message = await subscription.get(self.heartbeat_interval)
+                if message is None:
+                    yield ": heartbeat\n\n"
+                    continue
+
+                if user.is_authenticated:
+                    if message["player_id"] == user.id:
+                        in_lobby = True
+                    elif message["previous_player_id"] == user.id:
+                        in_lobby = False
+
+                audience = get_audience(user, lobby.host_id, message["player_id"], in_lobby)
+
+                try:
+                    fragment = await sync_to_async(render_slot_card)(
+                        message["event_id"], message["slot_id"], audience, user, in_lobby
+                    )
+                except Slot.DoesNotExist:
+                    continue
+
+                yield format_sse("slot", fragment, message["event_id"])
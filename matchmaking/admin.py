@@ -0,0 +1,16 @@
+from django.contrib import admin
+
+from matchmaking.models import QueueEntry
+
+
+@admin.register(QueueEntry)
+class QueueEntryAdmin(admin.ModelAdmin):
+    """
+    Monitoring view of the matchmaking queue.
+    """
+    list_select_related = ["user", "game", "role"]
+
+    list_display = ["user", "game", "role", "status", "created_at", "matched_at"]
+    list_filter = ["status", "game"]
+    search_fields = ["user__username"]
+    readonly_fields = ["user", "game", "role", "slot", "created_at", "matched_at"]
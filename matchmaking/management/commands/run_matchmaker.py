@@ -0,0 +1,43 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from lobbies.activity import flush_events
+from matchmaking.matcher import match_waiting
+
+
+class Command(BaseCommand):
+    help = 'Places queued players into open lobby slots, in a loop or as a single pass.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Maximum number of queue entries matched per transaction."
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=1.0,
+            help="Seconds to sleep after a pass that matched nobody."
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Run a single pass over the queue and exit."
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            matched = match_waiting(options["batch_size"])
+            if matched:
+                self.stdout.write(self.style.SUCCESS(f"Matched {matched} players."))
+
+            if options["once"]:
+                flush_events()
+                return
+
+            if not matched:
+                flush_events()
+                time.sleep(options["interval"])
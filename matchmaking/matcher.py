@@ -0,0 +1,230 @@
+import logging
+from collections import Counter, defaultdict, deque
+from typing import Deque, Dict, Iterable, List, Optional, Set, Tuple
+
+from django.db import IntegrityError, connection, transaction
+from django.db.models import Case, QuerySet, Value, When
+from django.utils import timezone
+
+from lobbies.activity import log_events, slot_event, status_event
+from lobbies.caching import bump_list_version
+from lobbies.events import publish_slot_change
+from lobbies.models import Lobby, LobbyEvent, LobbyTransition, Slot
+from lobbies.open_roles import role_key
+from matchmaking.models import QueueEntry
+
+logger = logging.getLogger(__name__)
+
+
+class OpenSlotIndex:
+    """
+    In-memory index of the open slots of public SEARCHING lobbies.
+
+    Slots are grouped by (game_id, required_role_id), oldest lobby first,
+    so placing a player is a dictionary lookup instead of a query. The
+    members of every indexed lobby are tracked too, because a player may
+    hold only one slot per lobby.
+    """
+
+    def __init__(self, slots: Iterable[Slot], members: Iterable[Tuple[int, int]]) -> None:
+        self._open: Dict[Tuple[int, Optional[int]], Deque[Slot]] = defaultdict(deque)
+        self._members: Dict[int, Set[int]] = defaultdict(set)
+
+        for slot in slots:
+            self._open[(slot.lobby.game_id, slot.required_role_id)].append(slot)
+        for lobby_id, player_id in members:
+            self._members[lobby_id].add(player_id)
+
+    @classmethod
+    def load(cls, game_ids: Iterable[int]) -> "OpenSlotIndex":
+        """
+        Builds the index for the given games with two queries.
+
+        Must run inside a transaction: where the database supports it, the
+        open slots and their lobbies are locked with SKIP LOCKED, so slots
+        a player is joining by hand right now are simply left out.
+        """
+        slots = Slot.objects.filter(
+            lobby__game_id__in=game_ids,
+            lobby__status=Lobby.Status.SEARCHING,
+            lobby__is_public=True,
+            player__isnull=True
+        ).select_related("lobby").order_by("lobby__created_at", "lobby_id", "order")
+
+        if connection.features.has_select_for_update_skip_locked:
+            slots = slots.select_for_update(skip_locked=True, of=("self", "lobby"))
+
+        slots = list(slots)
+        members = Slot.objects.filter(
+            lobby_id__in={slot.lobby_id for slot in slots},
+            player__isnull=False
+        ).order_by().values_list("lobby_id", "player_id")
+
+        return cls(slots, members)
+
+    def take(
+        self,
+        game_id: int,
+        role_id: Optional[int],
+        user_id: int,
+        rank_value: Optional[int]
+    ) -> Optional[Slot]:
+        """
+        Removes and returns the best open slot for a player, or None.
+
+        A slot reserved for the player's role is preferred; otherwise the
+        player takes a flex slot. Lobbies the player already sits in, or
+        whose rank range excludes the player, are skipped.
+        """
+        keys = [(game_id, role_id), (game_id, None)] if role_id else [(game_id, None)]
+
+        for key in keys:
+            queue = self._open.get(key)
+            if not queue:
+                continue
+
+            for position, slot in enumerate(queue):
+                members = self._members[slot.lobby_id]
+                if user_id not in members and slot.lobby.accepts_rank(rank_value):
+                    del queue[position]
+                    members.add(user_id)
+                    return slot
+
+        return None
+
+
+def match_batch(entries: List[QueueEntry]) -> int:
+    """
+    Places a batch of waiting entries into open slots within the current transaction.
+
+    All assignments are written with one UPDATE for the slots, one for
+    the entries and one counter UPDATE per distinct set of roles filled
+    in a lobby. Entries without a fitting slot keep waiting.
+    """
+    index = OpenSlotIndex.load({entry.game_id for entry in entries})
+    now = timezone.now()
+    matched: List[QueueEntry] = []
+
+    for entry in entries:
+        slot = index.take(entry.game_id, entry.role_id, entry.user_id, entry.rank_value)
+        if slot is None:
+            continue
+
+        slot.player_id = entry.user_id
+        slot.joined_at = now
+        entry.status = QueueEntry.Status.MATCHED
+        entry.slot = slot
+        entry.matched_at = now
+        matched.append(entry)
+
+    if not matched:
+        return 0
+
+    slots = [entry.slot for entry in matched]
+    slot_ids = [slot.pk for slot in slots]
+
+    # Only the player differs per row; everything else is a plain value.
+    Slot.objects.filter(pk__in=slot_ids).update(
+        player_id=Case(*[When(pk=slot.pk, then=Value(slot.player_id)) for slot in slots]),
+        joined_at=now
+    )
+    QueueEntry.objects.filter(pk__in=[entry.pk for entry in matched]).update(
+        slot_id=Case(*[When(pk=entry.pk, then=Value(entry.slot.pk)) for entry in matched]),
+        status=QueueEntry.Status.MATCHED,
+        matched_at=now
+    )
+
+    # One counter UPDATE per distinct set of slots (by role) filled in a lobby.
+    added = Counter(slot.lobby_id for slot in slots)
+    filled_roles = defaultdict(Counter)
+    for slot in slots:
+        filled_roles[slot.lobby_id][role_key(slot.required_role_id)] -= 1
+    lobbies_by_change = defaultdict(list)
+    for lobby_id, delta in added.items():
+        lobbies_by_change[delta, tuple(sorted(filled_roles[lobby_id].items()))].append(lobby_id)
+    changes = []
+    for (delta, open_roles), lobby_ids in lobbies_by_change.items():
+        transition = Lobby.shift_filled_slots_of(lobby_ids, delta, LobbyTransition.Trigger.MATCH, dict(open_roles))
+        changes.extend(transition.changes)
+
+    events = []
+    for slot in slots:
+        slot._loaded_player_id = slot.player_id
+        events.append(slot_event(slot, LobbyEvent.Kind.JOINED, slot.player_id))
+    events.extend(status_event(change) for change in changes)
+
+    log_events(*events)
+
+    game_ids = {entry.game_id for entry in matched}
+
+    def announce() -> None:
+        for slot in slots:
+            publish_slot_change(slot, None)
+        for game_id in game_ids:
+            bump_list_version(game_id)
+
+    transaction.on_commit(announce)
+
+    return len(matched)
+
+
+def lock_waiting(queryset: QuerySet, limit: int) -> List[QueueEntry]:
+    """Loads the first waiting entries, skipping those another matcher holds where supported."""
+    queryset = queryset.filter(status=QueueEntry.Status.WAITING).order_by("id")
+    if connection.features.has_select_for_update_skip_locked:
+        queryset = queryset.select_for_update(skip_locked=True)
+    return list(queryset[:limit])
+
+
+def match_waiting(batch_size: int = 500) -> int:
+    """
+    Runs one pass of the matcher over every waiting entry, oldest first.
+
+    Entries are processed in batches of 'batch_size', one transaction per
+    batch. The pass walks the queue by id, so players that cannot be
+    placed do not hold back the ones behind them. Returns the number of
+    matched players.
+    """
+    matched = 0
+    last_id = 0
+
+    while True:
+        try:
+            with transaction.atomic():
+                entries = lock_waiting(QueueEntry.objects.filter(id__gt=last_id), batch_size)
+                if not entries:
+                    return matched
+
+                matched += match_batch(entries)
+        except IntegrityError:
+            # A player took a seat by hand in a lobby the batch placed them in
+            # too ('unique_player_per_lobby'). The batch was rolled back; its
+            # entries are retried one by one so the others still get matched.
+            logger.warning("Matching %d queue entries conflicted; retrying them one by one", len(entries))
+            matched += match_each(entries)
+
+        last_id = entries[-1].id
+        if len(entries) < batch_size:
+            return matched
+
+
+def match_each(entries: List[QueueEntry]) -> int:
+    """
+    Matches entries one transaction each, leaving conflicting ones waiting.
+
+    Every entry is locked and placed with a freshly loaded index, so seats
+    taken in the meantime are known. An entry that still conflicts is
+    logged and left for the next pass.
+    """
+    matched = 0
+
+    for entry in entries:
+        try:
+            with transaction.atomic():
+                locked = lock_waiting(QueueEntry.objects.filter(pk=entry.pk), 1)
+                if locked:
+                    matched += match_batch(locked)
+        except IntegrityError:
+            logger.warning("Queue entry %s conflicts with a seat taken meanwhile; left waiting", entry.pk)
+
+    return matched
@@ -0,0 +1,43 @@
+# Generated by Django 4.2.27 on 2026-10-17 20:06
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('games', '0003_game_lobby_ttl'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('lobbies', '0006_lobby_hot_path_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='QueueEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('WA', 'Waiting'), ('MA', 'Matched'), ('CA', 'Cancelled')], default='WA', max_length=2)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('matched_at', models.DateTimeField(blank=True, null=True)),
+                ('notified', models.BooleanField(default=False, help_text='Whether the player has been redirected to the lobby of their match.')),
+                ('game', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='queue_entries', to='games.game')),
+                ('role', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='queue_entries', to='games.gamerole')),
+                ('slot', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='queue_entries', to='lobbies.slot')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='queue_entries', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Queue Entry',
+                'verbose_name_plural': 'Queue Entries',
+                'ordering': ['created_at'],
+                'indexes': [models.Index(condition=models.Q(('status', 'WA')), fields=['id'], name='queue_waiting_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='queueentry',
+            constraint=models.UniqueConstraint(condition=models.Q(('status', 'WA')), fields=('user', 'game'), name='unique_waiting_queue_entry'),
+        ),
+    ]
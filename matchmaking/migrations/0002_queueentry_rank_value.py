@@ -0,0 +1,18 @@
+# Generated by Django 4.2.27 on 2026-10-17 21:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('matchmaking', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='queueentry',
+            name='rank_value',
+            field=models.PositiveSmallIntegerField(blank=True, editable=False, help_text="Ladder value of the player's rank when they enqueued (see UserGameProfile.rank_value).", null=True),
+        ),
+    ]
@@ -0,0 +1,93 @@
+from django.conf import settings
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+
+class QueueEntry(models.Model):
+    """
+    A player waiting to be placed into a lobby of a game by the matcher.
+
+    The role and the rank are copied from the player's game profile when
+    they enqueue, so the matcher never has to join profiles. Matched entries keep a
+    reference to the slot they were assigned to.
+    """
+
+    class Status(models.TextChoices):
+        WAITING = "WA", _("Waiting")
+        MATCHED = "MA", _("Matched")
+        CANCELLED = "CA", _("Cancelled")
+
+    status = models.CharField(
+        max_length=2,
+        choices=Status.choices,
+        default=Status.WAITING,
+    )
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    matched_at = models.DateTimeField(null=True, blank=True)
+    notified = models.BooleanField(
+        default=False,
+        help_text="Whether the player has been redirected to the lobby of their match."
+    )
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="queue_entries"
+    )
+
+    game = models.ForeignKey(
+        "games.Game",
+        on_delete=models.CASCADE,
+        related_name="queue_entries"
+    )
+
+    role = models.ForeignKey(
+        "games.GameRole",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="queue_entries"
+    )
+
+    rank_value = models.PositiveSmallIntegerField(
+        null=True,
+        blank=True,
+        editable=False,
+        help_text="Ladder value of the player's rank when they enqueued (see UserGameProfile.rank_value)."
+    )
+
+    slot = models.ForeignKey(
+        "lobbies.Slot",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="queue_entries"
+    )
+
+    class Meta:
+        verbose_name = "Queue Entry"
+        verbose_name_plural = "Queue Entries"
+        ordering = ["created_at"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "game"],
+                condition=models.Q(status="WA"),
+                name="unique_waiting_queue_entry"
+            ),
+        ]
+        indexes = [
+            # The matcher walks waiting entries in id order.
+            models.Index(
+                fields=["id"],
+                condition=models.Q(status="WA"),
+                name="queue_waiting_idx"
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.user.username} queued for {self.game.title} ({self.get_status_display()})"
+
+    @property
+    def is_waiting(self) -> bool:
+        return self.status == self.Status.WAITING
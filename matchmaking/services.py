@@ -0,0 +1,44 @@
+from typing import Any
+
+from django.db import IntegrityError, transaction
+
+from games.models import Game, UserGameProfile
+from matchmaking.models import QueueEntry
+
+
+def enqueue(profile: UserGameProfile) -> QueueEntry:
+    """
+    Puts a player into the matchmaking queue of their profile's game.
+
+    Enqueuing twice is harmless: the player's waiting entry is returned
+    instead of creating a second one.
+
+    Args:
+        profile (UserGameProfile): Profile providing the game, the role and
+            the rank to queue with.
+    """
+    try:
+        with transaction.atomic():
+            return QueueEntry.objects.create(
+                user_id=profile.user_id,
+                game_id=profile.game_id,
+                role_id=profile.main_role_id,
+                rank_value=profile.rank_value,
+            )
+    except IntegrityError:
+        return QueueEntry.objects.get(
+            user_id=profile.user_id,
+            game_id=profile.game_id,
+            status=QueueEntry.Status.WAITING
+        )
+
+
+def cancel(user: Any, game: Game) -> int:
+    """
+    Removes a player's waiting entry for a game. Returns the number of cancelled entries.
+    """
+    return QueueEntry.objects.filter(
+        user=user,
+        game=game,
+        status=QueueEntry.Status.WAITING
+    ).update(status=QueueEntry.Status.CANCELLED)
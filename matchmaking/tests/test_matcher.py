@@ -0,0 +1,160 @@
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+
+from games.models import Game, GameRank, GameRole, UserGameProfile
+from lobbies.models import Lobby
+from lobbies.services import create_lobby
+from matchmaking.matcher import OpenSlotIndex, match_waiting
+from matchmaking.models import QueueEntry
+from matchmaking.services import cancel, enqueue
+
+User = get_user_model()
+
+
+class MatcherTests(TestCase):
+    """
+    Tests for enqueueing and for placing queued players into open slots.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.game = Game.objects.create(title="Valorant", slug="valorant", team_size=3)
+        cls.duelist = GameRole.objects.create(game=cls.game, name="Duelist", order=1)
+        cls.sentinel = GameRole.objects.create(game=cls.game, name="Sentinel", order=2)
+        cls.host = User.objects.create_user(username="host", email="h@ex.com", password="pw")
+
+    def make_profile(self, username: str, role: GameRole = None) -> UserGameProfile:
+        user = User.objects.create_user(username=username, email=f"{username}@ex.com", password="pw")
+        return UserGameProfile.objects.create(user=user, game=self.game, rank="Gold", main_role=role)
+
+    def make_lobby(self, *needed_roles: GameRole, size: int = 3) -> Lobby:
+        return create_lobby(
+            Lobby(title="Ranked", game=self.game, host=self.host, size=size),
+            needed_roles=needed_roles
+        )
+
+    def test_enqueue_is_idempotent(self):
+        """Enqueuing twice returns the waiting entry; after cancelling a new one is created."""
+        profile = self.make_profile("player", self.duelist)
+
+        first = enqueue(profile)
+        second = enqueue(profile)
+
+        self.assertEqual(first.pk, second.pk)
+        self.assertEqual(first.role, self.duelist)
+        self.assertEqual(cancel(profile.user, self.game), 1)
+        self.assertNotEqual(enqueue(profile).pk, first.pk)
+
+    def test_role_slot_preferred_over_flex(self):
+        """A player takes the slot reserved for their main role before a flex slot."""
+        lobby = self.make_lobby(self.duelist)
+        enqueue(self.make_profile("duelist", self.duelist))
+
+        self.assertEqual(match_waiting(), 1)
+
+        entry = QueueEntry.objects.get()
+        self.assertEqual(entry.status, QueueEntry.Status.MATCHED)
+        self.assertEqual(entry.slot.required_role, self.duelist)
+        self.assertEqual(entry.slot.lobby, lobby)
+
+    def test_players_only_take_fitting_slots(self):
+        """Players never take slots reserved for another role."""
+        self.make_lobby(self.duelist, self.duelist)
+        enqueue(self.make_profile("sentinel", self.sentinel))
+        enqueue(self.make_profile("flex"))
+
+        self.assertEqual(match_waiting(), 0)
+        self.assertEqual(QueueEntry.objects.filter(status=QueueEntry.Status.WAITING).count(), 2)
+
+    def test_batch_fills_lobby_and_keeps_counter_in_sync(self):
+        """A batch is written with bulk UPDATEs and shifts the lobby counter once."""
+        lobby = self.make_lobby()
+        for i in range(4):
+            enqueue(self.make_profile(f"player{i}"))
+
+        with self.assertNumQueries(9):
+            # Savepoint pair, entries, open slots, members, one UPDATE each for slots, entries
+            # and the counter, then the INSERT recording the status transition.
+            matched = match_waiting(batch_size=10)
+
+        self.assertEqual(matched, 2)
+        lobby.refresh_from_db()
+        self.assertEqual(lobby.filled_slots, 3)
+        self.assertEqual(lobby.open_roles, {})
+        self.assertEqual(lobby.slots.filter(player__isnull=False).count(), 3)
+        self.assertEqual(lobby.status, Lobby.Status.IN_PROGRESS)
+        self.assertEqual(
+            list(lobby.transitions.values_list("from_status", "to_status", "trigger")),
+            [(Lobby.Status.SEARCHING, Lobby.Status.IN_PROGRESS, "match")]
+        )
+        self.assertEqual(QueueEntry.objects.filter(status=QueueEntry.Status.WAITING).count(), 2)
+
+    def test_player_is_not_placed_twice_into_a_lobby(self):
+        """A player already sitting in a lobby is not matched into it again."""
+        lobby = self.make_lobby()
+        profile = UserGameProfile.objects.create(user=self.host, game=self.game, rank="Gold")
+        enqueue(profile)
+
+        self.assertEqual(match_waiting(), 0)
+        self.assertEqual(lobby.slots.filter(player=self.host).count(), 1)
+
+    def test_seat_taken_by_hand_does_not_abort_the_batch(self):
+        """A batch conflicting with a manual join is retried entry by entry instead of failing."""
+        lobby = self.make_lobby(size=4)
+        racer = self.make_profile("racer")
+        other = self.make_profile("other")
+        enqueue(racer)
+        enqueue(other)
+
+        # The index is loaded before the racer joins slot 4 by hand, as if both raced.
+        stale = [OpenSlotIndex.load({self.game.id})]
+        slot_4 = lobby.slots.get(order=4)
+        slot_4.player = racer.user
+        slot_4.save()
+        load = OpenSlotIndex.load
+
+        with mock.patch.object(OpenSlotIndex, "load", side_effect=lambda ids: stale.pop() if stale else load(ids)):
+            with self.assertLogs("matchmaking.matcher", level="WARNING"):
+                self.assertEqual(match_waiting(), 1)
+
+        self.assertEqual(QueueEntry.objects.get(user=racer.user).status, QueueEntry.Status.WAITING)
+        self.assertEqual(QueueEntry.objects.get(user=other.user).status, QueueEntry.Status.MATCHED)
+        lobby.refresh_from_db()
+        self.assertEqual(lobby.filled_slots, 3)
+        self.assertEqual(lobby.slots.filter(player=racer.user).count(), 1)
+
+    def test_rank_range_is_respected(self):
+        """Players are only placed into lobbies whose rank range contains their rank."""
+        GameRank.objects.create(game=self.game, name="Gold", value=3)
+        GameRank.objects.create(game=self.game, name="Diamond", value=5)
+        diamond_only = self.make_lobby()
+        Lobby.objects.filter(pk=diamond_only.pk).update(min_rank=5, max_rank=5)
+        enqueue(self.make_profile("gold"))
+
+        self.assertEqual(match_waiting(), 0)
+
+        self.make_lobby()
+        self.assertEqual(match_waiting(), 1)
+        self.assertNotEqual(QueueEntry.objects.get().slot.lobby, diamond_only)
+
+    def test_private_lobbies_are_skipped(self):
+        """Only public lobbies receive queued players."""
+        lobby = self.make_lobby()
+        lobby.is_public = False
+        lobby.save()
+        enqueue(self.make_profile("player"))
+
+        self.assertEqual(match_waiting(), 0)
+
+    def test_run_matchmaker_once(self):
+        """The worker command matches waiting players in a single pass."""
+        self.make_lobby()
+        enqueue(self.make_profile("player"))
+
+        call_command("run_matchmaker", "--once", stdout=StringIO())
+
+        self.assertEqual(QueueEntry.objects.get().status, QueueEntry.Status.MATCHED)
@@ -0,0 +1,62 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+
+from games.models import Game, UserGameProfile
+from lobbies.models import Lobby
+from lobbies.services import create_lobby
+from matchmaking.matcher import match_waiting
+from matchmaking.models import QueueEntry
+
+User = get_user_model()
+
+
+class QueueViewTests(TestCase):
+    """
+    Tests for the HTMX matchmaking widget.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.game = Game.objects.create(title="Valorant", slug="valorant", team_size=5)
+        cls.host = User.objects.create_user(username="host", email="h@ex.com", password="pw")
+        cls.lobby = create_lobby(Lobby(title="Ranked", game=cls.game, host=cls.host, size=5))
+
+    def setUp(self):
+        self.player = User.objects.create_user(username="player", email="p@ex.com", password="pw")
+        self.client.force_login(self.player)
+
+    def test_join_requires_profile(self):
+        """Players without a game profile are sent to create one."""
+        response = self.client.post(reverse("matchmaking:queue-join", args=[self.game.slug]))
+
+        self.assertEqual(response["HX-Redirect"], reverse("games:profile-create"))
+        self.assertFalse(QueueEntry.objects.exists())
+
+    def test_join_and_leave_queue(self):
+        """Joining renders a polling widget, leaving cancels the entry."""
+        UserGameProfile.objects.create(user=self.player, game=self.game, rank="Gold")
+
+        response = self.client.post(reverse("matchmaking:queue-join", args=[self.game.slug]))
+        self.assertContains(response, 'hx-trigger="every 2s"')
+        self.assertContains(response, "Searching as Flex")
+
+        response = self.client.post(reverse("matchmaking:queue-leave", args=[self.game.slug]))
+        self.assertContains(response, "Find Match")
+        self.assertEqual(QueueEntry.objects.get().status, QueueEntry.Status.CANCELLED)
+
+    def test_status_redirects_to_matched_lobby_once(self):
+        """Polling after a match redirects to the lobby, later polls offer a new search."""
+        UserGameProfile.objects.create(user=self.player, game=self.game, rank="Gold")
+        self.client.post(reverse("matchmaking:queue-join", args=[self.game.slug]))
+        match_waiting()
+
+        url = reverse("matchmaking:queue-status", args=[self.game.slug])
+        response = self.client.get(url)
+        self.assertEqual(response["HX-Redirect"], reverse("lobbies:lobby-detail", kwargs={
+            "game_slug": self.game.slug,
+            "invite_link": self.lobby.invite_link
+        }))
+
+        response = self.client.get(url)
+        self.assertContains(response, "Find Match")
@@ -0,0 +1,23 @@
+from django.urls import path
+
+from .views import QueueJoinView, QueueLeaveView, QueueStatusView
+
+app_name = "matchmaking"
+
+urlpatterns = [
+    path(
+        "<slug:game_slug>/",
+        QueueStatusView.as_view(),
+        name="queue-status"
+    ),
+    path(
+        "<slug:game_slug>/join/",
+        QueueJoinView.as_view(),
+        name="queue-join"
+    ),
+    path(
+        "<slug:game_slug>/leave/",
+        QueueLeaveView.as_view(),
+        name="queue-leave"
+    ),
+]
@@ -0,0 +1,89 @@
+from typing import Any, Optional
+
+from django.contrib import messages
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.db.models import Q
+from django.http import HttpRequest, HttpResponse
+from django.shortcuts import render
+from django.urls import reverse
+from django.views import View
+
+from games.registry import get_game_or_404
+from lobbies.views import HTMXRedirect
+from matchmaking.models import QueueEntry
+from matchmaking.services import cancel, enqueue
+
+
+class QueueMixin(LoginRequiredMixin):
+    """
+    Shared helpers of the matchmaking widget views.
+
+    Every view answers with the queue widget partial, which polls the
+    status endpoint while the player is waiting.
+    """
+
+    def setup(self, request: HttpRequest, *args: Any, **kwargs: Any) -> None:
+        super().setup(request, *args, **kwargs)
+        self.game = get_game_or_404(self.kwargs.get("game_slug"))
+
+    def render_widget(self, entry: Optional[QueueEntry]) -> HttpResponse:
+        return render(self.request, "matchmaking/partials/queue_status.html", {
+            "game": self.game,
+            "entry": entry,
+        })
+
+
+class QueueStatusView(QueueMixin, View):
+    """
+    HTMX polling endpoint reporting the player's place in the queue.
+
+    Once the matcher assigned a slot, the client is redirected to the lobby.
+    """
+
+    def get(self, request: HttpRequest, game_slug: str) -> HttpResponse:
+        entry = QueueEntry.objects.filter(
+            Q(status=QueueEntry.Status.WAITING) | Q(status=QueueEntry.Status.MATCHED, notified=False),
+            user=request.user,
+            game=self.game
+        ).select_related("role", "slot__lobby").order_by("-id").first()
+
+        if entry and entry.status == QueueEntry.Status.MATCHED:
+            # Announce a match only once; the next visit offers a new search.
+            entry.notified = True
+            entry.save(update_fields=["notified"])
+
+            if entry.slot is None:
+                return self.render_widget(None)
+
+            messages.success(request, "Match found! You have been placed into a lobby.")
+            return HTMXRedirect(reverse("lobbies:lobby-detail", kwargs={
+                "game_slug": game_slug,
+                "invite_link": entry.slot.lobby.invite_link
+            }))
+
+        return self.render_widget(entry)
+
+
+class QueueJoinView(QueueMixin, View):
+    """
+    Enqueues the player with the role of their game profile.
+    """
+
+    def post(self, request: HttpRequest, game_slug: str) -> HttpResponse:
+        profile = request.user.game_profiles.filter(game=self.game).first()
+
+        if profile is None:
+            messages.warning(request, f"You need a {self.game.title} profile to find a match!")
+            return HTMXRedirect(reverse("games:profile-create"))
+
+        return self.render_widget(enqueue(profile))
+
+
+class QueueLeaveView(QueueMixin, View):
+    """
+    Removes the player from the queue.
+    """
+
+    def post(self, request: HttpRequest, game_slug: str) -> HttpResponse:
+        cancel(request.user, self.game)
+        return self.render_widget(None)
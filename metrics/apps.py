@@ -0,0 +1,12 @@
+from django.apps import AppConfig
+
+
+class MetricsConfig(AppConfig):
+    name = 'metrics'
+
+    def ready(self):
+        from django.db.backends.signals import connection_created
+
+        from metrics.stats import install_sql_timer
+
+        connection_created.connect(install_sql_timer, dispatch_uid="metrics.install_sql_timer")
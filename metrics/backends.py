@@ -0,0 +1,26 @@
+from django.template.backends.django import DjangoTemplates, Template
+
+from metrics.stats import time_template
+
+
+class TimedTemplate(Template):
+    """Django template whose renders count towards the request's template time."""
+
+    def render(self, context=None, request=None):
+        with time_template():
+            return super().render(context, request)
+
+
+class TimedDjangoTemplates(DjangoTemplates):
+    """
+    DjangoTemplates backend reporting render time to the metrics middleware.
+
+    Covers both TemplateResponse and render_to_string, so views that cache
+    rendered fragments are measured the same way as regular ones.
+    """
+
+    def from_string(self, template_code):
+        return TimedTemplate(super().from_string(template_code).template, self)
+
+    def get_template(self, template_name):
+        return TimedTemplate(super().get_template(template_name).template, self)
@@ -0,0 +1,101 @@
+import json
+import logging
+import random
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.http import HttpRequest, HttpResponse
+
+from metrics.registry import registry
+from metrics.stats import RequestStats, activate, deactivate
+
+logger = logging.getLogger("metrics.requests")
+
+
+class RequestMetricsMiddleware:
+    """
+    Samples requests and records their SQL, template and total time.
+
+    Sampled responses get a Server-Timing header, their numbers are added
+    to the in-process histograms served by the metrics view and written
+    as a JSON line to the "metrics.requests" logger. With a sample rate of
+    0 the middleware removes itself from the stack at startup.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.sample_rate = settings.REQUEST_METRICS_SAMPLE_RATE
+        if self.sample_rate <= 0:
+            raise MiddlewareNotUsed
+
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        if not self.is_sampled():
+            return self.get_response(request)
+
+        stats = RequestStats()
+        token = activate(stats)
+        started = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            deactivate(token)
+
+        return self.finish(request, response, stats, started)
+
+    async def __acall__(self, request: HttpRequest):
+        if not self.is_sampled():
+            return await self.get_response(request)
+
+        stats = RequestStats()
+        token = activate(stats)
+        started = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            deactivate(token)
+
+        return self.finish(request, response, stats, started)
+
+    def is_sampled(self) -> bool:
+        return self.sample_rate >= 1 or random.random() < self.sample_rate
+
+    def finish(self, request: HttpRequest, response: HttpResponse, stats: RequestStats, started: float) -> HttpResponse:
+        total_ms = (time.perf_counter() - started) * 1000
+        match = request.resolver_match
+        view = match.view_name if match else "unresolved"
+
+        response["Server-Timing"] = ", ".join([
+            f'db;dur={stats.sql_ms:.1f};desc="{stats.queries} queries"',
+            f"tpl;dur={stats.template_ms:.1f}",
+            f"total;dur={total_ms:.1f}",
+        ])
+
+        registry.record(view, response.status_code, {
+            "request_duration_ms": total_ms,
+            "request_sql_ms": stats.sql_ms,
+            "request_template_ms": stats.template_ms,
+            "request_queries": stats.queries,
+        })
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(json.dumps({
+                "view": view,
+                "method": request.method,
+                "status": response.status_code,
+                "queries": stats.queries,
+                "sql_ms": round(stats.sql_ms, 2),
+                "template_ms": round(stats.template_ms, 2),
+                "total_ms": round(total_ms, 2),
+            }))
+
+        return response
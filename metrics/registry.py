@@ -0,0 +1,90 @@
+import bisect
+import threading
+from collections import defaultdict
+from typing import Dict, List, Sequence, Tuple
+
+# Upper bounds (inclusive) of the histogram buckets; values above the last one land in +Inf.
+MS_BUCKETS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+QUERY_BUCKETS = (1, 2, 5, 10, 20, 50, 100)
+
+
+class Histogram:
+    """Cumulative-bucket histogram in the Prometheus sense."""
+
+    def __init__(self, buckets: Sequence[float]) -> None:
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> List[Tuple[str, int]]:
+        total = 0
+        result = []
+        for bound, count in zip([*map(str, self.buckets), "+Inf"], self.counts):
+            total += count
+            result.append((bound, total))
+        return result
+
+
+METRICS = {
+    "request_duration_ms": MS_BUCKETS,
+    "request_sql_ms": MS_BUCKETS,
+    "request_template_ms": MS_BUCKETS,
+    "request_queries": QUERY_BUCKETS,
+}
+
+
+class Registry:
+    """
+    Per-process histograms of sampled requests, keyed by view name.
+
+    Each worker process keeps its own numbers; the scraper is expected to
+    sum them, the same way it does for any multi-process exporter.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._histograms: Dict[Tuple[str, str], Histogram] = {}
+        self._statuses: Dict[Tuple[str, int], int] = defaultdict(int)
+
+    def record(self, view: str, status: int, values: Dict[str, float]) -> None:
+        with self._lock:
+            self._statuses[(view, status)] += 1
+            for metric, value in values.items():
+                histogram = self._histograms.get((metric, view))
+                if histogram is None:
+                    histogram = self._histograms[(metric, view)] = Histogram(METRICS[metric])
+                histogram.observe(value)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+            self._statuses.clear()
+
+    def render(self) -> str:
+        """Serializes every histogram in the Prometheus text exposition format."""
+        lines = []
+        with self._lock:
+            lines.append("# TYPE lfg_requests_total counter")
+            for (view, status), count in sorted(self._statuses.items()):
+                lines.append(f'lfg_requests_total{{view="{view}",status="{status}"}} {count}')
+
+            for metric in METRICS:
+                lines.append(f"# TYPE lfg_{metric} histogram")
+                for (name, view), histogram in sorted(self._histograms.items()):
+                    if name != metric:
+                        continue
+                    for bound, count in histogram.cumulative():
+                        lines.append(f'lfg_{metric}_bucket{{view="{view}",le="{bound}"}} {count}')
+                    lines.append(f'lfg_{metric}_sum{{view="{view}"}} {histogram.sum:.3f}')
+                    lines.append(f'lfg_{metric}_count{{view="{view}"}} {histogram.count}')
+
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
@@ -0,0 +1,73 @@
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+_current: ContextVar[Optional["RequestStats"]] = ContextVar("request_stats", default=None)
+
+
+@dataclass
+class RequestStats:
+    """Timings collected while a sampled request is being handled."""
+    queries: int = 0
+    sql_ms: float = 0.0
+    template_ms: float = 0.0
+    _rendering: int = 0
+
+
+def get_current() -> Optional[RequestStats]:
+    return _current.get()
+
+
+def activate(stats: RequestStats) -> Any:
+    return _current.set(stats)
+
+
+def deactivate(token: Any) -> None:
+    _current.reset(token)
+
+
+def sql_timer(execute: Callable, sql: str, params: Any, many: bool, context: dict) -> Any:
+    """
+    connection.execute_wrapper hook counting and timing the queries of sampled requests.
+
+    Unsampled requests only pay for one context variable lookup.
+    """
+    stats = _current.get()
+    if stats is None:
+        return execute(sql, params, many, context)
+
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        stats.queries += 1
+        stats.sql_ms += (time.perf_counter() - started) * 1000
+
+
+def install_sql_timer(sender: Any, connection: Any, **kwargs: Any) -> None:
+    """
+    Installs sql_timer on every new database connection.
+
+    A permanent wrapper (instead of a per-request execute_wrapper block)
+    also covers queries run from sync_to_async threads of async views.
+    """
+    if sql_timer not in connection.execute_wrappers:
+        connection.execute_wrappers.append(sql_timer)
+
+
+class time_template:
+    """Adds the wall time of a top-level template render to the current request."""
+
+    def __enter__(self) -> None:
+        self.stats = _current.get()
+        if self.stats is not None:
+            self.stats._rendering += 1
+            self.started = time.perf_counter()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        if self.stats is not None:
+            self.stats._rendering -= 1
+            # Nested renders (render_to_string inside a tag) are already inside the outer one.
+            if not self.stats._rendering:
+                self.stats.template_ms += (time.perf_counter() - self.started) * 1000
@@ -0,0 +1,81 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from games.models import Game
+from metrics.registry import Histogram, registry
+
+User = get_user_model()
+
+
+@override_settings(REQUEST_METRICS_SAMPLE_RATE=1.0, REQUEST_METRICS_TOKEN="scrape-me")
+class RequestMetricsMiddlewareTests(TestCase):
+    """
+    Tests for the sampling middleware, its Server-Timing header and the metrics endpoint.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.game = Game.objects.create(title="Valorant", slug="valorant", team_size=5)
+
+    def setUp(self) -> None:
+        cache.clear()
+        registry.reset()
+
+    def test_server_timing_reports_sql_and_templates(self) -> None:
+        """
+        Verifies that a sampled request carries its query count, SQL time and template time.
+        """
+        response = self.client.get(reverse("lobbies:lobby-list", kwargs={"game_slug": self.game.slug}))
+
+        timing = response["Server-Timing"]
+        self.assertRegex(timing, r'db;dur=[\d.]+;desc="[1-9]\d* queries"')
+        self.assertIn("tpl;dur=", timing)
+        self.assertIn("total;dur=", timing)
+
+    def test_requests_are_aggregated_per_view(self) -> None:
+        """
+        Verifies that sampled requests land in the histograms of their view name.
+        """
+        self.client.get(reverse("games:index"))
+        self.client.get(reverse("games:index"))
+
+        response = self.client.get(reverse("metrics:metrics"), HTTP_AUTHORIZATION="Bearer scrape-me")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, 'lfg_requests_total{view="games:index",status="200"} 2')
+        self.assertContains(response, 'lfg_request_queries_count{view="games:index"} 2')
+
+    @override_settings(REQUEST_METRICS_SAMPLE_RATE=0)
+    def test_disabled_sampling_removes_middleware(self) -> None:
+        """
+        Verifies that a sample rate of 0 adds no header and records nothing.
+        """
+        response = self.client.get(reverse("games:index"))
+
+        self.assertNotIn("Server-Timing", response)
+        self.assertNotIn("games:index", registry.render())
+
+    def test_metrics_requires_token_or_staff(self) -> None:
+        """
+        Verifies that the endpoint rejects anonymous and wrongly authenticated scrapers.
+        """
+        url = reverse("metrics:metrics")
+
+        self.assertEqual(self.client.get(url).status_code, 403)
+        self.assertEqual(self.client.get(url, HTTP_AUTHORIZATION="Bearer wrong").status_code, 403)
+
+        staff = User.objects.create_user(username="ops", email="ops@example.com", password="password", is_staff=True)
+        self.client.force_login(staff)
+        self.assertEqual(self.client.get(url).status_code, 200)
+
+    def test_histogram_buckets_are_cumulative(self) -> None:
+        """
+        Verifies that every bucket counts the observations at or below its bound.
+        """
+        histogram = Histogram((10, 100))
+        for value in (1, 10, 50, 500):
+            histogram.observe(value)
+
+        self.assertEqual(histogram.cumulative(), [("10", 2), ("100", 3), ("+Inf", 4)])
@@ -0,0 +1,30 @@
+import hmac
+
+from django.conf import settings
+from django.http import HttpRequest, HttpResponse
+from django.views import View
+
+from metrics.registry import registry
+
+
+class MetricsView(View):
+    """
+    Serves the request histograms of this process in the Prometheus text format.
+
+    Staff users can open it in a browser; scrapers authenticate with
+    "Authorization: Bearer <REQUEST_METRICS_TOKEN>".
+    """
+
+    def get(self, request: HttpRequest) -> HttpResponse:
+        if not self.is_authorized(request):
+            return HttpResponse(status=403)
+
+        return HttpResponse(registry.render(), content_type="text/plain; version=0.0.4")
+
+    def is_authorized(self, request: HttpRequest) -> bool:
+        if request.user.is_staff:
+            return True
+
+        token = settings.REQUEST_METRICS_TOKEN
+        header = request.headers.get("Authorization", "")
+        return bool(token) and hmac.compare_digest(header, f"Bearer {token}")
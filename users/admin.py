@@ -1,7 +1,7 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin
 
-from users.models import User
+from users.models import AvatarUpload, User
 
 
 @admin.register(User)
@@ -60,3 +60,19 @@ class UserAdmin(UserAdmin):
             "fields": ("username", "email", "password1", "password2"),
         }),
     )
+
+
+@admin.register(AvatarUpload)
+class AvatarUploadAdmin(admin.ModelAdmin):
+    """
+    Read-only view of the avatars waiting for the upload worker.
+
+    Rows that ran out of attempts stay here until they are deleted.
+    """
+    list_display = ["user", "created_at", "claimed_at", "attempts"]
+    list_select_related = ["user"]
+    search_fields = ["user__username"]
+    readonly_fields = ["user", "spool_path", "claimed_at", "attempts", "created_at"]
+
+    def has_add_permission(self, request) -> bool:
+        return False
@@ -0,0 +1,209 @@
+"""
+Avatar upload pipeline.
+
+Saving the settings form only writes the uploaded file to a local spool
+directory and queues an AvatarUpload, so the request never waits for the
+upload to the avatar storage. A background worker (a thread of the
+process-wide avatar pool, or the 'process_avatar_uploads' command) pushes
+the spooled file to the storage and swaps 'User.avatar' when it is done.
+"""
+import logging
+import shutil
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from pathlib import Path
+from typing import Any, List, Optional
+
+from cloudinary import uploader
+from django.conf import settings
+from django.core.files.uploadedfile import UploadedFile
+from django.db import close_old_connections, transaction
+from django.db.models import F, Q
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from users.caching import get_user_cache, user_cache_key
+from users.models import AvatarUpload, User
+
+logger = logging.getLogger(__name__)
+
+
+class BaseAvatarStorage:
+    """
+    Interface of the place avatars are pushed to.
+
+    'save' receives the path of a spooled file and returns the value stored
+    in 'User.avatar'. It runs on a worker thread or in a command, never
+    within a request.
+    """
+
+    def save(self, path: Path, user_id: int) -> str:
+        raise NotImplementedError
+
+
+class CloudinaryAvatarStorage(BaseAvatarStorage):
+    """Uploads avatars with the options of the 'User.avatar' field."""
+
+    def save(self, path: Path, user_id: int) -> str:
+        field = User._meta.get_field("avatar")
+        resource = uploader.upload_resource(
+            str(path),
+            type=field.type,
+            resource_type=field.resource_type,
+            **field.options
+        )
+        return resource.get_prep_value()
+
+
+class LocalAvatarStorage(BaseAvatarStorage):
+    """
+    Stand-in storage copying avatars below MEDIA_ROOT.
+
+    Meant for tests and offline development; the stored value is a public
+    id in the avatar folder, as Cloudinary would return it.
+    """
+
+    def save(self, path: Path, user_id: int) -> str:
+        folder = User._meta.get_field("avatar").options.get("folder", "avatars")
+        name = f"{folder}/{user_id}-{uuid.uuid4().hex}{path.suffix}"
+
+        target = Path(settings.MEDIA_ROOT) / name
+        target.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(path, target)
+
+        return name
+
+
+def get_avatar_storage() -> BaseAvatarStorage:
+    return import_string(settings.AVATAR_STORAGE)()
+
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_avatar_executor() -> ThreadPoolExecutor:
+    """Returns the process-wide pool uploading spooled avatars."""
+    global _executor
+
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=settings.AVATAR_UPLOAD_WORKERS,
+                    thread_name_prefix="avatar-upload"
+                )
+
+    return _executor
+
+
+def spool_avatar(upload: UploadedFile, user_id: int) -> Path:
+    """Copies an uploaded file to the spool directory, chunk by chunk."""
+    spool_dir = Path(settings.AVATAR_SPOOL_DIR)
+    spool_dir.mkdir(parents=True, exist_ok=True)
+
+    path = spool_dir / f"{user_id}-{uuid.uuid4().hex}{Path(upload.name).suffix.lower()}"
+    with open(path, "wb") as spool_file:
+        for chunk in upload.chunks():
+            spool_file.write(chunk)
+
+    return path
+
+
+def queue_avatar_upload(user: Any, upload: UploadedFile) -> AvatarUpload:
+    """
+    Spools 'upload' and queues it as the next avatar of 'user'.
+
+    With AVATAR_UPLOAD_WORKERS set, the upload is handed to the avatar pool
+    once the transaction commits; with 0 it waits for the
+    'process_avatar_uploads' command.
+    """
+    pending = AvatarUpload.objects.create(user=user, spool_path=str(spool_avatar(upload, user.pk)))
+
+    if settings.AVATAR_UPLOAD_WORKERS:
+        transaction.on_commit(lambda: get_avatar_executor().submit(_run_in_pool_thread, pending.pk))
+
+    return pending
+
+
+def _run_in_pool_thread(upload_id: int) -> bool:
+    """Processes an upload with the connection handling a request thread gets."""
+    close_old_connections()
+    try:
+        return process_avatar_upload(upload_id)
+    except Exception:
+        logger.exception("Avatar upload %s crashed", upload_id)
+        return False
+    finally:
+        close_old_connections()
+
+
+def claimable() -> Q:
+    """Uploads nobody works on: never claimed, or claimed by a worker that died."""
+    stale = timezone.now() - timedelta(seconds=settings.AVATAR_UPLOAD_CLAIM_TIMEOUT)
+    return Q(claimed_at__isnull=True) | Q(claimed_at__lt=stale)
+
+
+def process_avatar_upload(upload_id: int) -> bool:
+    """
+    Pushes a spooled avatar to the storage and swaps it in.
+
+    Returns:
+        bool: True when the avatar was swapped, False when the upload was
+        claimed elsewhere, superseded by a newer one or failed (it is then
+        released for a retry). A swap drops the user's older uploads, so a
+        retried or slower older upload can never replace a newer avatar.
+    """
+    if not AvatarUpload.objects.filter(claimable(), pk=upload_id).update(claimed_at=timezone.now()):
+        return False
+
+    pending = AvatarUpload.objects.get(pk=upload_id)
+    path = Path(pending.spool_path)
+
+    if AvatarUpload.objects.filter(user_id=pending.user_id, pk__gt=pending.pk).exists():
+        # A newer avatar is queued; this one would be replaced right away.
+        pending.delete()
+        path.unlink(missing_ok=True)
+        return False
+
+    try:
+        avatar = get_avatar_storage().save(path, pending.user_id)
+    except Exception:
+        logger.exception("Avatar upload %s failed", pending.pk)
+        AvatarUpload.objects.filter(pk=pending.pk).update(claimed_at=None, attempts=F("attempts") + 1)
+        return False
+
+    with transaction.atomic():
+        # A swapped upload removes every older one, so a row that is gone
+        # was superseded while this file was uploading.
+        deleted, _ = AvatarUpload.objects.filter(pk=pending.pk).delete()
+        swapped = bool(deleted) and not AvatarUpload.objects.filter(
+            user_id=pending.user_id,
+            pk__gt=pending.pk
+        ).exists()
+
+        stale_paths = []
+        if swapped:
+            User.objects.filter(pk=pending.user_id).update(avatar=avatar)
+
+            older = AvatarUpload.objects.filter(user_id=pending.user_id, pk__lt=pending.pk)
+            stale_paths = [Path(spool_path) for spool_path in older.values_list("spool_path", flat=True)]
+            older.delete()
+
+    # update() bypasses post_save, so the cached request.user is dropped here.
+    get_user_cache().delete(user_cache_key(pending.user_id))
+    for spool_path in [path, *stale_paths]:
+        spool_path.unlink(missing_ok=True)
+    return swapped
+
+
+def pending_upload_ids(limit: int) -> List[int]:
+    """Ids of the uploads a consumer may pick up, oldest first."""
+    return list(
+        AvatarUpload.objects.filter(
+            claimable(),
+            attempts__lt=settings.AVATAR_UPLOAD_MAX_ATTEMPTS
+        ).order_by("id").values_list("id", flat=True)[:limit]
+    )
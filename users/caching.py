@@ -0,0 +1,64 @@
+from typing import Any
+
+from django.conf import settings
+from django.contrib import auth
+from django.core.cache import caches
+from django.core.cache.backends.base import BaseCache
+from django.db import transaction
+from django.http import HttpRequest
+from django.utils.crypto import constant_time_compare
+
+
+def get_user_cache() -> BaseCache:
+    return caches[settings.USER_CACHE_ALIAS]
+
+
+def user_cache_key(user_id: Any) -> str:
+    return f"users:user:{user_id}"
+
+
+def get_cached_user(request: HttpRequest) -> Any:
+    """
+    Drop-in replacement for 'django.contrib.auth.get_user' backed by the cache.
+
+    A cached user is only trusted when the session auth hash stored at login
+    still matches it, so a changed password (or an entry left behind by
+    another user with a reused id) falls through to the regular database
+    lookup, which performs Django's own verification and logout.
+    """
+    session = request.session
+
+    try:
+        user_id = session[auth.SESSION_KEY]
+        backend_path = session[auth.BACKEND_SESSION_KEY]
+    except KeyError:
+        return auth.get_user(request)
+
+    cache = get_user_cache()
+    key = user_cache_key(user_id)
+
+    if backend_path in settings.AUTHENTICATION_BACKENDS:
+        user = cache.get(key)
+        if user is not None and constant_time_compare(
+            session.get(auth.HASH_SESSION_KEY, ""),
+            user.get_session_auth_hash()
+        ):
+            return user
+
+    user = auth.get_user(request)
+    if user.is_authenticated:
+        cache.set(key, user, settings.USER_CACHE_TIMEOUT)
+
+    return user
+
+
+def invalidate_cached_user(sender: Any, instance: Any, **kwargs: Any) -> None:
+    """
+    Drops the cached copy of a saved or deleted user.
+
+    The entry is removed right away and again once the transaction commits,
+    so a concurrent request cannot re-cache the row as it was before the write.
+    """
+    key = user_cache_key(instance.pk)
+    get_user_cache().delete(key)
+    transaction.on_commit(lambda: get_user_cache().delete(key))
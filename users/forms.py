@@ -1,6 +1,9 @@
 from django import forms
 from django.contrib.auth import get_user_model
 from django.contrib.auth.forms import UserCreationForm
+from django.core.files.uploadedfile import UploadedFile
+
+from users.avatars import queue_avatar_upload
 
 User = get_user_model()
 
@@ -41,6 +44,8 @@ class UserSettingsForm(forms.ModelForm):
 
     Allows users to edit their bio, discord tag, steam url and avatar.
     The email field is displayed but disabled to prevent changes via this form.
+    A new avatar is queued for a background upload instead of being uploaded
+    while the request waits (see users.avatars).
     """
 
     class Meta:
@@ -80,3 +85,26 @@ class UserSettingsForm(forms.ModelForm):
             self.fields["email"].disabled = True
             self.fields["email"].widget.attrs["class"] += " bg-light text-muted"
             self.fields["email"].help_text = "Email cannot be changed."
+
+    def save(self, commit: bool = True) -> User:
+        """
+        Saves the profile and queues a newly uploaded avatar.
+
+        The avatar column is left to the upload worker, which swaps it once
+        the file reached the storage. 'avatar_queued' tells whether a new
+        avatar is on its way.
+        """
+        avatar = self.cleaned_data.get("avatar")
+        self.avatar_queued = commit and isinstance(avatar, UploadedFile)
+
+        user = super().save(commit=False)
+        if not commit:
+            return user
+
+        user.avatar = self.initial.get("avatar")
+        user.save(update_fields=[name for name in self._meta.fields if name != "avatar"])
+
+        if self.avatar_queued:
+            queue_avatar_upload(user, avatar)
+
+        return user
@@ -0,0 +1,42 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from users.avatars import pending_upload_ids, process_avatar_upload
+
+
+class Command(BaseCommand):
+    help = 'Pushes spooled avatars to the avatar storage, in a loop or as a single pass.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=50,
+            help="Maximum number of uploads picked up per pass."
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=2.0,
+            help="Seconds to sleep after a pass that found nothing to upload."
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Run a single pass over the pending uploads and exit."
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            upload_ids = pending_upload_ids(options["batch_size"])
+            swapped = sum(process_avatar_upload(upload_id) for upload_id in upload_ids)
+
+            if upload_ids:
+                self.stdout.write(self.style.SUCCESS(f"Swapped {swapped} of {len(upload_ids)} pending avatars."))
+
+            if options["once"]:
+                return
+
+            if not upload_ids:
+                time.sleep(options["interval"])
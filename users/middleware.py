@@ -0,0 +1,18 @@
+from django.contrib.auth.middleware import AuthenticationMiddleware
+from django.http import HttpRequest
+from django.utils.functional import SimpleLazyObject
+
+from users.caching import get_cached_user
+
+
+class CachedAuthenticationMiddleware(AuthenticationMiddleware):
+    """
+    AuthenticationMiddleware that loads 'request.user' through the user cache.
+
+    Combined with cache-backed sessions, a warm request resolves the session
+    and the user without touching the database.
+    """
+
+    def process_request(self, request: HttpRequest) -> None:
+        super().process_request(request)
+        request.user = SimpleLazyObject(lambda: get_cached_user(request))
@@ -0,0 +1,29 @@
+# Generated by Django 4.2.27 on 2026-10-17 21:08
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0003_alter_user_avatar'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AvatarUpload',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('spool_path', models.CharField(max_length=255)),
+                ('claimed_at', models.DateTimeField(blank=True, help_text='Set while a worker is uploading; stale claims are retried.', null=True)),
+                ('attempts', models.PositiveSmallIntegerField(default=0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='avatar_uploads', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['id'],
+            },
+        ),
+    ]
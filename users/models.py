@@ -34,3 +34,34 @@ class User(AbstractUser):
 
     def __str__(self) -> str:
         return self.username
+
+
+class AvatarUpload(models.Model):
+    """
+    An avatar waiting to be pushed to the avatar storage.
+
+    The settings form only spools the uploaded file to local disk and
+    queues a row; a background worker uploads it and swaps 'User.avatar'
+    (see users.avatars). Rows are claimed with a conditional UPDATE, so a
+    pool thread and the 'process_avatar_uploads' command never upload the
+    same file twice, and are deleted once the avatar is swapped.
+    """
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name="avatar_uploads"
+    )
+    spool_path = models.CharField(max_length=255)
+    claimed_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text="Set while a worker is uploading; stale claims are retried."
+    )
+    attempts = models.PositiveSmallIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ["id"]
+
+    def __str__(self) -> str:
+        return f"Avatar of {self.user_id} ({self.spool_path})"
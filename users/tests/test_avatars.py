@@ -0,0 +1,184 @@
+import shutil
+import tempfile
+from datetime import timedelta
+from io import StringIO
+from pathlib import Path
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from users.avatars import LocalAvatarStorage, pending_upload_ids, process_avatar_upload, queue_avatar_upload
+from users.models import AvatarUpload
+
+User = get_user_model()
+
+# A 1x1 transparent GIF.
+GIF = (
+    b"GIF89a\x01\x00\x01\x00\x80\x00\x00\x00\x00\x00\xff\xff\xff!\xf9\x04\x01\x00\x00\x00\x00"
+    b",\x00\x00\x00\x00\x01\x00\x01\x00\x00\x02\x02D\x01\x00;"
+)
+
+
+class AvatarPipelineTests(TestCase):
+    """
+    Tests for the spooled, background avatar upload pipeline.
+    """
+
+    def setUp(self) -> None:
+        self.root = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.root, ignore_errors=True)
+
+        overrides = override_settings(
+            AVATAR_STORAGE="users.avatars.LocalAvatarStorage",
+            AVATAR_SPOOL_DIR=self.root / "spool",
+            AVATAR_UPLOAD_WORKERS=0,
+            MEDIA_ROOT=self.root / "media",
+        )
+        overrides.enable()
+        self.addCleanup(overrides.disable)
+
+        self.user = User.objects.create_user(
+            username="CoolBob",
+            email="avatar@example.com",
+            password="ComplexPass123!"
+        )
+
+    def upload(self, name: str = "me.gif") -> SimpleUploadedFile:
+        return SimpleUploadedFile(name, GIF, content_type="image/gif")
+
+    def test_settings_save_only_queues_the_avatar(self) -> None:
+        """Saving the settings spools the file and leaves the avatar to the worker."""
+        self.client.force_login(self.user)
+
+        response = self.client.post(reverse("settings-general"), {
+            "username": "CoolBob",
+            "bio": "New bio",
+            "avatar": self.upload(),
+        })
+
+        self.assertEqual(response.status_code, 302)
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.bio, "New bio")
+        self.assertIsNone(self.user.avatar)
+
+        pending = AvatarUpload.objects.get(user=self.user)
+        self.assertEqual(Path(pending.spool_path).read_bytes(), GIF)
+
+    def test_worker_swaps_the_avatar(self) -> None:
+        """Processing an upload stores the file, swaps the field and cleans up."""
+        pending = queue_avatar_upload(self.user, self.upload())
+
+        self.assertTrue(process_avatar_upload(pending.pk))
+
+        self.user.refresh_from_db()
+        public_id = self.user.avatar.public_id
+        self.assertTrue(public_id.startswith(f"avatars/{self.user.pk}-"))
+        self.assertEqual((self.root / "media" / f"{public_id}.gif").read_bytes(), GIF)
+        self.assertFalse(AvatarUpload.objects.exists())
+        self.assertFalse(Path(pending.spool_path).exists())
+
+    def test_claimed_upload_is_not_processed_twice(self) -> None:
+        """An upload claimed by another worker is skipped until the claim goes stale."""
+        pending = queue_avatar_upload(self.user, self.upload())
+        AvatarUpload.objects.filter(pk=pending.pk).update(claimed_at=timezone.now())
+
+        self.assertFalse(process_avatar_upload(pending.pk))
+
+        AvatarUpload.objects.filter(pk=pending.pk).update(claimed_at=timezone.now() - timedelta(hours=1))
+        self.assertTrue(process_avatar_upload(pending.pk))
+
+    def test_newer_upload_supersedes_older(self) -> None:
+        """Only the latest queued avatar is uploaded."""
+        older = queue_avatar_upload(self.user, self.upload("old.gif"))
+        newer = queue_avatar_upload(self.user, self.upload("new.gif"))
+
+        self.assertFalse(process_avatar_upload(older.pk))
+        self.assertFalse(Path(older.spool_path).exists())
+        self.assertTrue(process_avatar_upload(newer.pk))
+
+    def test_failed_upload_is_released_for_retry(self) -> None:
+        """A storage error releases the claim and counts the attempt."""
+        pending = queue_avatar_upload(self.user, self.upload())
+
+        with mock.patch("users.avatars.LocalAvatarStorage.save", side_effect=OSError("offline")):
+            with self.assertLogs("users.avatars", level="ERROR"):
+                self.assertFalse(process_avatar_upload(pending.pk))
+
+        pending.refresh_from_db()
+        self.assertIsNone(pending.claimed_at)
+        self.assertEqual(pending.attempts, 1)
+        self.assertTrue(Path(pending.spool_path).exists())
+
+    def test_command_processes_pending_uploads(self) -> None:
+        """'process_avatar_uploads --once' drains the queue."""
+        queue_avatar_upload(self.user, self.upload())
+        out = StringIO()
+
+        call_command("process_avatar_uploads", "--once", stdout=out)
+
+        self.assertIn("Swapped 1 of 1 pending avatars.", out.getvalue())
+        self.user.refresh_from_db()
+        self.assertIsNotNone(self.user.avatar)
+
+    def test_pool_receives_upload_after_commit(self) -> None:
+        """With workers configured, the upload is submitted to the pool on commit."""
+        executor = mock.Mock()
+
+        with override_settings(AVATAR_UPLOAD_WORKERS=2), \
+                mock.patch("users.avatars.get_avatar_executor", return_value=executor):
+            with self.captureOnCommitCallbacks(execute=True):
+                pending = queue_avatar_upload(self.user, self.upload())
+                executor.submit.assert_not_called()
+
+        executor.submit.assert_called_once()
+        self.assertEqual(executor.submit.call_args.args[1], pending.pk)
+
+    def test_retried_older_upload_does_not_replace_newer_avatar(self) -> None:
+        """An upload that failed, then got overtaken by a newer swap, is dropped instead of retried."""
+        older = queue_avatar_upload(self.user, self.upload("old.gif"))
+
+        with mock.patch("users.avatars.LocalAvatarStorage.save", side_effect=OSError("offline")):
+            with self.assertLogs("users.avatars", level="ERROR"):
+                self.assertFalse(process_avatar_upload(older.pk))
+
+        newer = queue_avatar_upload(self.user, self.upload("new.gif"))
+        self.assertTrue(process_avatar_upload(newer.pk))
+        self.user.refresh_from_db()
+        newer_avatar = self.user.avatar.public_id
+
+        self.assertEqual(pending_upload_ids(10), [])
+        self.assertFalse(process_avatar_upload(older.pk))
+        self.assertFalse(Path(older.spool_path).exists())
+
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.avatar.public_id, newer_avatar)
+
+    def test_slower_older_upload_does_not_replace_newer_avatar(self) -> None:
+        """An older upload finishing after a newer one was swapped keeps the newer avatar."""
+        older = queue_avatar_upload(self.user, self.upload("old.gif"))
+        save = LocalAvatarStorage.save
+        newer, newer_avatar = [], []
+
+        def overtaken(storage, path, user_id):
+            stored = save(storage, path, user_id)
+            if not newer:
+                # A newer avatar is queued and swapped before this one is.
+                newer.append(queue_avatar_upload(self.user, self.upload("new.gif")))
+                self.assertTrue(process_avatar_upload(newer[0].pk))
+                self.user.refresh_from_db()
+                newer_avatar.append(self.user.avatar.public_id)
+            return stored
+
+        with mock.patch.object(LocalAvatarStorage, "save", autospec=True, side_effect=overtaken):
+            self.assertFalse(process_avatar_upload(older.pk))
+
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.avatar.public_id, newer_avatar[0])
+        self.assertFalse(AvatarUpload.objects.exists())
+        self.assertFalse(Path(older.spool_path).exists())
+        self.assertFalse(Path(newer[0].spool_path).exists())
@@ -0,0 +1,69 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from users.caching import get_user_cache, user_cache_key
+
+User = get_user_model()
+
+
+class CachedAuthenticationTest(TestCase):
+    """Test suite for cache-backed sessions and request.user loading."""
+
+    def setUp(self) -> None:
+        cache.clear()
+        self.user = User.objects.create_user(
+            username="CachedBob",
+            email="cached@example.com",
+            password="ComplexPass123!"
+        )
+        self.client.login(username="CachedBob", password="ComplexPass123!")
+        self.url = reverse("games:index")
+
+    def auth_queries(self) -> list:
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["user"], self.user)
+        return [
+            query["sql"] for query in queries
+            if "django_session" in query["sql"] or "users_user" in query["sql"]
+        ]
+
+    def test_warm_request_skips_session_and_user_queries(self) -> None:
+        """Only the first request loads the user; the session is cached at login."""
+        self.assertEqual(len(self.auth_queries()), 1)
+        self.assertEqual(self.auth_queries(), [])
+
+    def test_saving_user_invalidates_cache(self) -> None:
+        """Profile changes are visible on the next request."""
+        self.auth_queries()
+
+        self.user.bio = "Support main"
+        self.user.save()
+
+        self.assertIsNone(get_user_cache().get(user_cache_key(self.user.pk)))
+        self.assertEqual(len(self.auth_queries()), 1)
+
+    def test_password_change_logs_out_other_sessions(self) -> None:
+        """A cached user is never trusted over a stale session auth hash."""
+        self.auth_queries()
+
+        self.user.set_password("AnotherPass456!")
+        self.user.save()
+
+        response = self.client.get(reverse("settings-general"))
+        self.assertEqual(response.status_code, 302)
+
+    def test_stale_entry_of_another_user_is_ignored(self) -> None:
+        """An entry whose auth hash does not match the session falls back to the database."""
+        impostor = User(pk=self.user.pk, username="Impostor", password="other-hash")
+        get_user_cache().set(user_cache_key(self.user.pk), impostor)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.context["user"].username, "CachedBob")
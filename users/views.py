@@ -45,5 +45,11 @@ class GeneralSettingsView(LoginRequiredMixin, generic.UpdateView):
         return self.request.user
 
     def form_valid(self, form: UserSettingsForm) -> HttpResponse:
-        messages.success(self.request, "Profile updated successfully!")
-        return super().form_valid(form)
+        response = super().form_valid(form)
+
+        if form.avatar_queued:
+            messages.success(self.request, "Profile updated successfully! Your new avatar will appear shortly.")
+        else:
+            messages.success(self.request, "Profile updated successfully!")
+
+        return response